@@ -24,6 +24,12 @@ DEFAULT_CONFIG_PATH = "~/.neuro"
 CONFIG_ENV_NAME = "NEUROMATION_CONFIG"
 DEFAULT_API_URL = URL("https://staging.neu.ro/api/v1")
 
+# Keep idle connections longer than the gaps between API calls
+# made by a single CLI command (e.g. job status polling)
+_KEEPALIVE_TIMEOUT = 75
+# All API calls go to a couple of hosts, resolve them once per command
+_DNS_CACHE_TTL = 300
+
 
 def _make_session(
     timeout: aiohttp.ClientTimeout, trace_configs: Optional[List[aiohttp.TraceConfig]]
@@ -38,7 +44,13 @@ async def __make_session(
 ) -> aiohttp.ClientSession:
     ssl_context = ssl.SSLContext()
     ssl_context.load_verify_locations(capath=certifi.where())
-    connector = aiohttp.TCPConnector(ssl=ssl_context)
+    connector = aiohttp.TCPConnector(
+        ssl=ssl_context,
+        keepalive_timeout=_KEEPALIVE_TIMEOUT,
+        enable_cleanup_closed=True,
+        use_dns_cache=True,
+        ttl_dns_cache=_DNS_CACHE_TTL,
+    )
     return aiohttp.ClientSession(
         timeout=timeout,
         connector=connector,
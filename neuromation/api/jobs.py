@@ -2,6 +2,7 @@ import asyncio
 import enum
 import json
 import logging
+import sys
 from contextlib import suppress
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -43,13 +44,24 @@ from .images import (
 from .parser import Parser, Volume
 from .parsing_utils import LocalImage, RemoteImage, _as_repo_str, _is_in_neuro_registry
 from .url_utils import normalize_storage_path_uri
-from .utils import NoPublicConstructor, asynccontextmanager
+from .utils import NoPublicConstructor, add_slots, asynccontextmanager
+
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover
+    # orjson is an optional speedup for decoding job descriptions, it is
+    # installed in CI so the fallback is the branch that does not run there
+    from json import loads as _json_loads
 
 
 log = logging.getLogger(__name__)
 
 INVALID_IMAGE_NAME = "INVALID-IMAGE-NAME"
 
+# Upper bound for job log chunks, a chunk is yielded as soon as data arrives
+_LOG_CHUNK_SIZE = 64 * 1024
+
 
 @dataclass(frozen=True)
 class Resources:
@@ -81,6 +93,17 @@ class JobStatus(str, enum.Enum):
     UNKNOWN = "unknown"  # invalid status code, a default value is status is not sent
 
 
+_JOB_STATUSES = {status.value: status for status in JobStatus}
+
+
+def _job_status(value: str) -> JobStatus:
+    status = _JOB_STATUSES.get(value)
+    if status is None:
+        # let the enum raise the usual ValueError for an unsupported status
+        return JobStatus(value)
+    return status
+
+
 @dataclass(frozen=True)
 class HTTPPort:
     port: int
@@ -99,6 +122,7 @@ class Container:
     tty: bool = False
 
 
+@add_slots
 @dataclass(frozen=True)
 class JobStatusHistory:
     status: JobStatus
@@ -122,6 +146,7 @@ class JobRestartPolicy(str, enum.Enum):
         return repr(self.value)
 
 
+@add_slots
 @dataclass(frozen=True)
 class JobDescription:
     id: str
@@ -197,6 +222,16 @@ class Jobs(metaclass=NoPublicConstructor):
         self._core = core
         self._config = config
         self._parse = parse
+        self._jobs_url: Optional[URL] = None
+        self._jobs_url_base: Optional[URL] = None
+
+    def _get_jobs_url(self) -> URL:
+        # Reuse the joined URL while the API URL stays the same
+        api_url = self._config.api_url
+        if self._jobs_url is None or self._jobs_url_base is not api_url:
+            self._jobs_url = api_url / "jobs"
+            self._jobs_url_base = api_url
+        return self._jobs_url
 
     async def run(
         self,
@@ -210,7 +245,7 @@ class Jobs(metaclass=NoPublicConstructor):
         restart_policy: JobRestartPolicy = JobRestartPolicy.NEVER,
         life_span: Optional[float] = None,
     ) -> JobDescription:
-        url = self._config.api_url / "jobs"
+        url = self._get_jobs_url()
         payload: Dict[str, Any] = {
             "container": _container_to_api(container, self._config),
             "is_preemptible": is_preemptible,
@@ -230,7 +265,7 @@ class Jobs(metaclass=NoPublicConstructor):
         payload["cluster_name"] = self._config.cluster_name
         auth = await self._config._api_auth()
         async with self._core.request("POST", url, json=payload, auth=auth) as resp:
-            res = await resp.json()
+            res = await resp.json(loads=_json_loads)
             return _job_description_from_api(res, self._parse)
 
     async def list(
@@ -245,7 +280,7 @@ class Jobs(metaclass=NoPublicConstructor):
         reverse: bool = False,
         limit: Optional[int] = None,
     ) -> AsyncIterator[JobDescription]:
-        url = self._config.api_url / "jobs"
+        url = self._get_jobs_url()
         headers = {"Accept": "application/x-ndjson"}
         params: MultiDict[str] = MultiDict()
         for status in statuses:
@@ -276,15 +311,15 @@ class Jobs(metaclass=NoPublicConstructor):
         ) as resp:
             if resp.headers.get("Content-Type", "").startswith("application/x-ndjson"):
                 async for line in resp.content:
-                    j = json.loads(line)
+                    j = _json_loads(line)
                     yield _job_description_from_api(j, self._parse)
             else:
-                ret = await resp.json()
+                ret = await resp.json(loads=_json_loads)
                 for j in ret["jobs"]:
                     yield _job_description_from_api(j, self._parse)
 
     async def kill(self, id: str) -> None:
-        url = self._config.api_url / "jobs" / id
+        url = self._get_jobs_url() / id
         auth = await self._config._api_auth()
         async with self._core.request("DELETE", url, auth=auth):
             # an error is raised for status >= 400
@@ -301,21 +336,21 @@ class Jobs(metaclass=NoPublicConstructor):
             timeout=timeout,
             auth=auth,
         ) as resp:
-            async for data in resp.content.iter_any():
+            async for data in resp.content.iter_chunked(_LOG_CHUNK_SIZE):
                 yield data
 
     async def status(self, id: str) -> JobDescription:
-        url = self._config.api_url / "jobs" / id
+        url = self._get_jobs_url() / id
         auth = await self._config._api_auth()
         async with self._core.request("GET", url, auth=auth) as resp:
-            ret = await resp.json()
+            ret = await resp.json(loads=_json_loads)
             return _job_description_from_api(ret, self._parse)
 
     async def tags(self) -> List[str]:
         url = self._config.api_url / "tags"
         auth = await self._config._api_auth()
         async with self._core.request("GET", url, auth=auth) as resp:
-            ret = await resp.json()
+            ret = await resp.json(loads=_json_loads)
             return ret["tags"]
 
     async def top(self, id: str) -> AsyncIterator[JobTelemetry]:
@@ -496,7 +531,7 @@ class Jobs(metaclass=NoPublicConstructor):
         url = self._config.monitoring_url / id / "exec_create"
         auth = await self._config._api_auth()
         async with self._core.request("POST", url, json=payload, auth=auth) as resp:
-            ret = await resp.json()
+            ret = await resp.json(loads=_json_loads)
             return ret["exec_id"]
 
     async def exec_resize(self, id: str, exec_id: str, *, w: int, h: int) -> None:
@@ -510,7 +545,7 @@ class Jobs(metaclass=NoPublicConstructor):
         url = self._config.monitoring_url / id / exec_id / "exec_inspect"
         auth = await self._config._api_auth()
         async with self._core.request("GET", url, auth=auth) as resp:
-            data = await resp.json()
+            data = await resp.json(loads=_json_loads)
             return ExecInspect(
                 id=data["id"],
                 running=data["running"],
@@ -607,8 +642,8 @@ def _resources_to_api(resources: Resources) -> Dict[str, Any]:
 
 def _resources_from_api(data: Dict[str, Any]) -> Resources:
     tpu_type = tpu_software_version = None
-    if "tpu" in data:
-        tpu = data["tpu"]
+    tpu = data.get("tpu")
+    if tpu is not None:
         tpu_type = tpu["type"]
         tpu_software_version = tpu["software_version"]
     return Resources(
@@ -638,14 +673,15 @@ def _container_from_api(data: Dict[str, Any], parse: Parser) -> Container:
     except ValueError:
         image = RemoteImage.new_external_image(name=INVALID_IMAGE_NAME)
 
+    http = data.get("http")
     return Container(
         image=image,
         resources=_resources_from_api(data["resources"]),
         entrypoint=data.get("entrypoint", None),
         command=data.get("command", None),
-        http=_http_port_from_api(data["http"]) if "http" in data else None,
+        http=_http_port_from_api(http) if http is not None else None,
         env=data.get("env", dict()),
-        volumes=[_volume_from_api(v) for v in data.get("volumes", [])],
+        volumes=list(map(_volume_from_api, data.get("volumes", ()))),
         tty=data.get("tty", False),
     )
 
@@ -664,7 +700,11 @@ def _container_to_api(container: Container, config: Config) -> Dict[str, Any]:
     if container.env:
         primitive["env"] = container.env
     if container.volumes:
-        primitive["volumes"] = [_volume_to_api(v, config) for v in container.volumes]
+        username = config.username
+        cluster_name = config.cluster_name
+        primitive["volumes"] = [
+            _volume_to_api(v, username, cluster_name) for v in container.volumes
+        ]
     if container.tty:
         primitive["tty"] = True
     return primitive
@@ -677,17 +717,17 @@ def _job_description_from_api(res: Dict[str, Any], parse: Parser) -> JobDescript
     name = res.get("name")
     tags = res.get("tags", ())
     description = res.get("description")
+    history_data = res["history"]
     history = JobStatusHistory(
-        status=JobStatus(res["history"].get("status", "unknown")),
-        reason=res["history"].get("reason", ""),
-        description=res["history"].get("description", ""),
-        created_at=_parse_datetime(res["history"].get("created_at")),
-        started_at=_parse_datetime(res["history"].get("started_at")),
-        finished_at=_parse_datetime(res["history"].get("finished_at")),
-        exit_code=res["history"].get("exit_code"),
+        status=_job_status(history_data.get("status", "unknown")),
+        reason=history_data.get("reason", ""),
+        description=history_data.get("description", ""),
+        created_at=_parse_datetime(history_data.get("created_at")),
+        started_at=_parse_datetime(history_data.get("started_at")),
+        finished_at=_parse_datetime(history_data.get("finished_at")),
+        exit_code=history_data.get("exit_code"),
     )
-    http_url = URL(res.get("http_url", ""))
-    http_url_named = URL(res.get("http_url_named", ""))
+    http_url = URL(res.get("http_url_named") or res.get("http_url") or "")
     ssh_server = URL(res.get("ssh_server", ""))
     internal_hostname = res.get("internal_hostname", None)
     restart_policy = JobRestartPolicy(res.get("restart_policy", JobRestartPolicy.NEVER))
@@ -696,7 +736,7 @@ def _job_description_from_api(res: Dict[str, Any], parse: Parser) -> JobDescript
         max_run_time_minutes * 60.0 if max_run_time_minutes is not None else None
     )
     return JobDescription(
-        status=JobStatus(res["status"]),
+        status=_job_status(res["status"]),
         id=res["id"],
         owner=owner,
         cluster_name=cluster_name,
@@ -706,7 +746,7 @@ def _job_description_from_api(res: Dict[str, Any], parse: Parser) -> JobDescript
         name=name,
         tags=tags,
         description=description,
-        http_url=http_url_named or http_url,
+        http_url=http_url,
         ssh_server=ssh_server,
         internal_hostname=internal_hostname,
         uri=URL(res["uri"]),
@@ -725,16 +765,13 @@ def _job_telemetry_from_api(value: Dict[str, Any]) -> JobTelemetry:
     )
 
 
-def _volume_to_api(volume: Volume, config: Config) -> Dict[str, Any]:
-    uri = normalize_storage_path_uri(
-        volume.storage_uri, config.username, config.cluster_name
-    )
-    resp: Dict[str, Any] = {
+def _volume_to_api(volume: Volume, username: str, cluster_name: str) -> Dict[str, Any]:
+    uri = normalize_storage_path_uri(volume.storage_uri, username, cluster_name)
+    return {
         "src_storage_uri": str(uri),
         "dst_path": volume.container_path,
         "read_only": bool(volume.read_only),
     }
-    return resp
 
 
 def _volume_from_api(data: Dict[str, Any]) -> Volume:
@@ -749,4 +786,11 @@ def _volume_from_api(data: Dict[str, Any]) -> Volume:
 def _parse_datetime(dt: Optional[str]) -> Optional[datetime]:
     if dt is None:
         return None
+    if sys.version_info >= (3, 7):
+        # datetime.fromisoformat() is implemented in C and is much faster
+        # but it doesn't support all ISO 8601 forms, e.g. "Z" suffix
+        try:
+            return datetime.fromisoformat(dt)
+        except ValueError:
+            pass
     return isoparse(dt)
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Optional, Tuple
 
 from yarl import URL
 
@@ -18,6 +19,20 @@ class Volume:
 class Parser(metaclass=NoPublicConstructor):
     def __init__(self, config: Config) -> None:
         self._config = config
+        self._image_parser: Optional[_ImageNameParser] = None
+        self._image_parser_key: Optional[Tuple[str, str, URL]] = None
+
+    def _get_image_parser(self) -> _ImageNameParser:
+        # The parser depends on the current cluster which can be switched
+        key = (
+            self._config.username,
+            self._config.cluster_name,
+            self._config.registry_url,
+        )
+        if self._image_parser is None or self._image_parser_key != key:
+            self._image_parser = _ImageNameParser(*key)
+            self._image_parser_key = key
+        return self._image_parser
 
     def volume(self, volume: str) -> Volume:
         parts = volume.split(":")
@@ -40,27 +55,19 @@ class Parser(metaclass=NoPublicConstructor):
         )
 
     def local_image(self, image: str) -> LocalImage:
-        parser = _ImageNameParser(
-            self._config.username, self._config.cluster_name, self._config.registry_url
-        )
+        parser = self._get_image_parser()
         return parser.parse_as_local_image(image)
 
     def remote_image(
         self, image: str, *, tag_option: TagOption = TagOption.DEFAULT
     ) -> RemoteImage:
-        parser = _ImageNameParser(
-            self._config.username, self._config.cluster_name, self._config.registry_url
-        )
+        parser = self._get_image_parser()
         return parser.parse_remote(image, tag_option=tag_option)
 
     def _local_to_remote_image(self, image: LocalImage) -> RemoteImage:
-        parser = _ImageNameParser(
-            self._config.username, self._config.cluster_name, self._config.registry_url
-        )
+        parser = self._get_image_parser()
         return parser.convert_to_neuro_image(image)
 
     def _remote_to_local_image(self, image: RemoteImage) -> LocalImage:
-        parser = _ImageNameParser(
-            self._config.username, self._config.cluster_name, self._config.registry_url
-        )
+        parser = self._get_image_parser()
         return parser.convert_to_local_image(image)
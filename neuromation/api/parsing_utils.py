@@ -215,12 +215,9 @@ class _ImageNameParser:
             url = URL(f"//{url}")
 
         if not url.scheme:
-            parts = url.path.split("/")
+            host, sep, path = url.path[1:].partition("/")
             url = URL.build(
-                scheme="image",
-                host=parts[1],
-                path="/".join([""] + parts[2:]),
-                query=url.query,
+                scheme="image", host=host, path=sep + path, query=url.query,
             )
 
         self._check_allowed_uri_elements(url)
@@ -1,4 +1,5 @@
 import asyncio
+import dataclasses
 import logging
 import sys
 from types import TracebackType
@@ -8,12 +9,14 @@ from typing import (
     Awaitable,
     Callable,
     Coroutine,
+    Dict,
     Generator,
     Generic,
     Iterator,
     Optional,
     Type,
     TypeVar,
+    cast,
 )
 
 import aiohttp
@@ -53,6 +56,55 @@ class NoPublicConstructor(type):
         return super().__call__(*args, **kwargs)
 
 
+_C = TypeVar("_C", bound=type)
+
+
+def add_slots(cls: _C) -> _C:
+    """Recreate a dataclass with __slots__ for its fields.
+
+    Backport of dataclass(slots=True), Python 3.10+.
+    """
+    field_names = tuple(f.name for f in dataclasses.fields(cls))
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = field_names + ("__weakref__",)
+    for name in field_names:
+        # defaults are stored in __init__ and in the fields, not needed here
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+
+    if cls.__dataclass_params__.frozen:  # type: ignore
+        # the generated __setattr__/__delattr__ refer to the original class
+        # in super() calls, regenerate them for the recreated one
+        def __setattr__(self: Any, name: str, value: Any) -> None:
+            if type(self) is new_cls or name in field_names:
+                raise dataclasses.FrozenInstanceError(
+                    f"cannot assign to field {name!r}"
+                )
+            super(new_cls, self).__setattr__(name, value)
+
+        def __delattr__(self: Any, name: str) -> None:
+            if type(self) is new_cls or name in field_names:
+                raise dataclasses.FrozenInstanceError(f"cannot delete field {name!r}")
+            super(new_cls, self).__delattr__(name)
+
+        cls_dict["__setattr__"] = __setattr__
+        cls_dict["__delattr__"] = __delattr__
+
+    # frozen dataclasses forbid setattr, restore slots directly on unpickling
+    def __getstate__(self: Any) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in field_names}
+
+    def __setstate__(self: Any, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    cls_dict["__getstate__"] = __getstate__
+    cls_dict["__setstate__"] = __setstate__
+    new_cls: Type[Any] = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    return cast(_C, new_cls)
+
+
 class _ContextManager(Generic[_T], Awaitable[_T], AsyncContextManager[_T]):
 
     __slots__ = ("_coro", "_ret")
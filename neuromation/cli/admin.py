@@ -1,8 +1,9 @@
 import configparser
+import functools
 import json
 import os
 import pathlib
-from typing import IO, Optional
+from typing import IO, Optional, Tuple
 
 import click
 import yaml
@@ -16,6 +17,17 @@ from .root import Root
 from .utils import argument, command, group, option, pager_maybe
 
 
+try:
+    from yaml import CSafeDumper as _SafeDumper, CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover
+    # PyYAML is built without libyaml bindings
+    from yaml import SafeDumper as _SafeDumper  # type: ignore
+    from yaml import SafeLoader as _SafeLoader  # type: ignore
+
+
+_ROLE_CHOICES = [role.value for role in _ClusterUserRoleType]
+
+
 @group()
 def admin() -> None:
     """Cluster administration commands."""
@@ -35,12 +47,12 @@ async def get_clusters(root: Root) -> None:
 
 @command()
 @argument("cluster_name", required=True, type=str)
-@argument("config", required=True, type=click.File(encoding="utf8", lazy=False))
-async def add_cluster(root: Root, cluster_name: str, config: IO[str]) -> None:
+@argument("config", required=True, type=click.File("rb", lazy=False))
+async def add_cluster(root: Root, cluster_name: str, config: IO[bytes]) -> None:
     """
     Create a new cluster and start its provisioning.
     """
-    config_dict = yaml.safe_load(config)
+    config_dict = yaml.load(config, Loader=_SafeLoader)
     await root.client._admin.add_cluster(cluster_name, config_dict)
     if not root.quiet:
         click.echo(
@@ -108,6 +120,20 @@ storage:
 """
 
 
+@functools.lru_cache(maxsize=4)
+def _read_aws_profile(
+    path: str, mtime: float, profile: str
+) -> Tuple[Optional[str], Optional[str]]:
+    # mtime is a part of the cache key only,
+    # the cached value is invalidated when the file is changed
+    parser = configparser.ConfigParser()
+    parser.read(path)
+    if profile not in parser:
+        return None, None
+    section = parser[profile]
+    return section.get("aws_access_key_id"), section.get("aws_secret_access_key")
+
+
 async def generate_aws(session: PromptSession) -> str:
     args = {}
     args["vpc_id"] = await session.prompt_async("AWS VPC ID: ")
@@ -118,15 +144,21 @@ async def generate_aws(session: PromptSession) -> str:
             os.environ.get("AWS_SHARED_CREDENTIALS_FILE", "~/.aws/credentials")
         )
         aws_config_file = aws_config_file.expanduser().absolute()
-        parser = configparser.ConfigParser()
-        parser.read(aws_config_file)
         profile = await session.prompt_async(
             "AWS profile name: ", default=os.environ.get("AWS_PROFILE", "default")
         )
+        profile_access_key_id, profile_secret_access_key = _read_aws_profile(
+            str(aws_config_file), aws_config_file.stat().st_mtime, profile
+        )
         if access_key_id is None:
-            access_key_id = parser[profile]["aws_access_key_id"]
+            access_key_id = profile_access_key_id
         if secret_access_key is None:
-            secret_access_key = parser[profile]["aws_secret_access_key"]
+            secret_access_key = profile_secret_access_key
+        if access_key_id is None or secret_access_key is None:
+            raise ValueError(
+                f"AWS credentials for profile {profile!r} "
+                f"are not found in {aws_config_file}"
+            )
     access_key_id = await session.prompt_async(
         "AWS Access Key: ", default=access_key_id
     )
@@ -171,7 +203,7 @@ async def generate_gcp(session: PromptSession) -> str:
     )
     with open(credentials_file, "rb") as fp:
         data = json.load(fp)
-    out = yaml.dump(data)
+    out = yaml.dump(data, Dumper=_SafeDumper)
     args["credentials"] = "\n" + "\n".join("  " + line for line in out.splitlines())
     return GCP_TEMPLATE.format_map(args)
 
@@ -241,7 +273,7 @@ async def get_cluster_users(root: Root, cluster_name: Optional[str]) -> None:
     required=False,
     default=_ClusterUserRoleType.USER.value,
     metavar="[ROLE]",
-    type=click.Choice(list(_ClusterUserRoleType)),
+    type=click.Choice(_ROLE_CHOICES),
 )
 async def add_cluster_user(
     root: Root, cluster_name: str, user_name: str, role: str
@@ -6,7 +6,7 @@ from typing import Generic, List, Optional, Sequence, Tuple, TypeVar, Union, cas
 import click
 from click import BadParameter
 
-from neuromation.api import LocalImage, RemoteImage, TagOption
+from neuromation.api import Client, LocalImage, RemoteImage, TagOption
 
 from .parse_utils import JobColumnInfo, parse_columns, to_megabytes
 from .root import Root
@@ -53,15 +53,22 @@ class AsyncType(click.ParamType, Generic[_T], abc.ABC):
         pass
 
 
+def _get_client(ctx: Optional[click.Context]) -> Client:
+    assert ctx is not None
+    root = cast(Root, ctx.obj)
+    if root._client is not None:
+        # Don't spin the event loop for every parsed argument
+        return root._client
+    return root.run(root.init_client())
+
+
 class LocalImageType(click.ParamType):
     name = "local_image"
 
     def convert(
         self, value: str, param: Optional[click.Parameter], ctx: Optional[click.Context]
     ) -> LocalImage:
-        assert ctx is not None
-        root = cast(Root, ctx.obj)
-        client = root.run(root.init_client())
+        client = _get_client(ctx)
         return client.parse.local_image(value)
 
 
@@ -71,9 +78,7 @@ class ImageType(click.ParamType):
     def convert(
         self, value: str, param: Optional[click.Parameter], ctx: Optional[click.Context]
     ) -> RemoteImage:
-        assert ctx is not None
-        root = cast(Root, ctx.obj)
-        client = root.run(root.init_client())
+        client = _get_client(ctx)
         return client.parse.remote_image(value)
 
 
@@ -83,9 +88,7 @@ class RemoteTaglessImageType(click.ParamType):
     def convert(
         self, value: str, param: Optional[click.Parameter], ctx: Optional[click.Context]
     ) -> RemoteImage:
-        assert ctx is not None
-        root = cast(Root, ctx.obj)
-        client = root.run(root.init_client())
+        client = _get_client(ctx)
         return client.parse.remote_image(value, tag_option=TagOption.DENY)
 
 
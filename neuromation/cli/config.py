@@ -20,6 +20,20 @@ from .root import Root
 from .utils import argument, command, group, option, pager_maybe
 
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    # orjson is an optional speedup installed with the "orjson" extra
+    orjson = None  # type: ignore
+
+
+def _dump_docker_config(payload: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    # orjson writes raw UTF-8, keep the fallback output byte-identical
+    return json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
+
+
 @group()
 def config() -> None:
     """Client configuration."""
@@ -196,8 +210,7 @@ async def docker(root: Root, docker_config: str) -> None:
 
     registry = URL(root.client.config.registry_url).host
     payload["credHelpers"][registry] = "neuro"
-    with json_path.open("w", encoding="utf-8") as file2:
-        json.dump(payload, file2, indent=2)
+    json_path.write_bytes(_dump_docker_config(payload))
 
     json_path_str = f"{json_path}"
     registry_str = click.style(f"{registry}", bold=True)
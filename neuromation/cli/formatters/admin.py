@@ -1,5 +1,5 @@
 import operator
-from typing import Iterable, Iterator, List
+from typing import Iterable, Iterator
 
 import click
 from click import style
@@ -11,7 +11,7 @@ from .ftable import Align, table
 
 
 class ClusterUserFormatter:
-    def __call__(self, clusters_users: Iterable[_ClusterUser]) -> List[str]:
+    def __call__(self, clusters_users: Iterable[_ClusterUser]) -> Iterator[str]:
         headers = (click.style("Name", bold=True), click.style("Role", bold=True))
         rows = []
 
@@ -20,46 +20,38 @@ class ClusterUserFormatter:
         rows.sort(key=operator.itemgetter(0))
 
         rows.insert(0, headers)
-        return list(table(rows=rows))
+        return table(rows=rows)
 
 
 class ClustersFormatter:
-    def __call__(self, clusters: Iterable[_Cluster]) -> List[str]:
-        out = []
+    def __call__(self, clusters: Iterable[_Cluster]) -> Iterator[str]:
         for cluster in clusters:
             prefix = "  "
-            out.append(style(f"{cluster.name}:", bold=True))
-            out.append(
-                prefix + style("Status: ", bold=True) + cluster.status.capitalize()
-            )
+            yield style(f"{cluster.name}:", bold=True)
+            yield prefix + style("Status: ", bold=True) + cluster.status.capitalize()
             if cluster.cloud_provider:
                 cloud_provider = cluster.cloud_provider
                 if cloud_provider.type != "on_prem":
-                    out.append(
-                        prefix + style("Cloud: ", bold=True) + cloud_provider.type
-                    )
+                    yield prefix + style("Cloud: ", bold=True) + cloud_provider.type
                 if cloud_provider.region:
-                    out.append(
-                        prefix + style("Region: ", bold=True) + cloud_provider.region
-                    )
+                    yield prefix + style("Region: ", bold=True) + cloud_provider.region
                 if cloud_provider.zones:
-                    out.append(
+                    yield (
                         prefix
                         + style("Zones: ", bold=True)
                         + ", ".join(cloud_provider.zones)
                     )
                 if cloud_provider.node_pools:
-                    out.append(prefix + style("Node pools:", bold=True))
-                    out.extend(
-                        _format_node_pools(cloud_provider.node_pools, prefix + "  ")
+                    yield prefix + style("Node pools:", bold=True)
+                    yield from _format_node_pools(
+                        cloud_provider.node_pools, prefix + "  "
                     )
                 if cloud_provider.storage:
-                    out.append(
+                    yield (
                         prefix
                         + style("Storage: ", bold=True)
                         + cloud_provider.storage.description
                     )
-        return out
 
 
 def _format_node_pools(node_pools: Iterable[_NodePool], prefix: str) -> Iterator[str]:
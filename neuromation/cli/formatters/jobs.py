@@ -1,6 +1,5 @@
 import abc
 import datetime
-import itertools
 import sys
 import time
 from dataclasses import dataclass
@@ -34,17 +33,41 @@ COLORS = {
 
 
 if sys.platform == "win32":
-    SPINNER = itertools.cycle(r"-\|/")
+    SPINNER = r"-\|/"
 else:
-    SPINNER = itertools.cycle("◢◣◤◥")
+    SPINNER = "◢◣◤◥"
+
+
+class _SpinnerMixin:
+    _spinner_tick = 0
+
+    def _next_spinner(self) -> str:
+        char = SPINNER[self._spinner_tick % len(SPINNER)]
+        self._spinner_tick += 1
+        return char
 
 
 def bold(text: str) -> str:
     return style(text, bold=True)
 
 
+_STYLED_STATUSES = {
+    status: style(status.value, fg=COLORS.get(status, "reset")) for status in JobStatus
+}
+
+_OK_MARK = style("√ ", fg="green")
+_PENDING_MARK = style("- ", fg="yellow")
+_FAILED_MARK = style("× ", fg="red")
+_WAIT_MARK = style("-", fg="yellow")
+_STOPPED_MSG = style("√", fg="green") + " Stopped"
+
+
 def format_job_status(status: JobStatus) -> str:
-    return style(status.value, fg=COLORS.get(status, "reset"))
+    return _STYLED_STATUSES[status]
+
+
+def _now() -> datetime.datetime:
+    return datetime.datetime.now(datetime.timezone.utc)
 
 
 def format_timedelta(delta: datetime.timedelta) -> str:
@@ -71,6 +94,7 @@ class JobStatusFormatter:
     def __init__(self, uri_formatter: URIFormatter) -> None:
         self._format_uri = uri_formatter
         self._format_image = image_formatter(uri_formatter=uri_formatter)
+        self._format_resources = ResourcesFormatter()
 
     def __call__(self, job_status: JobDescription) -> str:
         assert job_status.history is not None
@@ -101,8 +125,7 @@ class JobStatusFormatter:
             add("Entrypoint", job_status.container.entrypoint)
         if job_status.container.command:
             add("Command", job_status.container.command)
-        resource_formatter = ResourcesFormatter()
-        lines.append(resource_formatter(job_status.container.resources))
+        lines.append(self._format_resources(job_status.container.resources))
         if job_status.is_preemptible:
             add("Preemptible", "True")
         if job_status.restart_policy != JobRestartPolicy.NEVER:
@@ -169,21 +192,19 @@ class JobTelemetryFormatter:
             "gpu": 15,
             "gpu_memory": 15,
         }
+        self._row_format = "\t".join(
+            f"{{:<{width}}}" for width in self.col_len.values()
+        )
+        self._header = self._row_format.format(
+            "TIMESTAMP", "CPU", "MEMORY (MB)", "GPU (%)", "GPU_MEMORY (MB)"
+        )
 
     def _format_timestamp(self, timestamp: float) -> str:
         # NOTE: ctime returns time wrt timezone
         return str(time.ctime(timestamp))
 
     def header(self) -> str:
-        return "\t".join(
-            [
-                "TIMESTAMP".ljust(self.col_len["timestamp"]),
-                "CPU".ljust(self.col_len["cpu"]),
-                "MEMORY (MB)".ljust(self.col_len["memory"]),
-                "GPU (%)".ljust(self.col_len["gpu"]),
-                "GPU_MEMORY (MB)".ljust(self.col_len["gpu_memory"]),
-            ]
-        )
+        return self._header
 
     def __call__(self, info: JobTelemetry) -> str:
         timestamp = self._format_timestamp(info.timestamp)
@@ -191,15 +212,7 @@ class JobTelemetryFormatter:
         mem = f"{info.memory:.3f}"
         gpu = f"{info.gpu_duty_cycle}" if info.gpu_duty_cycle else "0"
         gpu_mem = f"{info.gpu_memory:.3f}" if info.gpu_memory else "0"
-        return "\t".join(
-            [
-                timestamp.ljust(self.col_len["timestamp"]),
-                cpu.ljust(self.col_len["cpu"]),
-                mem.ljust(self.col_len["memory"]),
-                gpu.ljust(self.col_len["gpu"]),
-                gpu_mem.ljust(self.col_len["gpu_memory"]),
-            ]
-        )
+        return self._row_format.format(timestamp, cpu, mem, gpu, gpu_mem)
 
 
 class BaseJobsFormatter:
@@ -241,7 +254,7 @@ class TabularJobRow:
             when = job.history.finished_at
         assert when is not None
         assert when.tzinfo is not None
-        delta = datetime.datetime.now(datetime.timezone.utc) - when
+        delta = _now() - when
         if delta < datetime.timedelta(days=1):
             when_humanized = humanize.naturaltime(delta)
         else:
@@ -275,20 +288,25 @@ class TabularJobsFormatter(BaseJobsFormatter):
         self._username = username
         self._columns = columns
         self._image_formatter = image_formatter
+        self._titles = [column.title for column in columns]
+        self._widths = [column.width for column in columns]
+        self._aligns = [column.align for column in columns]
 
     def __call__(self, jobs: Iterable[JobDescription]) -> Iterator[str]:
-        rows: List[List[str]] = []
-        rows.append([column.title for column in self._columns])
+        columns = self._columns
+        username = self._username
+        image_formatter = self._image_formatter
+        rows: List[List[str]] = [self._titles]
         for job in jobs:
             rows.append(
                 TabularJobRow.from_job(
-                    job, self._username, image_formatter=self._image_formatter
-                ).to_list(self._columns)
+                    job, username, image_formatter=image_formatter
+                ).to_list(columns)
             )
         for line in table(
             rows,
-            widths=[column.width for column in self._columns],
-            aligns=[column.align for column in self._columns],
+            widths=self._widths,
+            aligns=self._aligns,
             max_width=self.width if self.width else None,
         ):
             yield line
@@ -296,10 +314,10 @@ class TabularJobsFormatter(BaseJobsFormatter):
 
 class ResourcesFormatter:
     def __call__(self, resources: Resources) -> str:
-        lines = []
+        lines = [f"{bold('Resources')}:"]
 
         def add(descr: str, value: str) -> None:
-            lines.append(f"{bold(descr)}: {value}")
+            lines.append(f"  {bold(descr)}: {value}")
 
         add("Memory", format_size(resources.memory_mb * 1024 ** 2))
         add("CPU", f"{resources.cpu:0.1f}")
@@ -316,8 +334,7 @@ class ResourcesFormatter:
         if additional:
             add("Additional", ",".join(additional))
 
-        indent = "  "
-        return f"{bold('Resources')}:\n" + indent + f"\n{indent}".join(lines)
+        return "\n".join(lines)
 
 
 class JobStartProgress:
@@ -355,23 +372,18 @@ class JobStartProgress:
         return ""
 
 
-class DetailedJobStartProgress(JobStartProgress):
+class DetailedJobStartProgress(_SpinnerMixin, JobStartProgress):
     def __init__(self, color: bool):
         self._time = self.time_factory()
         self._color = color
         self._prev = ""
-        self._spinner = SPINNER
         self._printer = TTYPrinter()
         self._lineno = 0
 
     def begin(self, job: JobDescription) -> None:
-        self._printer.print(
-            style("√ ", fg="green") + style("Job ID", bold=True) + f": {job.id} "
-        )
+        self._printer.print(_OK_MARK + bold("Job ID") + f": {job.id} ")
         if job.name:
-            self._printer.print(
-                style("√ ", fg="green") + style("Name", bold=True) + f": {job.name}"
-            )
+            self._printer.print(_OK_MARK + bold("Name") + f": {job.name}")
 
     def step(self, job: JobDescription) -> None:
         new_time = self.time_factory()
@@ -385,24 +397,29 @@ class DetailedJobStartProgress(JobStartProgress):
             msg += " " + description
 
         if job.status == JobStatus.PENDING:
-            msg = style("- ", fg="yellow") + msg
+            msg = _PENDING_MARK + msg
         elif job.status == JobStatus.FAILED:
-            msg = style("× ", fg="red") + msg
+            msg = _FAILED_MARK + msg
         else:
             # RUNNING or SUCCEDED
-            msg = style("√ ", fg="green") + msg
+            msg = _OK_MARK + msg
 
         if not self._color:
             msg = unstyle(msg)
         if msg != self._prev:
             if self._prev:
-                self._printer.print(self._prev, lineno=self._lineno)
+                # Redraw the previous status without the spinner
+                # and add the new one in a single write
+                lineno = self._lineno
+                self._lineno = self._printer.total_lines
+                self._printer.print(f"{self._prev}\n{msg}", lineno=lineno)
+            else:
+                self._lineno = self._printer.total_lines
+                self._printer.print(msg)
             self._prev = msg
-            self._lineno = self._printer.total_lines
-            self._printer.print(msg)
         else:
             self._printer.print(
-                f"{msg} {next(self._spinner)} [{dt:.1f} sec]", lineno=self._lineno
+                f"{msg} {self._next_spinner()} [{dt:.1f} sec]", lineno=self._lineno
             )
 
     def end(self, job: JobDescription) -> None:
@@ -411,15 +428,11 @@ class DetailedJobStartProgress(JobStartProgress):
         if job.status != JobStatus.FAILED:
             http_url = job.http_url
             if http_url:
-                out.append(
-                    style("√ ", fg="green")
-                    + style("Http URL", bold=True)
-                    + f": {http_url}"
-                )
+                out.append(_OK_MARK + bold("Http URL") + f": {http_url}")
             if job.life_span:
                 limit = humanize.naturaldelta(datetime.timedelta(seconds=job.life_span))
                 out.append(
-                    style("√ ", fg="green")
+                    _OK_MARK
                     + style(f"The job will die in {limit}. ", fg="yellow",)
                     + "See --life-span option documentation for details.",
                 )
@@ -496,11 +509,10 @@ class JobStopProgress:
         pass
 
 
-class DetailedJobStopProgress(JobStopProgress):
+class DetailedJobStopProgress(_SpinnerMixin, JobStopProgress):
     def __init__(self, color: bool):
         super().__init__()
         self._color = color
-        self._spinner = SPINNER
         self._printer = TTYPrinter()
         self._lineno = 0
 
@@ -529,12 +541,9 @@ class DetailedJobStopProgress(JobStopProgress):
         dt = new_time - self._time
 
         if job.status == JobStatus.RUNNING:
-            msg = (
-                style("-", fg="yellow")
-                + f" Wait for stop {next(self._spinner)} [{dt:.1f} sec]"
-            )
+            msg = _WAIT_MARK + f" Wait for stop {self._next_spinner()} [{dt:.1f} sec]"
         else:
-            msg = style("√", fg="green") + " Stopped"
+            msg = _STOPPED_MSG
 
         if not self._color:
             msg = unstyle(msg)
@@ -610,11 +619,10 @@ class ExecStopProgress:
         pass
 
 
-class DetailedExecStopProgress(ExecStopProgress):
+class DetailedExecStopProgress(_SpinnerMixin, ExecStopProgress):
     def __init__(self, color: bool):
         super().__init__()
         self._color = color
-        self._spinner = SPINNER
         self._printer = TTYPrinter()
         self._lineno = 0
 
@@ -624,11 +632,10 @@ class DetailedExecStopProgress(ExecStopProgress):
 
         if running:
             msg = (
-                style("-", fg="yellow")
-                + f"Wait for stopping {next(self._spinner)} [{dt:.1f} sec]"
+                _WAIT_MARK + f"Wait for stopping {self._next_spinner()} [{dt:.1f} sec]"
             )
         else:
-            msg = style("√", fg="green") + " Stopped"
+            msg = _STOPPED_MSG
 
         self._printer.print(
             msg, lineno=self._lineno,
@@ -1,15 +1,17 @@
 import abc
 import contextlib
 import enum
+import functools
 import operator
 import os
+import re
 import sys
 import time
 from dataclasses import dataclass
-from fnmatch import fnmatch
+from fnmatch import translate
 from math import ceil
 from time import monotonic
-from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Pattern, Sequence, Tuple, Union
 
 import click
 from click import style, unstyle
@@ -82,15 +84,81 @@ class GnuIndicators(str, enum.Enum):
     CLR_TO_EOL = "cl"
 
 
-class ParseState(enum.Enum):
-    PS_START = enum.auto()
-    PS_LEFT = enum.auto()
-    PS_ESCAPED = enum.auto()
-    PS_ESCAPED_END = enum.auto()
-    PS_RIGHT = enum.auto()
-    PS_OCTAL = enum.auto()
-    PS_HEX = enum.auto()
-    PS_CARRET = enum.auto()
+# An escape sequence in LS_COLORS: a backslash or caret plus the character
+# after it.  Octal and hex digits never contain ":" or "=", so this is enough
+# to find the separators without decoding the escapes
+_GNU_ESCAPE = r"\\.?|\^.?"
+
+# One "left=right" entry; entries without "=" are ignored like GNU ls does
+_GNU_ENTRY_RE = re.compile(
+    rf":*((?:{_GNU_ESCAPE}|[^\\^=])*)(?:=((?:{_GNU_ESCAPE}|[^\\^:])*):?)?", re.DOTALL
+)
+
+_GNU_ESCAPE_START_RE = re.compile(r"[\\^]")
+
+_GNU_DIGITS = "0123456789abcdef"
+
+_GNU_SIMPLE_ESCAPES = {
+    "a": "\a",
+    "b": "\b",
+    "e": chr(27),
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+    "v": "\v",
+    "?": chr(127),
+    "_": " ",
+}
+
+
+def _gnu_parse_number(value: str, pos: int, base: int) -> Tuple[int, int]:
+    # Digits are consumed until the value exceeds one digit, so apart from
+    # leading zeros at most two of them are read; no backtracking is needed
+    num = 0
+    end = len(value)
+    while pos < end and num < base:
+        digit = _GNU_DIGITS.find(value[pos].lower())
+        if not 0 <= digit < base:
+            break
+        num = num * base + digit
+        pos += 1
+    return num, pos
+
+
+def _gnu_unescape(value: str) -> Optional[str]:
+    # Returns None for a malformed escape, the caller reports the error
+    if "\\" not in value and "^" not in value:
+        return value
+    parts: List[str] = []
+    pos = 0
+    while True:
+        match = _GNU_ESCAPE_START_RE.search(value, pos)
+        if match is None:
+            parts.append(value[pos:])
+            return "".join(parts)
+        parts.append(value[pos : match.start()])
+        pos = match.end()
+        char = value[pos : pos + 1]
+        if match.group() == "^":
+            if "@" <= char <= "~":
+                parts.append(chr(ord(char) & 0o37))
+            elif char == "?":
+                parts.append(chr(127))
+            else:
+                return None
+            pos += 1
+        elif char and char in "01234567":
+            num, pos = _gnu_parse_number(value, pos, 8)
+            parts.append(chr(num))
+        elif char and char in "xX":
+            num, pos = _gnu_parse_number(value, pos + 1, 16)
+            parts.append(chr(num))
+        elif char == chr(0):  # pragma: no cover
+            return None
+        else:
+            parts.append(_GNU_SIMPLE_ESCAPES.get(char, char))
+            pos += 1
 
 
 class BasePainter(abc.ABC):
@@ -116,6 +184,7 @@ class GnuPainter(BasePainter):
     def __init__(self, ls_colors: str, *, underline: bool = False):
         self._defaults()
         self._parse_ls_colors(ls_colors)
+        self._compile_ext_patterns()
         self._underline = underline
 
     def _defaults(self) -> None:
@@ -148,192 +217,48 @@ class GnuPainter(BasePainter):
         self.color_ext_type: Dict[str, str] = {}
 
     def _parse_ls_colors(self, ls_colors: str) -> None:
-        def process(left: str, right: str) -> None:
+        pos = 0
+        while pos < len(ls_colors):
+            match = _GNU_ENTRY_RE.match(ls_colors, pos)
+            assert match is not None
+            pos = match.end()
+            left = _gnu_unescape(match.group(1))
+            if left is None:
+                raise ValueError("Cannot parse coloring scheme")
+            if match.group(2) is None:
+                continue
+            right = _gnu_unescape(match.group(2))
+            if right is None:
+                raise ValueError("Cannot parse coloring scheme")
+            if not right:
+                continue
             try:
                 self.color_indicator[GnuIndicators(left)] = right
             except ValueError:
                 self.color_ext_type[left] = right
 
-        pos = 0
-        left = right = escaped = ""
-        num = 0
-        state = ParseState.PS_START
-        stack: List[ParseState] = []
-        while pos < len(ls_colors):
-            char = ls_colors[pos]
-            if state == ParseState.PS_START:
-                if char == ":":  # ignore colon
-                    pos += 1
-                else:
-                    left = ""
-                    state = ParseState.PS_LEFT
-            elif state == ParseState.PS_OCTAL:
-                if char in ["0", "1", "2", "3", "4", "5", "6", "7"]:
-                    num = num * 8 + ord(char) - ord("0")
-                    if num > 7:
-                        state = ParseState.PS_ESCAPED_END
-                        escaped = chr(num)
-                    pos += 1
-                else:
-                    state = ParseState.PS_ESCAPED_END
-                    escaped = chr(num)
-            elif state == ParseState.PS_HEX:
-                if char in ["0", "1", "2", "3", "4", "5", "6", "7", "8", "9"]:
-                    num = num * 16 + ord(char) - ord("0")
-                    if num > 15:
-                        state = ParseState.PS_ESCAPED_END
-                        escaped = chr(num)
-                    pos += 1
-                elif char.upper() in ["A", "B", "C", "D", "E", "F"]:
-                    num = num * 16 + 10 + ord(char.upper()) - ord("A")
-                    if num > 15:
-                        state = ParseState.PS_ESCAPED_END
-                        escaped = chr(num)
-                    pos += 1
-                else:
-                    state = ParseState.PS_ESCAPED_END
-                    escaped = chr(num)
-
-            elif state == ParseState.PS_ESCAPED_END:
-                stack.pop()
-                state = stack.pop()
-                if state == ParseState.PS_LEFT:
-                    left += escaped
-                else:
-                    right += escaped
-                escaped = ""
-            elif state == ParseState.PS_ESCAPED:
-                if char in ["0", "1", "2", "3", "4", "5", "6", "7"]:
-                    stack.append(state)
-                    state = ParseState.PS_OCTAL
-                    num = 0
-                elif char.upper() == "X":
-                    stack.append(state)
-                    state = ParseState.PS_HEX
-                    num = 0
-                    pos += 1
-
-                elif char == "a":
-                    escaped = "\a"
-                    stack.append(state)
-                    state = ParseState.PS_ESCAPED_END
-                    pos += 1
-                elif char == "b":
-                    escaped = "\b"
-                    stack.append(state)
-                    state = ParseState.PS_ESCAPED_END
-                    pos += 1
-                elif char == "e":
-                    escaped = chr(27)
-                    stack.append(state)
-                    state = ParseState.PS_ESCAPED_END
-                    pos += 1
-                elif char == "f":
-                    escaped = "\f"
-                    stack.append(state)
-                    state = ParseState.PS_ESCAPED_END
-                    pos += 1
-                elif char == "n":
-                    escaped = "\n"
-                    stack.append(state)
-                    state = ParseState.PS_ESCAPED_END
-                    pos += 1
-                elif char == "r":
-                    escaped = "\r"
-                    stack.append(state)
-                    state = ParseState.PS_ESCAPED_END
-                    pos += 1
-                elif char == "t":
-                    escaped = "\t"
-                    stack.append(state)
-                    state = ParseState.PS_ESCAPED_END
-                    pos += 1
-                elif char == "v":
-                    escaped = "\v"
-                    stack.append(state)
-                    state = ParseState.PS_ESCAPED_END
-                    pos += 1
-                elif char == "?":
-                    escaped = chr(127)
-                    stack.append(state)
-                    state = ParseState.PS_ESCAPED_END
-                    pos += 1
-                elif char == "_":
-                    escaped = " "
-                    stack.append(state)
-                    state = ParseState.PS_ESCAPED_END
-                    pos += 1
-                elif char == chr(0):  # pragma: no cover
-                    raise EnvironmentError("Cannot parse coloring scheme")
-                else:
-                    escaped = char
-                    stack.append(state)
-                    state = ParseState.PS_ESCAPED_END
-                    pos += 1
-            elif state == ParseState.PS_CARRET:
-                if "@" <= char <= "~":
-                    escaped = chr(ord(char) & 0o37)
-                elif char == "?":
-                    escaped = chr(127)
-                else:
-                    raise EnvironmentError("Cannot parse coloring scheme")
-                stack.append(state)
-                state = ParseState.PS_ESCAPED_END
-                pos += 1
-
-            elif state == ParseState.PS_LEFT:
-                if char == "\\":
-                    stack.append(state)
-                    state = ParseState.PS_ESCAPED
-                    pos += 1
-                    escaped = ""
-                elif char == "=":
-                    right = ""
-                    state = ParseState.PS_RIGHT
-                    pos += 1
-                elif char == "^":
-                    stack.append(state)
-                    state = ParseState.PS_CARRET
-                    pos += 1
-                    escaped = ""
-                else:
-                    left += char
-                    pos = pos + 1
-            elif state == ParseState.PS_RIGHT:
-                if char == "\\":
-                    stack.append(state)
-                    state = ParseState.PS_ESCAPED
-                    pos += 1
-                    escaped = ""
-                elif char == ":":
-                    if right:
-                        process(left, right)
-                    state = ParseState.PS_START
-                    pos += 1
-                elif char == "^":
-                    stack.append(state)
-                    state = ParseState.PS_CARRET
-                    pos += 1
-                    escaped = ""
-                else:
-                    right += char
-                    pos += 1
-
-        if state == ParseState.PS_CARRET:
-            raise EnvironmentError("Cannot parse coloring scheme")
-        if state in [ParseState.PS_HEX, ParseState.PS_OCTAL]:
-            escaped = chr(num)
-            state = stack.pop()
-        if state == ParseState.PS_ESCAPED:
-            stack.append(ParseState.PS_ESCAPED)
-            state = ParseState.PS_ESCAPED_END
-        if state == ParseState.PS_ESCAPED_END:
-            stack.pop()
-            state = stack.pop()
-            if state == ParseState.PS_RIGHT:  # pragma no branch
-                right += escaped
-        if state == ParseState.PS_RIGHT and len(right):
-            process(left, right)
+    def _compile_ext_patterns(self) -> None:
+        # fnmatch() normalizes and translates a pattern on every call while
+        # paint() runs once per listed file, so patterns are prepared here.
+        # Consecutive "*suffix" patterns are grouped to be checked by a single
+        # str.endswith() call, the first matching pattern still wins.
+        self._ext_patterns: List[
+            Tuple[Union[Tuple[str, ...], Pattern[str]], Tuple[str, ...]]
+        ] = []
+        suffixes: List[str] = []
+        values: List[str] = []
+        for pattern, value in self.color_ext_type.items():
+            pattern = os.path.normcase(pattern)
+            if pattern.startswith("*") and not any(c in pattern[1:] for c in "*?["):
+                suffixes.append(pattern[1:])
+                values.append(value)
+                continue
+            if suffixes:
+                self._ext_patterns.append((tuple(suffixes), tuple(values)))
+                suffixes, values = [], []
+            self._ext_patterns.append((re.compile(translate(pattern)), (value,)))
+        if suffixes:
+            self._ext_patterns.append((tuple(suffixes), tuple(values)))
 
     def paint(self, label: str, type: FileStatusType) -> str:
         mapping = {
@@ -344,9 +269,17 @@ class GnuPainter(BasePainter):
         if not color:
             color = self.color_indicator[GnuIndicators.NORM]
         if type == FileStatusType.FILE:
-            for pattern, value in self.color_ext_type.items():
-                if fnmatch(label, pattern):
-                    color = value
+            name = os.path.normcase(label)
+            for matcher, values in self._ext_patterns:
+                if isinstance(matcher, tuple):
+                    if name.endswith(matcher):
+                        for suffix, value in zip(matcher, values):
+                            if name.endswith(suffix):
+                                color = value
+                                break
+                        break
+                elif matcher.match(name):
+                    color = values[0]
                     break
         if color:
             if self._underline:
@@ -387,18 +320,22 @@ class BSDAttributes(enum.Enum):
     DIRECTORY_WRITABLE_OTHERS_WITHOUT_STICKY = 11
 
 
+# LSCOLORS is a fixed sequence of foreground/background pairs, one for each
+# BSDAttributes member in declaration order
+_BSD_SLICES = tuple((i, i + 2) for i in range(0, len(BSDAttributes) * 2, 2))
+
+
 class BSDPainter(BasePainter):
     def __init__(self, lscolors: str, *, underline: bool = False):
         self._underline = underline
         self._parse_lscolors(lscolors)
 
     def _parse_lscolors(self, lscolors: str) -> None:
-        parts = chunks(lscolors, 2)
-        self._colors: Dict[BSDAttributes, str] = {}
-        num = 0
-        for attr in BSDAttributes:
-            self._colors[attr] = parts[num]
-            num += 1
+        if len(lscolors) < len(_BSD_SLICES) * 2:
+            raise ValueError("Cannot parse coloring scheme")
+        self._colors: Dict[BSDAttributes, str] = dict(
+            zip(BSDAttributes, (lscolors[start:end] for start, end in _BSD_SLICES))
+        )
 
     def paint(self, label: str, type: FileStatusType) -> str:
         color = ""
@@ -434,14 +371,30 @@ class BSDPainter(BasePainter):
         return label
 
 
-def get_painter(color: bool, *, quote: bool = False) -> BasePainter:
+def get_painter(
+    color: bool,
+    *,
+    quote: bool = False,
+    ls_colors: Optional[str] = None,
+    lscolors: Optional[str] = None,
+) -> BasePainter:
     if color:
-        ls_colors = os.getenv("LS_COLORS")
-        if ls_colors:
-            return GnuPainter(ls_colors, underline=quote)
-        lscolors = os.getenv("LSCOLORS")
-        if lscolors:
-            return BSDPainter(lscolors, underline=quote)
+        if ls_colors is None:
+            ls_colors = os.getenv("LS_COLORS")
+        if lscolors is None:
+            lscolors = os.getenv("LSCOLORS")
+        return _get_painter(quote, ls_colors or "", lscolors or "")
+    return _get_painter(quote, "", "")
+
+
+@functools.lru_cache(maxsize=32)
+def _get_painter(quote: bool, ls_colors: str, lscolors: str) -> BasePainter:
+    # Painters are not mutated after construction, so parsed color schemes
+    # are shared between all formatters created with the same settings
+    if ls_colors:
+        return GnuPainter(ls_colors, underline=quote)
+    if lscolors:
+        return BSDPainter(lscolors, underline=quote)
     if quote:
         return QuotedPainter()
     else:
@@ -523,18 +476,25 @@ class VerticalColumnsFilesFormatter(BaseFilesFormatter):
         # let`s check how many columns we can use
         test_count = 1
         while True:
-            test_columns = chunks(widths, ceil(len(items) / test_count))
-            test_columns_widths = [max(column) for column in test_columns]
-            test_total_width = sum(test_columns_widths) + 2 * (len(test_columns) - 1)
+            height = ceil(len(items) / test_count)
+            test_columns_widths = [
+                max(widths[start : start + height])
+                for start in range(0, len(widths), height)
+            ]
+            test_total_width = sum(test_columns_widths) + 2 * (
+                len(test_columns_widths) - 1
+            )
             if test_count == 1 or test_total_width <= self.width:
                 count = test_count
                 columns_widths = test_columns_widths
                 if test_total_width == self.width:
                     break
 
-            if test_total_width >= self.width or len(test_columns) == len(items):
+            if test_total_width >= self.width or height == 1:
                 break
-            test_count = test_count + 1
+            # column counts sharing the same height produce the same layout,
+            # skip straight to the first count that makes columns shorter
+            test_count = ceil(len(items) / (height - 1))
 
         rows = transpose(chunks(items, ceil(len(items) / count)))
         for row in rows:
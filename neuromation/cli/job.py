@@ -73,6 +73,7 @@ from .utils import (
     option,
     pager_maybe,
     resolve_job,
+    resolve_jobs,
     volume_to_verbose_str,
 )
 
@@ -789,11 +790,13 @@ async def kill(root: Root, jobs: Sequence[str]) -> None:
     Kill job(s).
     """
     errors = []
-    for job in jobs:
-        job_resolved = await resolve_job(
-            job, client=root.client, status={JobStatus.PENDING, JobStatus.RUNNING}
-        )
+    resolved_jobs = await resolve_jobs(
+        jobs, client=root.client, status={JobStatus.PENDING, JobStatus.RUNNING}
+    )
+    for job, job_resolved in zip(jobs, resolved_jobs):
         try:
+            if isinstance(job_resolved, Exception):
+                raise job_resolved
             await root.client.jobs.kill(job_resolved)
             # TODO (ajuszkowski) printing should be on the cli level
             click.echo(job_resolved)
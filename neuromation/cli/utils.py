@@ -49,6 +49,8 @@ DEPRECATED_INVOKE_NOTICE = "DeprecationWarning: The command {name} is deprecated
 
 NEURO_STEAL_CONFIG = "NEURO_STEAL_CONFIG"
 
+_EXAMPLES_RE = re.compile(r"Example[s]:\n", re.IGNORECASE)
+
 
 async def _run_async_function(
     init_client: bool,
@@ -57,22 +59,22 @@ async def _run_async_function(
     *args: Any,
     **kwargs: Any,
 ) -> _T:
+    if not init_client:
+        # No client means no version check and no usage stats, nothing to wait for
+        return await func(root, *args, **kwargs)
+
     loop = asyncio.get_event_loop()
 
-    if init_client:
-        await root.init_client()
+    await root.init_client()
 
-        pypi_task: "asyncio.Task[None]" = loop.create_task(
-            run_version_checker(root.client, root.disable_pypi_version_check)
-        )
-        stats_task: "asyncio.Task[None]" = loop.create_task(
-            upload_gmp_stats(
-                root.client, root.command_path, root.command_params, root.skip_gmp_stats
-            )
+    pypi_task: "asyncio.Task[None]" = loop.create_task(
+        run_version_checker(root.client, root.disable_pypi_version_check)
+    )
+    stats_task: "asyncio.Task[None]" = loop.create_task(
+        upload_gmp_stats(
+            root.client, root.command_path, root.command_params, root.skip_gmp_stats
         )
-    else:
-        pypi_task = loop.create_task(asyncio.sleep(0))  # do nothing
-        stats_task = loop.create_task(asyncio.sleep(0))  # do nothing
+    )
 
     try:
         return await func(root, *args, **kwargs)
@@ -131,20 +133,47 @@ class Context(click.Context):
 
 
 def split_examples(help: str) -> List[str]:
-    return re.split("Example[s]:\n", help, re.IGNORECASE)
+    return _EXAMPLES_RE.split(help)
 
 
-def format_example(example: str, formatter: click.HelpFormatter) -> None:
+def render_example(example: str) -> List[str]:
+    lines = []
+    for line in example.splitlines():
+        is_comment = line.startswith("#")
+        if is_comment:
+            lines.append("\b\n" + click.style(line, dim=True))
+        else:
+            lines.append("\b\n" + " ".join(shlex.split(line)))
+    return lines
+
+
+def write_example(lines: Iterable[str], formatter: click.HelpFormatter) -> None:
     with formatter.section(click.style("Examples", bold=True, underline=False)):
-        for line in example.splitlines():
-            is_comment = line.startswith("#")
-            if is_comment:
-                formatter.write_text("\b\n" + click.style(line, dim=True))
-            else:
-                formatter.write_text("\b\n" + " ".join(shlex.split(line)))
+        for line in lines:
+            formatter.write_text(line)
+
+
+def format_example(example: str, formatter: click.HelpFormatter) -> None:
+    write_example(render_example(example), formatter)
 
 
 class NeuroClickMixin:
+    _parsed_help: Optional[Tuple[str, str, List[List[str]]]] = None
+
+    def _parse_help(self, help: str) -> Tuple[str, List[List[str]]]:
+        # Split and render examples once, the source help is kept
+        # to detect its change after the first call
+        parsed = self._parsed_help
+        if parsed is None or parsed[0] != help:
+            help_text, *examples = split_examples(help)
+            parsed = (
+                help,
+                help_text,
+                [render_example(example.strip()) for example in examples],
+            )
+            self._parsed_help = parsed
+        return parsed[1], parsed[2]
+
     def get_help_option(self, ctx: click.Context) -> Optional[click.Option]:
         help_options = self.get_help_option_names(ctx)  # type: ignore
         if not help_options or not self.add_help_option:  # type: ignore
@@ -176,17 +205,16 @@ class NeuroClickMixin:
         deprecated = self.deprecated  # type: ignore
         help = self.help  # type: ignore
         if help:
-            help_text, *examples = split_examples(help)
+            help_text, examples = self._parse_help(help)
             if help_text:
                 formatter.write_paragraph()
                 with formatter.indentation():
                     if deprecated:
                         help_text += DEPRECATED_HELP_NOTICE
                     formatter.write_text(help_text)
-            examples = [example.strip() for example in examples]
 
             for example in examples:
-                format_example(example, formatter)
+                write_example(example, formatter)
         elif deprecated:
             formatter.write_paragraph()
             with formatter.indentation():
@@ -454,6 +482,27 @@ async def resolve_job(
     return id_or_name
 
 
+async def resolve_jobs(
+    ids_or_names_or_uris: Sequence[str], *, client: Client, status: Set[JobStatus]
+) -> List[Union[str, Exception]]:
+    # Resolve all jobs concurrently instead of doing a request per job in a row.
+    # A failed lookup is returned in place of the job ID, so the caller can
+    # report it while the other jobs are still processed.
+    results = await asyncio.gather(
+        *(
+            resolve_job(id_or_name_or_uri, client=client, status=status)
+            for id_or_name_or_uri in ids_or_names_or_uris
+        ),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, asyncio.CancelledError) or (
+            isinstance(result, BaseException) and not isinstance(result, Exception)
+        ):
+            raise result
+    return list(results)
+
+
 SHARE_SCHEMES = ("storage", "image", "job", "blob", "role")
 
 
@@ -465,12 +514,13 @@ def parse_resource_for_sharing(uri: str, root: Root) -> URL:
         image = root.client.parse.remote_image(uri, tag_option=TagOption.DENY)
         uri = str(image)
 
-    uri_res = uri_from_cli(
-        uri,
-        root.client.username,
-        root.client.cluster_name,
-        allowed_schemes=SHARE_SCHEMES,
-    )
+    return _sharing_uri_from_cli(uri, root.client.username, root.client.cluster_name)
+
+
+@functools.lru_cache(maxsize=256)
+def _sharing_uri_from_cli(uri: str, username: str, cluster_name: str) -> URL:
+    # Pure function of its arguments: no "file" scheme, so no cwd dependency
+    uri_res = uri_from_cli(uri, username, cluster_name, allowed_schemes=SHARE_SCHEMES)
     # URI's for object storage can only operate on bucket level
     if uri_res.scheme == "blob" and "/" in uri_res.path.strip("/"):
         raise ValueError("Only bucket level permissions are supported for Blob Storage")
@@ -506,14 +556,18 @@ def parse_blob_or_file_resource(uri: str, root: Root) -> URL:
     )
 
 
+_ACTIONS = {action.value: action for action in Action}
+
+
 def parse_permission_action(action: str) -> Action:
-    try:
-        return Action[action.upper()]
-    except KeyError:
-        valid_actions = ", ".join([a.value for a in Action])
+    # CLI passes lowercase names, keep accepting any case though
+    action_obj = _ACTIONS.get(action) or _ACTIONS.get(action.lower())
+    if action_obj is None:
+        valid_actions = ", ".join(_ACTIONS)
         raise ValueError(
             f"invalid permission action '{action}', allowed values: {valid_actions}"
         )
+    return action_obj
 
 
 def do_deprecated_quiet(
@@ -35,6 +35,7 @@ setup(
         "toml>=0.10.0",
         "prompt-toolkit>=3.0.5",
     ],
+    extras_require={"orjson": ["orjson>=3.0"]},
     include_package_data=True,
     description="Neuro Platform API client",
     long_description=readme,
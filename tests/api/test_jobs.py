@@ -1,5 +1,8 @@
 import asyncio
+import dataclasses
 import json
+import pickle
+import weakref
 from typing import Any, Callable, Dict, List, Optional
 
 import pytest
@@ -14,18 +17,38 @@ from neuromation.api import (
     HTTPPort,
     JobRestartPolicy,
     JobStatus,
+    JobStatusHistory,
     JobTelemetry,
     RemoteImage,
     ResourceNotFound,
     Resources,
     Volume,
 )
-from neuromation.api.jobs import INVALID_IMAGE_NAME, _job_description_from_api
+from neuromation.api.jobs import (
+    INVALID_IMAGE_NAME,
+    _job_description_from_api,
+    _parse_datetime,
+)
 from tests import _TestServerFactory
 
 
 _MakeClient = Callable[..., Client]
 
+# Minimal job description as returned by the API, tests override fields
+_JOB_PAYLOAD: Dict[str, Any] = {
+    "status": "running",
+    "id": "job-id",
+    "history": {"status": "running", "reason": "", "description": ""},
+    "is_preemptible": False,
+    "owner": "owner",
+    "cluster_name": "default",
+    "uri": "job://default/owner/job-id",
+    "container": {
+        "image": "submit-image-name",
+        "resources": {"memory_mb": "4096", "cpu": 7.0},
+    },
+}
+
 
 def test_resources_default() -> None:
     resources = Resources(16, 0.5)
@@ -1478,6 +1501,44 @@ async def test_list_no_filter(
         assert ret == job_descriptions
 
 
+@pytest.mark.parametrize("loads_module", ["json", "orjson"])
+async def test_json_loads_backends(
+    aiohttp_server: _TestServerFactory,
+    make_client: _MakeClient,
+    monkeypatch: Any,
+    loads_module: str,
+) -> None:
+    loads = pytest.importorskip(loads_module).loads
+    monkeypatch.setattr("neuromation.api.jobs._json_loads", loads)
+    job = {**_JOB_PAYLOAD, "description": "Описание задачи"}
+
+    async def status_handler(request: web.Request) -> web.Response:
+        return web.json_response(job)
+
+    async def list_handler(request: web.Request) -> web.StreamResponse:
+        resp = web.StreamResponse()
+        resp.content_type = "application/x-ndjson"
+        await resp.prepare(request)
+        for job_id in ("job-id-1", "job-id-2"):
+            line = json.dumps({**job, "id": job_id}, ensure_ascii=False) + "\n"
+            await resp.write(line.encode("utf-8"))
+        return resp
+
+    app = web.Application()
+    app.router.add_get("/jobs/job-id", status_handler)
+    app.router.add_get("/jobs", list_handler)
+    srv = await aiohttp_server(app)
+
+    async with make_client(srv.make_url("/")) as client:
+        ret = await client.jobs.status("job-id")
+        assert ret == _job_description_from_api(job, client.parse)
+        assert ret.description == "Описание задачи"
+
+        listed = [job async for job in client.jobs.list()]
+        assert [item.id for item in listed] == ["job-id-1", "job-id-2"]
+        assert {item.description for item in listed} == {"Описание задачи"}
+
+
 async def test_list_filter_by_name(
     aiohttp_server: _TestServerFactory, make_client: _MakeClient
 ) -> None:
@@ -1948,3 +2009,130 @@ async def test_port_forward(
                 writer.write(str(i).encode("ascii"))
                 ret = await reader.read(1024)
                 assert ret == b"rep-" + str(i).encode("ascii")
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2018-09-25T12:28:21.298672+00:00",
+        "2018-09-25T12:28:21Z",
+        "2018-09-25T12:28:21.298+03:00",
+        "2018-09-25T12:28:21",
+    ],
+)
+def test_parse_datetime(value: str) -> None:
+    assert _parse_datetime(value) == isoparse(value)
+
+
+def test_parse_datetime_none() -> None:
+    assert _parse_datetime(None) is None
+
+
+async def test_jobs_url_is_reused(make_client: _MakeClient) -> None:
+    async with make_client("https://api.localhost.localdomain") as client:
+        url = client.jobs._get_jobs_url()
+        assert url == URL("https://api.localhost.localdomain/jobs")
+        assert client.jobs._get_jobs_url() is url
+
+
+def test_job_description_has_slots() -> None:
+    history = JobStatusHistory(
+        status=JobStatus.PENDING, reason="ContainerCreating", description=""
+    )
+    assert not hasattr(history, "__dict__")
+    assert history.created_at is None
+    restored = pickle.loads(pickle.dumps(history))
+    assert restored == history
+
+
+def test_job_description_slots_are_frozen() -> None:
+    history = JobStatusHistory(
+        status=JobStatus.PENDING, reason="ContainerCreating", description=""
+    )
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        history.reason = "other"  # type: ignore
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        history.foo = 1  # type: ignore
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        del history.reason
+    assert history.reason == "ContainerCreating"
+
+
+def test_job_description_supports_weakref() -> None:
+    history = JobStatusHistory(
+        status=JobStatus.PENDING, reason="ContainerCreating", description=""
+    )
+    ref = weakref.ref(history)
+    assert ref() is history
+
+
+async def test_job_description_pickle_and_weakref(make_client: _MakeClient) -> None:
+    async with make_client("https://api.localhost.localdomain") as client:
+        job = _job_description_from_api(_JOB_PAYLOAD, client.parse)
+    assert weakref.ref(job)() is job
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        job.id = "other"  # type: ignore
+    restored = pickle.loads(pickle.dumps(job))
+    assert restored == job
+
+
+@pytest.mark.parametrize(
+    "urls,expected",
+    [
+        ({}, URL()),
+        ({"http_url": "http://job.dev"}, URL("http://job.dev")),
+        ({"http_url": "http://job.dev", "http_url_named": ""}, URL("http://job.dev")),
+        (
+            {"http_url": "http://job.dev", "http_url_named": "http://named.dev"},
+            URL("http://named.dev"),
+        ),
+    ],
+)
+async def test_job_description_from_api_http_url(
+    make_client: _MakeClient, urls: Dict[str, str], expected: URL
+) -> None:
+    JSON = {**_JOB_PAYLOAD, **urls}
+    async with make_client("https://api.localhost.localdomain") as client:
+        job = _job_description_from_api(JSON, client.parse)
+        assert job.http_url == expected
+
+
+@pytest.mark.parametrize(
+    "status,expected",
+    [
+        ("running", JobStatus.RUNNING),
+        ("failed", JobStatus.FAILED),
+        ("unknown", JobStatus.UNKNOWN),
+    ],
+)
+async def test_job_description_from_api_status(
+    make_client: _MakeClient, status: str, expected: JobStatus
+) -> None:
+    JSON = {
+        **_JOB_PAYLOAD,
+        "status": status,
+        "history": {**_JOB_PAYLOAD["history"], "status": status},
+    }
+    async with make_client("https://api.localhost.localdomain") as client:
+        job = _job_description_from_api(JSON, client.parse)
+        assert job.status == expected
+        assert job.history.status == expected
+
+
+async def test_job_description_from_api_unsupported_status(
+    make_client: _MakeClient,
+) -> None:
+    JSON = {**_JOB_PAYLOAD, "status": "something-new"}
+    async with make_client("https://api.localhost.localdomain") as client:
+        with pytest.raises(ValueError, match="something-new"):
+            _job_description_from_api(JSON, client.parse)
+
+
+async def test_job_description_from_api_history_status_default(
+    make_client: _MakeClient,
+) -> None:
+    JSON = {**_JOB_PAYLOAD, "history": {"reason": "", "description": ""}}
+    async with make_client("https://api.localhost.localdomain") as client:
+        job = _job_description_from_api(JSON, client.parse)
+        assert job.status == JobStatus.RUNNING
+        assert job.history.status == JobStatus.UNKNOWN
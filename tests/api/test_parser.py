@@ -77,3 +77,11 @@ def test_get_url_authority_without_port() -> None:
 def test_get_url_authority_without_host() -> None:
     url = URL("scheme://")
     assert _get_url_authority(url) is None
+
+
+async def test_image_parser_is_reused(make_client: _MakeClient) -> None:
+    async with make_client("https://api.localhost.localdomain") as client:
+        parser = client.parse._get_image_parser()
+        client.parse.remote_image("image://test-cluster/bob/bananas:latest")
+        client.parse.local_image("bananas:latest")
+        assert client.parse._get_image_parser() is parser
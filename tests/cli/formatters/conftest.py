@@ -0,0 +1,208 @@
+from dataclasses import replace
+from typing import Any, Callable, List, Optional
+
+import click
+import pytest
+from dateutil.parser import isoparse
+from yarl import URL
+
+from neuromation.api import (
+    Container,
+    JobDescription,
+    JobStatus,
+    JobStatusHistory,
+    RemoteImage,
+    Resources,
+)
+from neuromation.api.parsing_utils import _ImageNameParser
+from neuromation.cli.formatters.jobs import (
+    JobStatusFormatter,
+    JobTelemetryFormatter,
+    ResourcesFormatter,
+)
+from neuromation.cli.formatters.utils import uri_formatter
+
+
+TEST_JOB_ID = "job-ad09fe07-0c64-4d32-b477-3b737d215621"
+TEST_JOB_NAME = "test-job-name"
+
+_SSH_SERVER = URL("ssh-auth")
+
+
+_MakeContainer = Callable[..., Container]
+
+
+# Formatters never mutate jobs, so the descriptions are built once per session
+# and tests derive their variations with dataclasses.replace()
+
+
+@pytest.fixture(scope="session")
+def resources() -> Resources:
+    return Resources(16, 0.1, 0, None, False, None, None)
+
+
+@pytest.fixture(scope="session")
+def container_factory(resources: Resources) -> _MakeContainer:
+    test_image = RemoteImage.new_external_image(name="test-image")
+
+    def _make_container(
+        *,
+        image: RemoteImage = test_image,
+        command: Optional[str] = "test-command",
+        **kwargs: Any,
+    ) -> Container:
+        return Container(image=image, command=command, resources=resources, **kwargs)
+
+    return _make_container
+
+
+@pytest.fixture(scope="session")
+def base_history() -> JobStatusHistory:
+    return JobStatusHistory(
+        status=JobStatus.PENDING,
+        reason="ErrorReason",
+        description="ErrorDesc",
+        created_at=isoparse("2018-09-25T12:28:21.298672+00:00"),
+        started_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
+        finished_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
+    )
+
+
+@pytest.fixture(scope="session")
+def image_parser() -> _ImageNameParser:
+    return _ImageNameParser("bob", "test-cluster", URL("https://registry-test.neu.ro"))
+
+
+@pytest.fixture(scope="session")
+def job_descr_no_name(
+    base_history: JobStatusHistory, container_factory: _MakeContainer
+) -> JobDescription:
+    return JobDescription(
+        status=JobStatus.PENDING,
+        id=TEST_JOB_ID,
+        owner="owner",
+        cluster_name="default",
+        uri=URL(f"job://default/owner/{TEST_JOB_ID}"),
+        history=base_history,
+        container=container_factory(
+            image=RemoteImage.new_external_image(name="ubuntu", tag="latest"),
+            command=None,
+        ),
+        ssh_server=_SSH_SERVER,
+        is_preemptible=True,
+    )
+
+
+@pytest.fixture(scope="session")
+def job_descr(job_descr_no_name: JobDescription) -> JobDescription:
+    return replace(job_descr_no_name, name=TEST_JOB_NAME)
+
+
+@pytest.fixture(scope="session")
+def pending_job(
+    base_history: JobStatusHistory, container_factory: _MakeContainer
+) -> JobDescription:
+    return JobDescription(
+        status=JobStatus.PENDING,
+        owner="test-user",
+        cluster_name="default",
+        id="test-job",
+        uri=URL("job://default/test-user/test-job"),
+        description="test job description",
+        http_url=URL("http://local.host.test/"),
+        history=replace(base_history, reason=""),
+        container=container_factory(),
+        ssh_server=_SSH_SERVER,
+        is_preemptible=False,
+    )
+
+
+@pytest.fixture(scope="session")
+def running_job(pending_job: JobDescription) -> JobDescription:
+    return replace(
+        pending_job,
+        status=JobStatus.RUNNING,
+        history=replace(pending_job.history, status=JobStatus.RUNNING, reason="reason"),
+    )
+
+
+@pytest.fixture(scope="session")
+def job_status_formatter() -> JobStatusFormatter:
+    uri_fmtr = uri_formatter(username="test-user", cluster_name="test-cluster")
+    return JobStatusFormatter(uri_formatter=uri_fmtr)
+
+
+@pytest.fixture(scope="session")
+def resources_formatter() -> ResourcesFormatter:
+    return ResourcesFormatter()
+
+
+@pytest.fixture(scope="session")
+def job_telemetry_formatter() -> JobTelemetryFormatter:
+    return JobTelemetryFormatter()
+
+
+@pytest.fixture(scope="session")
+def formatted_resources(
+    resources_formatter: ResourcesFormatter, resources: Resources
+) -> str:
+    return click.unstyle(resources_formatter(resources))
+
+
+@pytest.fixture(scope="session")
+def wide_jobs(
+    base_history: JobStatusHistory, container_factory: _MakeContainer
+) -> List[JobDescription]:
+    return [
+        JobDescription(
+            status=JobStatus.FAILED,
+            id="job-7ee153a7-249c-4be9-965a-ba3eafb67c82",
+            name="name1",
+            owner="owner",
+            cluster_name="default",
+            uri=URL("job://default/owner/job-7ee153a7-249c-4be9-965a-ba3eafb67c82"),
+            description="some description long long long long",
+            history=replace(
+                base_history,
+                status=JobStatus.FAILED,
+                finished_at=isoparse("2017-09-25T12:28:59.759433+00:00"),
+            ),
+            container=container_factory(
+                image=RemoteImage.new_external_image(
+                    name="some-image-name", tag="with-long-tag"
+                ),
+                command="ls -la /some/path",
+            ),
+            ssh_server=_SSH_SERVER,
+            is_preemptible=True,
+        ),
+        JobDescription(
+            status=JobStatus.PENDING,
+            id="job-7ee153a7-249c-4be9-965a-ba3eafb67c84",
+            name="name2",
+            owner="owner",
+            cluster_name="default",
+            uri=URL("job://default/owner/job-7ee153a7-249c-4be9-965a-ba3eafb67c84"),
+            description="some description",
+            history=JobStatusHistory(
+                status=JobStatus.PENDING,
+                reason="",
+                description="",
+                created_at=isoparse("2017-09-25T12:28:21.298672+00:00"),
+                started_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
+                finished_at=isoparse("2017-09-25T12:28:59.759433+00:00"),
+            ),
+            container=container_factory(
+                image=RemoteImage.new_neuro_image(
+                    name="some-image-name",
+                    tag="with-long-tag",
+                    registry="https://registry.neu.ro",
+                    owner="bob",
+                    cluster_name="test-cluster",
+                ),
+                command="ls -la /some/path",
+            ),
+            ssh_server=_SSH_SERVER,
+            is_preemptible=True,
+        ),
+    ]
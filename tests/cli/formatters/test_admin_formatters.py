@@ -27,7 +27,7 @@ class TestClusterUserFormatter:
             "denis   admin  ",
             "ivan    user   ",
         ]
-        assert formatter(users) == expected_out
+        assert list(formatter(users)) == expected_out
 
 
 class TestClustersFormatter:
@@ -1,4 +1,6 @@
-from typing import Any
+from typing import Any, List
+
+import pytest
 
 from neuromation.api import (
     ImageProgressPull,
@@ -16,254 +18,154 @@ from neuromation.cli.formatters.images import DockerImageProgress
 from neuromation.cli.printer import CSI
 
 
-class TestDockerImageProgress:
-    def test_quiet_pull(self, capfd: Any) -> None:
-        formatter = DockerImageProgress.create(tty=True, quiet=True)
-        formatter.pull(
-            ImageProgressPull(
-                RemoteImage.new_external_image(name="input"), LocalImage("output")
-            )
-        )
-        formatter.step(ImageProgressStep("message1", "layer1"))
-        formatter.close()
-        out, err = capfd.readouterr()
-        assert err == ""
-        assert out == ""
-
-    def test_quiet_push(self, capfd: Any) -> None:
-        formatter = DockerImageProgress.create(tty=True, quiet=True)
-        formatter.push(
-            ImageProgressPush(
-                LocalImage("output"), RemoteImage.new_external_image(name="input")
-            )
-        )
-        formatter.step(ImageProgressStep("message1", "layer1"))
-        formatter.close()
-        out, err = capfd.readouterr()
-        assert err == ""
-        assert out == ""
-
-    def test_quiet_save(self, capfd: Any) -> None:
-        formatter = DockerImageProgress.create(tty=True, quiet=True)
-        formatter.save(
-            ImageProgressSave("job-id", RemoteImage.new_external_image(name="output"))
-        )
-        formatter.close()
-        out, err = capfd.readouterr()
-        assert err == ""
-        assert out == ""
-
-    def test_quiet_commit_started(self, capfd: Any) -> None:
-        formatter = DockerImageProgress.create(tty=True, quiet=True)
-        formatter.commit_started(
-            ImageCommitStarted(
-                job_id="job-id", target_image=RemoteImage.new_external_image("img")
-            )
-        )
-        formatter.close()
-        out, err = capfd.readouterr()
-        assert err == ""
-        assert out == ""
-
-    def test_quiet_commit_finished(self, capfd: Any) -> None:
-        formatter = DockerImageProgress.create(tty=True, quiet=True)
-        formatter.commit_finished(ImageCommitFinished(job_id="job-id"))
-        formatter.close()
-        out, err = capfd.readouterr()
-        assert err == ""
-        assert out == ""
-
-    def test_no_tty_pull(self, capfd: Any, click_tty_emulation: Any) -> None:
-        formatter = DockerImageProgress.create(tty=False, quiet=False)
-        formatter.pull(
-            ImageProgressPull(
-                RemoteImage.new_neuro_image(
-                    name="output",
-                    tag="stream",
-                    owner="bob",
-                    registry="https://registry-dev.neu.ro",
-                    cluster_name="test-cluster",
-                ),
-                LocalImage("input", "latest"),
-            )
-        )
-        formatter.step(ImageProgressStep("message1", "layer1"))
-        formatter.step(ImageProgressStep("message2", "layer1"))
-
-        formatter.close()
-        out, err = capfd.readouterr()
-        assert err == ""
-        assert "input:latest" in out
-        assert "image://test-cluster/bob/output:stream" in out
-        assert "message1" not in out
-        assert "message2" not in out
-        assert CSI not in out
-
-    def test_no_tty_push(self, capfd: Any, click_tty_emulation: Any) -> None:
-        formatter = DockerImageProgress.create(tty=False, quiet=False)
-        formatter.push(
-            ImageProgressPush(
-                LocalImage("input", "latest"),
-                RemoteImage.new_neuro_image(
-                    name="output",
-                    tag="stream",
-                    owner="bob",
-                    registry="https://registry-dev.neu.ro",
-                    cluster_name="test-cluster",
-                ),
-            )
-        )
-        formatter.step(ImageProgressStep("message1", "layer1"))
-        formatter.step(ImageProgressStep("message2", "layer1"))
-
-        formatter.close()
-        out, err = capfd.readouterr()
-        assert err == ""
-        assert "input:latest" in out
-        assert "image://test-cluster/bob/output:stream" in out
-        assert "message1" not in out
-        assert "message2" not in out
-        assert CSI not in out
-
-    def test_no_tty_save(self, capfd: Any) -> None:
-        formatter = DockerImageProgress.create(tty=False, quiet=False)
-        formatter.save(
-            ImageProgressSave(
-                "job-id",
-                RemoteImage.new_neuro_image(
-                    name="output",
-                    tag="stream",
-                    owner="bob",
-                    registry="https://registry-dev.neu.ro",
-                    cluster_name="test-cluster",
-                ),
-            )
-        )
-        formatter.close()
-        out, err = capfd.readouterr()
-        assert (
-            "Saving job 'job-id' to image 'image://test-cluster/bob/output:stream'"
-            in out
-        )
-        assert err == ""
+_LOCAL_IMAGE = LocalImage("input", "latest")
+_REMOTE_IMAGE = RemoteImage.new_neuro_image(
+    name="output",
+    tag="stream",
+    owner="bob",
+    registry="https://registry-dev.neu.ro",
+    cluster_name="test-cluster",
+)
+_REMOTE_IMAGE_URI = "image://test-cluster/bob/output:stream"
 
-    def test_no_tty_commit_started(self, capfd: Any) -> None:
-        formatter = DockerImageProgress.create(tty=False, quiet=False)
-        formatter.commit_started(
-            ImageCommitStarted(
-                job_id="job-id",
-                target_image=RemoteImage.new_neuro_image(
-                    name="output",
-                    tag="stream",
-                    owner="bob",
-                    registry="https://registry-dev.neu.ro",
-                    cluster_name="test-cluster",
-                ),
-            )
-        )
-        formatter.close()
-        out, err = capfd.readouterr()
-        assert "Using remote image 'image://test-cluster/bob/output:stream'" in out
-        assert f"Creating image from the job container..." in out
-        assert err == ""
 
-    def test_no_tty_commit_finished(self, capfd: Any) -> None:
-        formatter = DockerImageProgress.create(tty=False, quiet=False)
-        formatter.commit_finished(ImageCommitFinished(job_id="job-id"))
-        formatter.close()
-        out, err = capfd.readouterr()
-        assert out.startswith("Image created")
-        assert err == ""
-
-    def test_tty_pull(self, capfd: Any, click_tty_emulation: Any) -> None:
-        formatter = DockerImageProgress.create(tty=True, quiet=False)
-        formatter.pull(
-            ImageProgressPull(
-                RemoteImage.new_neuro_image(
-                    name="output",
-                    tag="stream",
-                    owner="bob",
-                    registry="https://registry-dev.neu.ro",
-                    cluster_name="test-cluster",
-                ),
-                LocalImage("input", "latest"),
-            )
-        )
-        formatter.step(ImageProgressStep("message1", "layer1"))
-        formatter.step(ImageProgressStep("message2", "layer1"))
-        formatter.close()
+class TestDockerImageProgress:
+    def check_output(
+        self,
+        capfd: Any,
+        quiet: bool,
+        must_contain: List[str],
+        must_not_contain: List[str],
+    ) -> None:
         out, err = capfd.readouterr()
         assert err == ""
-        assert "input:latest" in out
-        assert "image://test-cluster/bob/output:stream" in out
-        assert "message1" in out
-        assert "message2" in out
-        assert CSI in out
-
-    def test_tty_push(self, capfd: Any, click_tty_emulation: Any) -> None:
-        formatter = DockerImageProgress.create(tty=True, quiet=False)
-        formatter.push(
-            ImageProgressPush(
-                LocalImage("input", "latest"),
-                RemoteImage.new_neuro_image(
-                    name="output",
-                    tag="stream",
-                    owner="bob",
-                    registry="https://registry-dev.neu.ro",
-                    cluster_name="test-cluster",
-                ),
-            )
-        )
+        if quiet:
+            assert out == ""
+        for text in must_contain:
+            assert text in out
+        for text in must_not_contain:
+            assert text not in out
+
+    @pytest.mark.parametrize("push", [False, True], ids=["pull", "push"])
+    @pytest.mark.parametrize(
+        "tty,quiet,must_contain,must_not_contain",
+        [
+            pytest.param(True, True, [], [], id="quiet"),
+            pytest.param(
+                False,
+                False,
+                ["input:latest", _REMOTE_IMAGE_URI],
+                ["message1", "message2", CSI],
+                id="no_tty",
+            ),
+            pytest.param(
+                True,
+                False,
+                ["input:latest", _REMOTE_IMAGE_URI, "message1", "message2", CSI],
+                [],
+                id="tty",
+            ),
+        ],
+    )
+    def test_transfer(
+        self,
+        capfd: Any,
+        click_tty_emulation: Any,
+        push: bool,
+        tty: bool,
+        quiet: bool,
+        must_contain: List[str],
+        must_not_contain: List[str],
+    ) -> None:
+        formatter = DockerImageProgress.create(tty=tty, quiet=quiet)
+        if push:
+            formatter.push(ImageProgressPush(_LOCAL_IMAGE, _REMOTE_IMAGE))
+        else:
+            formatter.pull(ImageProgressPull(_REMOTE_IMAGE, _LOCAL_IMAGE))
         formatter.step(ImageProgressStep("message1", "layer1"))
         formatter.step(ImageProgressStep("message2", "layer1"))
         formatter.close()
-        out, err = capfd.readouterr()
-        assert err == ""
-        assert "input:latest" in out
-        assert "image://test-cluster/bob/output:stream" in out
-        assert "message1" in out
-        assert "message2" in out
-        assert CSI in out
-
-    def test_tty_save(self, capfd: Any, click_tty_emulation: Any) -> None:
-        formatter = DockerImageProgress.create(tty=True, quiet=False)
-        formatter.save(
-            ImageProgressSave(
-                "job-id",
-                RemoteImage.new_neuro_image(
-                    name="output",
-                    tag="stream",
-                    owner="bob",
-                    registry="https://registry-dev.neu.ro",
-                    cluster_name="test-cluster",
-                ),
-            )
-        )
+        self.check_output(capfd, quiet, must_contain, must_not_contain)
+
+    @pytest.mark.parametrize(
+        "tty,quiet,must_contain,must_not_contain",
+        [
+            pytest.param(True, True, [], [], id="quiet"),
+            pytest.param(
+                False,
+                False,
+                [f"Saving job 'job-id' to image '{_REMOTE_IMAGE_URI}'"],
+                [CSI],
+                id="no_tty",
+            ),
+            pytest.param(True, False, ["job-id", _REMOTE_IMAGE_URI, CSI], [], id="tty"),
+        ],
+    )
+    def test_save(
+        self,
+        capfd: Any,
+        click_tty_emulation: Any,
+        tty: bool,
+        quiet: bool,
+        must_contain: List[str],
+        must_not_contain: List[str],
+    ) -> None:
+        formatter = DockerImageProgress.create(tty=tty, quiet=quiet)
+        formatter.save(ImageProgressSave("job-id", _REMOTE_IMAGE))
         formatter.close()
-        out, err = capfd.readouterr()
-        assert err == ""
-        assert "job-id" in out
-        assert "image://test-cluster/bob/output:stream" in out
-        assert CSI in out
-
-    def test_tty_commit_started(self, capfd: Any, click_tty_emulation: Any) -> None:
-        formatter = DockerImageProgress.create(tty=True, quiet=False)
+        self.check_output(capfd, quiet, must_contain, must_not_contain)
+
+    @pytest.mark.parametrize(
+        "tty,quiet,must_contain,must_not_contain",
+        [
+            pytest.param(True, True, [], [], id="quiet"),
+            pytest.param(
+                False,
+                False,
+                [
+                    f"Using remote image '{_REMOTE_IMAGE_URI}'",
+                    "Creating image from the job container...",
+                ],
+                [CSI],
+                id="no_tty",
+            ),
+            pytest.param(True, False, [_REMOTE_IMAGE_URI, CSI], [], id="tty"),
+        ],
+    )
+    def test_commit_started(
+        self,
+        capfd: Any,
+        click_tty_emulation: Any,
+        tty: bool,
+        quiet: bool,
+        must_contain: List[str],
+        must_not_contain: List[str],
+    ) -> None:
+        formatter = DockerImageProgress.create(tty=tty, quiet=quiet)
         formatter.commit_started(
-            ImageCommitStarted(
-                job_id="job-id", target_image=RemoteImage.new_external_image(name="img")
-            )
+            ImageCommitStarted(job_id="job-id", target_image=_REMOTE_IMAGE)
         )
         formatter.close()
-        out, err = capfd.readouterr()
-        assert err == ""
-        assert "img" in out
-        assert CSI in out
-
-    def test_tty_commit_finished(self, capfd: Any, click_tty_emulation: Any) -> None:
-        formatter = DockerImageProgress.create(tty=True, quiet=False)
+        self.check_output(capfd, quiet, must_contain, must_not_contain)
+
+    @pytest.mark.parametrize(
+        "tty,quiet",
+        [
+            pytest.param(True, True, id="quiet"),
+            pytest.param(False, False, id="no_tty"),
+            pytest.param(True, False, id="tty"),
+        ],
+    )
+    def test_commit_finished(
+        self, capfd: Any, click_tty_emulation: Any, tty: bool, quiet: bool
+    ) -> None:
+        formatter = DockerImageProgress.create(tty=tty, quiet=quiet)
         formatter.commit_finished(ImageCommitFinished(job_id="job-id"))
         formatter.close()
         out, err = capfd.readouterr()
         assert err == ""
-        assert out.startswith("Image created")
-        assert CSI not in out  # no styled strings
+        if quiet:
+            assert out == ""
+        else:
+            assert out.startswith("Image created")
+            assert CSI not in out  # no styled strings
@@ -1,5 +1,7 @@
+import functools
+from dataclasses import replace
 from datetime import datetime, timedelta, timezone
-from typing import Any, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 import click
 import pytest
@@ -7,7 +9,6 @@ from dateutil.parser import isoparse
 from yarl import URL
 
 from neuromation.api import (
-    Container,
     HTTPPort,
     JobDescription,
     JobRestartPolicy,
@@ -33,136 +34,75 @@ from neuromation.cli.formatters.utils import image_formatter, uri_formatter
 from neuromation.cli.parse_utils import parse_columns
 from neuromation.cli.printer import CSI
 
+from .conftest import _SSH_SERVER, _MakeContainer
 
-TEST_JOB_ID = "job-ad09fe07-0c64-4d32-b477-3b737d215621"
-TEST_JOB_NAME = "test-job-name"
 
+# Expected TabularJobsFormatter output in TestTabularJobsFormatter.test_wide_cells;
+# {owner} is substituted per case
+_WIDE_CELLS_EXPECTED = [
+    "ID                                        NAME   STATUS   WHEN         IMAGE                                     OWNER  CLUSTER  DESCRIPTION                           COMMAND",  # noqa: E501
+    "job-7ee153a7-249c-4be9-965a-ba3eafb67c82  name1  failed   Sep 25 2017  some-image-name:with-long-tag             {owner}  default  some description long long long long  ls -la /some/path",  # noqa: E501
+    "job-7ee153a7-249c-4be9-965a-ba3eafb67c84  name2  pending  Sep 25 2017  image://test-cluster/bob/some-image-      {owner}  default  some description                      ls -la /some/path",  # noqa: E501
+    "                                                                       name:with-long-tag",  # noqa: E501
+]
 
-@pytest.fixture
-def job_descr_no_name() -> JobDescription:
-    return JobDescription(
-        status=JobStatus.PENDING,
-        id=TEST_JOB_ID,
-        owner="owner",
-        cluster_name="default",
-        uri=URL(f"job://default/owner/{TEST_JOB_ID}"),
-        history=JobStatusHistory(
-            status=JobStatus.PENDING,
-            reason="ErrorReason",
-            description="ErrorDesc",
-            created_at=isoparse("2018-09-25T12:28:21.298672+00:00"),
-            started_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-            finished_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-        ),
-        container=Container(
-            image=RemoteImage.new_external_image(name="ubuntu", tag="latest"),
-            resources=Resources(16, 0.1, 0, None, False, None, None),
-        ),
-        ssh_server=URL("ssh-auth"),
-        is_preemptible=True,
-    )
 
+_TELEMETRY_ROW_FMT = "{timestamp:<24}\t{cpu:<15}\t{mem:<15}\t{gpu:<15}\t{gpu_mem:<15}"
 
-@pytest.fixture
-def job_descr() -> JobDescription:
-    return JobDescription(
-        status=JobStatus.PENDING,
-        id=TEST_JOB_ID,
-        name=TEST_JOB_NAME,
-        owner="owner",
-        cluster_name="default",
-        uri=URL(f"job://default/owner/{TEST_JOB_ID}"),
-        history=JobStatusHistory(
-            status=JobStatus.PENDING,
-            reason="ErrorReason",
-            description="ErrorDesc",
-            created_at=isoparse("2018-09-25T12:28:21.298672+00:00"),
-            started_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-            finished_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-        ),
-        container=Container(
-            image=RemoteImage.new_external_image(name="ubuntu", tag="latest"),
-            resources=Resources(16, 0.1, 0, None, False, None, None),
-        ),
-        ssh_server=URL("ssh-auth"),
-        is_preemptible=True,
-    )
 
+# Formatters are deterministic, so the same styled output is often stripped
+# several times across tests
+@functools.lru_cache(maxsize=256)
+def _unstyle(text: str) -> str:
+    return click.unstyle(text)
 
-class TestJobStartProgress:
-    def make_job(
-        self,
-        status: JobStatus,
-        reason: str,
-        *,
-        name: Optional[str] = None,
-        life_span: Optional[float] = None,
-    ) -> JobDescription:
-        return JobDescription(
-            name=name,
-            status=status,
-            owner="test-user",
-            cluster_name="default",
-            id="test-job",
-            uri=URL("job://default/test-user/test-job"),
-            description="test job description",
-            http_url=URL("http://local.host.test/"),
-            history=JobStatusHistory(
-                status=status,
-                reason=reason,
-                description="ErrorDesc",
-                created_at=isoparse("2018-09-25T12:28:21.298672+00:00"),
-                started_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-                finished_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-            ),
-            container=Container(
-                command="test-command",
-                image=RemoteImage.new_external_image(name="test-image"),
-                resources=Resources(16, 0.1, 0, None, False, None, None),
-            ),
-            ssh_server=URL("ssh-auth"),
-            is_preemptible=False,
-            life_span=life_span,
-        )
 
+class TestJobStartProgress:
     def strip(self, text: str) -> str:
-        return click.unstyle(text).strip()
+        return _unstyle(text).strip()
 
-    def test_quiet(self, capfd: Any) -> None:
-        job = self.make_job(JobStatus.PENDING, "")
+    def test_quiet(self, capfd: Any, pending_job: JobDescription) -> None:
         progress = JobStartProgress.create(tty=True, color=True, quiet=True)
-        progress.begin(job)
+        progress.begin(pending_job)
         out, err = capfd.readouterr()
         assert err == ""
         assert out == "test-job\n"
-        progress.step(job)
-        progress.end(job)
+        progress.step(pending_job)
+        progress.end(pending_job)
         out, err = capfd.readouterr()
         assert err == ""
         assert out == ""
 
-    def test_no_tty_begin(self, capfd: Any, click_tty_emulation: Any) -> None:
-        progress = JobStartProgress.create(tty=False, color=True, quiet=False)
-        progress.begin(self.make_job(JobStatus.PENDING, ""))
-        out, err = capfd.readouterr()
-        assert err == ""
-        assert "test-job" in out
-        assert CSI not in out
-
-    def test_no_tty_begin_with_name(self, capfd: Any, click_tty_emulation: Any) -> None:
-        progress = JobStartProgress.create(tty=False, color=True, quiet=False)
-        progress.begin(self.make_job(JobStatus.PENDING, "", name="job-name"))
+    @pytest.mark.parametrize("tty", [False, True], ids=["no-tty", "tty"])
+    @pytest.mark.parametrize("name", [None, "job-name"], ids=["no-name", "name"])
+    def test_begin(
+        self,
+        capfd: Any,
+        click_tty_emulation: Any,
+        pending_job: JobDescription,
+        tty: bool,
+        name: Optional[str],
+    ) -> None:
+        progress = JobStartProgress.create(tty=tty, color=True, quiet=False)
+        progress.begin(replace(pending_job, name=name))
         out, err = capfd.readouterr()
         assert err == ""
         assert "test-job" in out
-        assert "job-name" in out
-        assert CSI not in out
+        if name is not None:
+            assert name in out
+        assert (CSI in out) == tty
 
-    def test_no_tty_step(self, capfd: Any, click_tty_emulation: Any) -> None:
+    def test_no_tty_step(
+        self,
+        capfd: Any,
+        click_tty_emulation: Any,
+        pending_job: JobDescription,
+        running_job: JobDescription,
+    ) -> None:
         progress = JobStartProgress.create(tty=False, color=True, quiet=False)
-        progress.step(self.make_job(JobStatus.PENDING, ""))
-        progress.step(self.make_job(JobStatus.PENDING, ""))
-        progress.step(self.make_job(JobStatus.RUNNING, "reason"))
+        progress.step(pending_job)
+        progress.step(pending_job)
+        progress.step(running_job)
         out, err = capfd.readouterr()
         assert err == ""
         assert "pending" in out
@@ -171,35 +111,26 @@ class TestJobStartProgress:
         assert out.count("pending") == 1
         assert CSI not in out
 
-    def test_no_tty_end(self, capfd: Any, click_tty_emulation: Any) -> None:
+    def test_no_tty_end(
+        self, capfd: Any, click_tty_emulation: Any, running_job: JobDescription
+    ) -> None:
         progress = JobStartProgress.create(tty=False, color=True, quiet=False)
-        progress.end(self.make_job(JobStatus.RUNNING, ""))
+        progress.end(running_job)
         out, err = capfd.readouterr()
         assert err == ""
         assert out == ""
 
-    def test_tty_begin(self, capfd: Any, click_tty_emulation: Any) -> None:
-        progress = JobStartProgress.create(tty=True, color=True, quiet=False)
-        progress.begin(self.make_job(JobStatus.PENDING, ""))
-        out, err = capfd.readouterr()
-        assert err == ""
-        assert "test-job" in out
-        assert CSI in out
-
-    def test_tty_begin_with_name(self, capfd: Any, click_tty_emulation: Any) -> None:
-        progress = JobStartProgress.create(tty=True, color=True, quiet=False)
-        progress.begin(self.make_job(JobStatus.PENDING, "", name="job-name"))
-        out, err = capfd.readouterr()
-        assert err == ""
-        assert "test-job" in out
-        assert "job-name" in out
-        assert CSI in out
-
-    def test_tty_step(self, capfd: Any, click_tty_emulation: Any) -> None:
+    def test_tty_step(
+        self,
+        capfd: Any,
+        click_tty_emulation: Any,
+        pending_job: JobDescription,
+        running_job: JobDescription,
+    ) -> None:
         progress = JobStartProgress.create(tty=True, color=True, quiet=False)
-        progress.step(self.make_job(JobStatus.PENDING, ""))
-        progress.step(self.make_job(JobStatus.PENDING, ""))
-        progress.step(self.make_job(JobStatus.RUNNING, "reason"))
+        progress.step(pending_job)
+        progress.step(pending_job)
+        progress.step(running_job)
         out, err = capfd.readouterr()
         assert err == ""
         assert "pending" in out
@@ -209,17 +140,21 @@ class TestJobStartProgress:
         assert out.count("pending") != 1
         assert CSI in out
 
-    def test_tty_end(self, capfd: Any, click_tty_emulation: Any) -> None:
+    def test_tty_end(
+        self, capfd: Any, click_tty_emulation: Any, running_job: JobDescription
+    ) -> None:
         progress = JobStartProgress.create(tty=True, color=True, quiet=False)
-        progress.end(self.make_job(JobStatus.RUNNING, ""))
+        progress.end(running_job)
         out, err = capfd.readouterr()
         assert err == ""
         assert "http://local.host.test/" in out
         assert CSI in out
 
-    def test_tty_end_with_life_span(self, capfd: Any, click_tty_emulation: Any) -> None:
+    def test_tty_end_with_life_span(
+        self, capfd: Any, click_tty_emulation: Any, running_job: JobDescription
+    ) -> None:
         progress = JobStartProgress.create(tty=True, color=True, quiet=False)
-        progress.end(self.make_job(JobStatus.RUNNING, "", life_span=24 * 3600))
+        progress.end(replace(running_job, life_span=24 * 3600))
         out, err = capfd.readouterr()
         assert err == ""
         assert "http://local.host.test/" in out
@@ -228,574 +163,420 @@ class TestJobStartProgress:
 
 
 class TestJobOutputFormatter:
-    def test_job_with_name(self) -> None:
-        description = JobDescription(
+    @pytest.fixture
+    def failed_job_descr(
+        self,
+        pending_job: JobDescription,
+        base_history: JobStatusHistory,
+        container_factory: _MakeContainer,
+    ) -> JobDescription:
+        return replace(
+            pending_job,
             status=JobStatus.FAILED,
-            owner="test-user",
-            cluster_name="default",
-            id="test-job",
-            uri=URL("job://default/test-user/test-job"),
-            name="test-job-name",
-            description="test job description",
-            http_url=URL("http://local.host.test/"),
-            history=JobStatusHistory(
-                status=JobStatus.PENDING,
-                reason="ErrorReason",
-                description="ErrorDesc",
-                created_at=isoparse("2018-09-25T12:28:21.298672+00:00"),
-                started_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-                finished_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-                exit_code=123,
-            ),
-            container=Container(
-                command="test-command",
-                image=RemoteImage.new_external_image(name="test-image"),
-                resources=Resources(16, 0.1, 0, None, False, None, None),
-                http=HTTPPort(port=80, requires_auth=True),
-            ),
-            ssh_server=URL("ssh-auth"),
-            is_preemptible=False,
+            history=replace(base_history, exit_code=321),
+            container=container_factory(http=HTTPPort(port=80, requires_auth=True)),
         )
 
-        uri_fmtr = uri_formatter(username="test-user", cluster_name="test-cluster")
-        status = click.unstyle(JobStatusFormatter(uri_formatter=uri_fmtr)(description))
-        resource_formatter = ResourcesFormatter()
-        resource = click.unstyle(resource_formatter(description.container.resources))
-        assert (
-            status == "Job: test-job\n"
-            "Name: test-job-name\n"
-            "Owner: test-user\n"
-            "Cluster: default\n"
-            "Description: test job description\n"
-            "Status: failed (ErrorReason)\n"
-            "Image: test-image\n"
-            "Command: test-command\n"
-            f"{resource}\n"
-            "TTY: False\n"
-            "Http URL: http://local.host.test/\n"
-            "Http authentication: True\n"
-            "Created: 2018-09-25T12:28:21.298672+00:00\n"
-            "Started: 2018-09-25T12:28:59.759433+00:00\n"
-            "Finished: 2018-09-25T12:28:59.759433+00:00\n"
-            "Exit code: 123\n"
-            "===Description===\n"
-            "ErrorDesc\n================="
+    @pytest.fixture
+    def exited_job_descr(self, failed_job_descr: JobDescription) -> JobDescription:
+        return replace(
+            failed_job_descr, history=replace(failed_job_descr.history, exit_code=123),
         )
 
-    def test_job_with_tags(self) -> None:
-        description = JobDescription(
-            status=JobStatus.FAILED,
-            owner="test-user",
-            cluster_name="default",
-            id="test-job",
-            uri=URL("job://default/test-user/test-job"),
-            tags=["tag1", "tag2", "tag3"],
-            description="test job description",
-            http_url=URL("http://local.host.test/"),
-            history=JobStatusHistory(
-                status=JobStatus.PENDING,
-                reason="ErrorReason",
-                description="ErrorDesc",
-                created_at=isoparse("2018-09-25T12:28:21.298672+00:00"),
-                started_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-                finished_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-                exit_code=123,
-            ),
-            container=Container(
-                command="test-command",
-                image=RemoteImage.new_external_image(name="test-image"),
-                resources=Resources(16, 0.1, 0, None, False, None, None),
-                http=HTTPPort(port=80, requires_auth=True),
+    @pytest.mark.parametrize(
+        "job_changes,history_changes,container_changes,expected",
+        [
+            pytest.param(
+                {"name": "test-job-name"},
+                {"exit_code": 123},
+                {},
+                [
+                    "Job: test-job",
+                    "Name: test-job-name",
+                    "Owner: test-user",
+                    "Cluster: default",
+                    "Description: test job description",
+                    "Status: failed (ErrorReason)",
+                    "Image: test-image",
+                    "Command: test-command",
+                    "{resources}",
+                    "TTY: False",
+                    "Http URL: http://local.host.test/",
+                    "Http authentication: True",
+                    "Created: 2018-09-25T12:28:21.298672+00:00",
+                    "Started: 2018-09-25T12:28:59.759433+00:00",
+                    "Finished: 2018-09-25T12:28:59.759433+00:00",
+                    "Exit code: 123",
+                    "===Description===",
+                    "ErrorDesc",
+                    "=================",
+                ],
+                id="with-name",
             ),
-            ssh_server=URL("ssh-auth"),
-            is_preemptible=False,
-        )
-
-        uri_fmtr = uri_formatter(username="test-user", cluster_name="test-cluster")
-        status = click.unstyle(JobStatusFormatter(uri_formatter=uri_fmtr)(description))
-        resource_formatter = ResourcesFormatter()
-        resource = click.unstyle(resource_formatter(description.container.resources))
-        assert (
-            status == "Job: test-job\n"
-            "Tags: tag1, tag2, tag3\n"
-            "Owner: test-user\n"
-            "Cluster: default\n"
-            "Description: test job description\n"
-            "Status: failed (ErrorReason)\n"
-            "Image: test-image\n"
-            "Command: test-command\n"
-            f"{resource}\n"
-            "TTY: False\n"
-            "Http URL: http://local.host.test/\n"
-            "Http authentication: True\n"
-            "Created: 2018-09-25T12:28:21.298672+00:00\n"
-            "Started: 2018-09-25T12:28:59.759433+00:00\n"
-            "Finished: 2018-09-25T12:28:59.759433+00:00\n"
-            "Exit code: 123\n"
-            "===Description===\n"
-            "ErrorDesc\n================="
-        )
-
-    def test_job_with_life_span_with_value(self) -> None:
-        description = JobDescription(
-            status=JobStatus.FAILED,
-            owner="test-user",
-            cluster_name="default",
-            id="test-job",
-            uri=URL("job://default/test-user/test-job"),
-            description="test job description",
-            http_url=URL("http://local.host.test/"),
-            history=JobStatusHistory(
-                status=JobStatus.PENDING,
-                reason="ErrorReason",
-                description="ErrorDesc",
-                created_at=isoparse("2018-09-25T12:28:21.298672+00:00"),
-                started_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-                finished_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-                exit_code=123,
+            pytest.param(
+                {},
+                {},
+                {},
+                [
+                    "Job: test-job",
+                    "Owner: test-user",
+                    "Cluster: default",
+                    "Description: test job description",
+                    "Status: failed (ErrorReason)",
+                    "Image: test-image",
+                    "Command: test-command",
+                    "{resources}",
+                    "TTY: False",
+                    "Http URL: http://local.host.test/",
+                    "Http authentication: True",
+                    "Created: 2018-09-25T12:28:21.298672+00:00",
+                    "Started: 2018-09-25T12:28:59.759433+00:00",
+                    "Finished: 2018-09-25T12:28:59.759433+00:00",
+                    "Exit code: 321",
+                    "===Description===",
+                    "ErrorDesc",
+                    "=================",
+                ],
+                id="failed",
             ),
-            container=Container(
-                command="test-command",
-                image=RemoteImage.new_external_image(name="test-image"),
-                resources=Resources(16, 0.1, 0, None, False, None, None),
-                http=HTTPPort(port=80, requires_auth=True),
+            pytest.param(
+                {
+                    "status": JobStatus.PENDING,
+                    "owner": "owner",
+                    "uri": URL("job://default/owner/test-job"),
+                    "http_url": URL(),
+                    "is_preemptible": True,
+                },
+                {
+                    "reason": "",
+                    "description": "",
+                    "started_at": None,
+                    "finished_at": None,
+                    "exit_code": None,
+                },
+                {"http": None},
+                [
+                    "Job: test-job",
+                    "Owner: owner",
+                    "Cluster: default",
+                    "Description: test job description",
+                    "Status: pending",
+                    "Image: test-image",
+                    "Command: test-command",
+                    "{resources}",
+                    "Preemptible: True",
+                    "TTY: False",
+                    "Created: 2018-09-25T12:28:21.298672+00:00",
+                ],
+                id="pending-no-reason",
             ),
-            ssh_server=URL("ssh-auth"),
-            is_preemptible=False,
-            life_span=1.0 * ((60 * 60 * 24 * 1) + (60 * 60 * 2) + (60 * 3) + 4),
-        )
-
-        uri_fmtr = uri_formatter(username="test-user", cluster_name="test-cluster")
-        status = click.unstyle(JobStatusFormatter(uri_formatter=uri_fmtr)(description))
-        resource_formatter = ResourcesFormatter()
-        resource = click.unstyle(resource_formatter(description.container.resources))
-        assert (
-            status == "Job: test-job\n"
-            "Owner: test-user\n"
-            "Cluster: default\n"
-            "Description: test job description\n"
-            "Status: failed (ErrorReason)\n"
-            "Image: test-image\n"
-            "Command: test-command\n"
-            f"{resource}\n"
-            "Life span: 1d2h3m4s\n"
-            "TTY: False\n"
-            "Http URL: http://local.host.test/\n"
-            "Http authentication: True\n"
-            "Created: 2018-09-25T12:28:21.298672+00:00\n"
-            "Started: 2018-09-25T12:28:59.759433+00:00\n"
-            "Finished: 2018-09-25T12:28:59.759433+00:00\n"
-            "Exit code: 123\n"
-            "===Description===\n"
-            "ErrorDesc\n================="
-        )
-
-    def test_job_with_life_span_without_value(self) -> None:
-        description = JobDescription(
-            status=JobStatus.FAILED,
-            owner="test-user",
-            cluster_name="default",
-            id="test-job",
-            uri=URL("job://default/test-user/test-job"),
-            description="test job description",
-            http_url=URL("http://local.host.test/"),
-            history=JobStatusHistory(
-                status=JobStatus.PENDING,
-                reason="ErrorReason",
-                description="ErrorDesc",
-                created_at=isoparse("2018-09-25T12:28:21.298672+00:00"),
-                started_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-                finished_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-                exit_code=123,
+            pytest.param(
+                {
+                    "status": JobStatus.PENDING,
+                    "owner": "owner",
+                    "uri": URL("job://default/owner/test-job"),
+                    "description": None,
+                    "http_url": URL(),
+                    "is_preemptible": True,
+                },
+                {
+                    "reason": "ContainerCreating",
+                    "description": "",
+                    "started_at": None,
+                    "finished_at": None,
+                    "exit_code": None,
+                },
+                {"http": None},
+                [
+                    "Job: test-job",
+                    "Owner: owner",
+                    "Cluster: default",
+                    "Status: pending (ContainerCreating)",
+                    "Image: test-image",
+                    "Command: test-command",
+                    "{resources}",
+                    "Preemptible: True",
+                    "TTY: False",
+                    "Created: 2018-09-25T12:28:21.298672+00:00",
+                ],
+                id="pending-no-description",
             ),
-            container=Container(
-                command="test-command",
-                image=RemoteImage.new_external_image(name="test-image"),
-                resources=Resources(16, 0.1, 0, None, False, None, None),
-                http=HTTPPort(port=80, requires_auth=True),
+            pytest.param(
+                {"status": JobStatus.RUNNING, "internal_hostname": "host.local"},
+                {
+                    "status": JobStatus.RUNNING,
+                    "reason": "ContainerRunning",
+                    "description": "",
+                    "started_at": isoparse("2018-09-25T12:28:24.759433+00:00"),
+                    "finished_at": None,
+                    "exit_code": None,
+                },
+                {"http": None},
+                [
+                    "Job: test-job",
+                    "Owner: test-user",
+                    "Cluster: default",
+                    "Description: test job description",
+                    "Status: running",
+                    "Image: test-image",
+                    "Command: test-command",
+                    "{resources}",
+                    "TTY: False",
+                    "Internal Hostname: host.local",
+                    "Http URL: http://local.host.test/",
+                    "Created: 2018-09-25T12:28:21.298672+00:00",
+                    "Started: 2018-09-25T12:28:24.759433+00:00",
+                ],
+                id="running",
             ),
-            ssh_server=URL("ssh-auth"),
-            is_preemptible=False,
-            life_span=0.0,
-        )
-
-        uri_fmtr = uri_formatter(username="test-user", cluster_name="test-cluster")
-        status = click.unstyle(JobStatusFormatter(uri_formatter=uri_fmtr)(description))
-        resource_formatter = ResourcesFormatter()
-        resource = click.unstyle(resource_formatter(description.container.resources))
-        assert (
-            status == "Job: test-job\n"
-            "Owner: test-user\n"
-            "Cluster: default\n"
-            "Description: test job description\n"
-            "Status: failed (ErrorReason)\n"
-            "Image: test-image\n"
-            "Command: test-command\n"
-            f"{resource}\n"
-            "Life span: no limit\n"
-            "TTY: False\n"
-            "Http URL: http://local.host.test/\n"
-            "Http authentication: True\n"
-            "Created: 2018-09-25T12:28:21.298672+00:00\n"
-            "Started: 2018-09-25T12:28:59.759433+00:00\n"
-            "Finished: 2018-09-25T12:28:59.759433+00:00\n"
-            "Exit code: 123\n"
-            "===Description===\n"
-            "ErrorDesc\n================="
+        ],
+    )
+    def test_job_status(
+        self,
+        failed_job_descr: JobDescription,
+        job_changes: Dict[str, Any],
+        history_changes: Dict[str, Any],
+        container_changes: Dict[str, Any],
+        expected: List[str],
+        job_status_formatter: JobStatusFormatter,
+        formatted_resources: str,
+    ) -> None:
+        description = replace(
+            failed_job_descr,
+            history=replace(failed_job_descr.history, **history_changes),
+            container=replace(failed_job_descr.container, **container_changes),
+            **job_changes,
         )
 
-    def test_job_with_restart_policy(self) -> None:
-        description = JobDescription(
-            status=JobStatus.FAILED,
-            owner="test-user",
-            cluster_name="default",
-            id="test-job",
-            uri=URL("job://default/test-user/test-job"),
-            description="test job description",
-            http_url=URL("http://local.host.test/"),
-            history=JobStatusHistory(
-                status=JobStatus.PENDING,
-                reason="ErrorReason",
-                description="ErrorDesc",
-                created_at=isoparse("2018-09-25T12:28:21.298672+00:00"),
-                started_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-                finished_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-                exit_code=123,
-            ),
-            container=Container(
-                command="test-command",
-                image=RemoteImage.new_external_image(name="test-image"),
-                resources=Resources(16, 0.1, 0, None, False, None, None),
-                http=HTTPPort(port=80, requires_auth=True),
-            ),
-            ssh_server=URL("ssh-auth"),
-            is_preemptible=False,
-            restart_policy=JobRestartPolicy.ALWAYS,
-        )
+        status = _unstyle(job_status_formatter(description))
+        assert status == "\n".join(expected).format(resources=formatted_resources)
 
-        uri_fmtr = uri_formatter(username="test-user", cluster_name="test-cluster")
-        status = click.unstyle(JobStatusFormatter(uri_formatter=uri_fmtr)(description))
-        resource_formatter = ResourcesFormatter()
-        resource = click.unstyle(resource_formatter(description.container.resources))
-        assert (
-            status == "Job: test-job\n"
-            "Owner: test-user\n"
-            "Cluster: default\n"
-            "Description: test job description\n"
-            "Status: failed (ErrorReason)\n"
-            "Image: test-image\n"
-            "Command: test-command\n"
-            f"{resource}\n"
-            "Restart policy: always\n"
-            "TTY: False\n"
-            "Http URL: http://local.host.test/\n"
-            "Http authentication: True\n"
-            "Created: 2018-09-25T12:28:21.298672+00:00\n"
-            "Started: 2018-09-25T12:28:59.759433+00:00\n"
-            "Finished: 2018-09-25T12:28:59.759433+00:00\n"
-            "Exit code: 123\n"
-            "===Description===\n"
-            "ErrorDesc\n================="
+    def test_job_with_tags(
+        self,
+        job_status_formatter: JobStatusFormatter,
+        formatted_resources: str,
+        exited_job_descr: JobDescription,
+    ) -> None:
+        description = replace(exited_job_descr, tags=["tag1", "tag2", "tag3"])
+
+        status = _unstyle(job_status_formatter(description))
+        assert status == "\n".join(
+            [
+                "Job: test-job",
+                "Tags: tag1, tag2, tag3",
+                "Owner: test-user",
+                "Cluster: default",
+                "Description: test job description",
+                "Status: failed (ErrorReason)",
+                "Image: test-image",
+                "Command: test-command",
+                formatted_resources,
+                "TTY: False",
+                "Http URL: http://local.host.test/",
+                "Http authentication: True",
+                "Created: 2018-09-25T12:28:21.298672+00:00",
+                "Started: 2018-09-25T12:28:59.759433+00:00",
+                "Finished: 2018-09-25T12:28:59.759433+00:00",
+                "Exit code: 123",
+                "===Description===",
+                "ErrorDesc",
+                "=================",
+            ]
         )
 
-    def test_pending_job(self) -> None:
-        description = JobDescription(
-            status=JobStatus.FAILED,
-            owner="test-user",
-            cluster_name="default",
-            id="test-job",
-            uri=URL("job://default/test-user/test-job"),
-            description="test job description",
-            http_url=URL("http://local.host.test/"),
-            history=JobStatusHistory(
-                status=JobStatus.PENDING,
-                reason="ErrorReason",
-                description="ErrorDesc",
-                created_at=isoparse("2018-09-25T12:28:21.298672+00:00"),
-                started_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-                finished_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-                exit_code=321,
-            ),
-            container=Container(
-                command="test-command",
-                image=RemoteImage.new_external_image(name="test-image"),
-                resources=Resources(16, 0.1, 0, None, False, None, None),
-                http=HTTPPort(port=80, requires_auth=True),
-            ),
-            ssh_server=URL("ssh-auth"),
-            is_preemptible=False,
+    def test_job_with_life_span_with_value(
+        self,
+        job_status_formatter: JobStatusFormatter,
+        formatted_resources: str,
+        exited_job_descr: JobDescription,
+    ) -> None:
+        description = replace(
+            exited_job_descr,
+            life_span=1.0 * ((60 * 60 * 24 * 1) + (60 * 60 * 2) + (60 * 3) + 4),
         )
 
-        uri_fmtr = uri_formatter(username="test-user", cluster_name="test-cluster")
-        status = click.unstyle(JobStatusFormatter(uri_formatter=uri_fmtr)(description))
-        resource_formatter = ResourcesFormatter()
-        resource = click.unstyle(resource_formatter(description.container.resources))
-        assert (
-            status == "Job: test-job\n"
-            "Owner: test-user\n"
-            "Cluster: default\n"
-            "Description: test job description\n"
-            "Status: failed (ErrorReason)\n"
-            "Image: test-image\n"
-            "Command: test-command\n"
-            f"{resource}\n"
-            "TTY: False\n"
-            "Http URL: http://local.host.test/\n"
-            "Http authentication: True\n"
-            "Created: 2018-09-25T12:28:21.298672+00:00\n"
-            "Started: 2018-09-25T12:28:59.759433+00:00\n"
-            "Finished: 2018-09-25T12:28:59.759433+00:00\n"
-            "Exit code: 321\n"
-            "===Description===\n"
-            "ErrorDesc\n================="
+        status = _unstyle(job_status_formatter(description))
+        assert status == "\n".join(
+            [
+                "Job: test-job",
+                "Owner: test-user",
+                "Cluster: default",
+                "Description: test job description",
+                "Status: failed (ErrorReason)",
+                "Image: test-image",
+                "Command: test-command",
+                formatted_resources,
+                "Life span: 1d2h3m4s",
+                "TTY: False",
+                "Http URL: http://local.host.test/",
+                "Http authentication: True",
+                "Created: 2018-09-25T12:28:21.298672+00:00",
+                "Started: 2018-09-25T12:28:59.759433+00:00",
+                "Finished: 2018-09-25T12:28:59.759433+00:00",
+                "Exit code: 123",
+                "===Description===",
+                "ErrorDesc",
+                "=================",
+            ]
         )
 
-    def test_pending_job_no_reason(self) -> None:
-        description = JobDescription(
-            status=JobStatus.PENDING,
-            id="test-job",
-            description="test job description",
-            history=JobStatusHistory(
-                status=JobStatus.PENDING,
-                reason="",
-                description="",
-                created_at=isoparse("2018-09-25T12:28:21.298672+00:00"),
-                started_at=None,
-                finished_at=None,
-            ),
-            container=Container(
-                command="test-command",
-                image=RemoteImage.new_external_image(name="test-image"),
-                resources=Resources(16, 0.1, 0, None, False, None, None),
-            ),
-            ssh_server=URL("ssh-auth"),
-            is_preemptible=True,
-            owner="owner",
-            cluster_name="default",
-            uri=URL("job://default/owner/test-job"),
+    def test_job_with_life_span_without_value(
+        self,
+        job_status_formatter: JobStatusFormatter,
+        formatted_resources: str,
+        exited_job_descr: JobDescription,
+    ) -> None:
+        description = replace(exited_job_descr, life_span=0.0)
+
+        status = _unstyle(job_status_formatter(description))
+        assert status == "\n".join(
+            [
+                "Job: test-job",
+                "Owner: test-user",
+                "Cluster: default",
+                "Description: test job description",
+                "Status: failed (ErrorReason)",
+                "Image: test-image",
+                "Command: test-command",
+                formatted_resources,
+                "Life span: no limit",
+                "TTY: False",
+                "Http URL: http://local.host.test/",
+                "Http authentication: True",
+                "Created: 2018-09-25T12:28:21.298672+00:00",
+                "Started: 2018-09-25T12:28:59.759433+00:00",
+                "Finished: 2018-09-25T12:28:59.759433+00:00",
+                "Exit code: 123",
+                "===Description===",
+                "ErrorDesc",
+                "=================",
+            ]
         )
 
-        uri_fmtr = uri_formatter(username="test-user", cluster_name="test-cluster")
-        status = click.unstyle(JobStatusFormatter(uri_formatter=uri_fmtr)(description))
-        resource_formatter = ResourcesFormatter()
-        resource = click.unstyle(resource_formatter(description.container.resources))
-        assert (
-            status == "Job: test-job\n"
-            "Owner: owner\n"
-            "Cluster: default\n"
-            "Description: test job description\n"
-            "Status: pending\n"
-            "Image: test-image\n"
-            "Command: test-command\n"
-            f"{resource}\n"
-            "Preemptible: True\n"
-            "TTY: False\n"
-            "Created: 2018-09-25T12:28:21.298672+00:00"
+    def test_job_with_restart_policy(
+        self,
+        job_status_formatter: JobStatusFormatter,
+        formatted_resources: str,
+        exited_job_descr: JobDescription,
+    ) -> None:
+        description = replace(exited_job_descr, restart_policy=JobRestartPolicy.ALWAYS)
+
+        status = _unstyle(job_status_formatter(description))
+        assert status == "\n".join(
+            [
+                "Job: test-job",
+                "Owner: test-user",
+                "Cluster: default",
+                "Description: test job description",
+                "Status: failed (ErrorReason)",
+                "Image: test-image",
+                "Command: test-command",
+                formatted_resources,
+                "Restart policy: always",
+                "TTY: False",
+                "Http URL: http://local.host.test/",
+                "Http authentication: True",
+                "Created: 2018-09-25T12:28:21.298672+00:00",
+                "Started: 2018-09-25T12:28:59.759433+00:00",
+                "Finished: 2018-09-25T12:28:59.759433+00:00",
+                "Exit code: 123",
+                "===Description===",
+                "ErrorDesc",
+                "=================",
+            ]
         )
 
-    def test_pending_job_with_reason(self) -> None:
-        description = JobDescription(
-            status=JobStatus.PENDING,
-            id="test-job",
-            description="test job description",
-            history=JobStatusHistory(
-                status=JobStatus.PENDING,
-                reason="ContainerCreating",
-                description="",
-                created_at=isoparse("2018-09-25T12:28:21.298672+00:00"),
-                started_at=None,
-                finished_at=None,
-            ),
-            container=Container(
-                image=RemoteImage.new_external_image(name="test-image"),
-                command="test-command",
-                resources=Resources(16, 0.1, 0, None, False, None, None),
-                tty=True,
-            ),
-            ssh_server=URL("ssh-auth"),
-            is_preemptible=True,
+    def test_pending_job_with_reason(
+        self,
+        job_status_formatter: JobStatusFormatter,
+        formatted_resources: str,
+        pending_job: JobDescription,
+    ) -> None:
+        description = replace(
+            pending_job,
             owner="owner",
-            cluster_name="default",
             uri=URL("job://default/owner/test-job"),
-        )
-
-        uri_fmtr = uri_formatter(username="test-user", cluster_name="test-cluster")
-        status = click.unstyle(JobStatusFormatter(uri_formatter=uri_fmtr)(description))
-        resource_formatter = ResourcesFormatter()
-        resource = click.unstyle(resource_formatter(description.container.resources))
-        assert (
-            status == "Job: test-job\n"
-            "Owner: owner\n"
-            "Cluster: default\n"
-            "Description: test job description\n"
-            "Status: pending (ContainerCreating)\n"
-            "Image: test-image\n"
-            "Command: test-command\n"
-            f"{resource}\n"
-            "Preemptible: True\n"
-            "TTY: True\n"
-            "Created: 2018-09-25T12:28:21.298672+00:00"
-        )
-
-    def test_pending_job_no_description(self) -> None:
-        description = JobDescription(
-            status=JobStatus.PENDING,
-            id="test-job",
-            description=None,
-            history=JobStatusHistory(
-                status=JobStatus.PENDING,
+            http_url=URL(),
+            history=replace(
+                pending_job.history,
                 reason="ContainerCreating",
                 description="",
-                created_at=isoparse("2018-09-25T12:28:21.298672+00:00"),
                 started_at=None,
                 finished_at=None,
             ),
-            container=Container(
-                image=RemoteImage.new_external_image(name="test-image"),
-                command="test-command",
-                resources=Resources(16, 0.1, 0, None, False, None, None),
-            ),
-            ssh_server=URL("ssh-auth"),
+            container=replace(pending_job.container, tty=True),
             is_preemptible=True,
-            owner="owner",
-            cluster_name="default",
-            uri=URL("job://default/owner/test-job"),
-        )
-
-        uri_fmtr = uri_formatter(username="test-user", cluster_name="test-cluster")
-        status = click.unstyle(JobStatusFormatter(uri_formatter=uri_fmtr)(description))
-        resource_formatter = ResourcesFormatter()
-        resource = click.unstyle(resource_formatter(description.container.resources))
-        assert (
-            status == "Job: test-job\n"
-            "Owner: owner\n"
-            "Cluster: default\n"
-            "Status: pending (ContainerCreating)\n"
-            "Image: test-image\n"
-            "Command: test-command\n"
-            f"{resource}\n"
-            "Preemptible: True\n"
-            "TTY: False\n"
-            "Created: 2018-09-25T12:28:21.298672+00:00"
-        )
-
-    def test_running_job(self) -> None:
-        description = JobDescription(
-            status=JobStatus.RUNNING,
-            owner="test-user",
-            cluster_name="default",
-            id="test-job",
-            uri=URL("job://default/test-user/test-job"),
-            description="test job description",
-            history=JobStatusHistory(
-                status=JobStatus.RUNNING,
-                reason="ContainerRunning",
-                description="",
-                created_at=isoparse("2018-09-25T12:28:21.298672+00:00"),
-                started_at=isoparse("2018-09-25T12:28:24.759433+00:00"),
-                finished_at=None,
-            ),
-            http_url=URL("http://local.host.test/"),
-            container=Container(
-                command="test-command",
-                image=RemoteImage.new_external_image(name="test-image"),
-                resources=Resources(16, 0.1, 0, None, False, None, None),
-            ),
-            ssh_server=URL("ssh-auth"),
-            is_preemptible=False,
-            internal_hostname="host.local",
         )
 
-        uri_fmtr = uri_formatter(username="test-user", cluster_name="test-cluster")
-        status = click.unstyle(JobStatusFormatter(uri_formatter=uri_fmtr)(description))
-        resource_formatter = ResourcesFormatter()
-        resource = click.unstyle(resource_formatter(description.container.resources))
-        assert (
-            status == "Job: test-job\n"
-            "Owner: test-user\n"
-            "Cluster: default\n"
-            "Description: test job description\n"
-            "Status: running\n"
-            "Image: test-image\n"
-            "Command: test-command\n"
-            f"{resource}\n"
-            "TTY: False\n"
-            "Internal Hostname: host.local\n"
-            "Http URL: http://local.host.test/\n"
-            "Created: 2018-09-25T12:28:21.298672+00:00\n"
-            "Started: 2018-09-25T12:28:24.759433+00:00"
+        status = _unstyle(job_status_formatter(description))
+        assert status == "\n".join(
+            [
+                "Job: test-job",
+                "Owner: owner",
+                "Cluster: default",
+                "Description: test job description",
+                "Status: pending (ContainerCreating)",
+                "Image: test-image",
+                "Command: test-command",
+                formatted_resources,
+                "Preemptible: True",
+                "TTY: True",
+                "Created: 2018-09-25T12:28:21.298672+00:00",
+            ]
         )
 
-    def test_job_with_entrypoint(self) -> None:
-        description = JobDescription(
-            status=JobStatus.RUNNING,
-            owner="test-user",
-            cluster_name="default",
-            id="test-job",
-            uri=URL("job://default/test-user/test-job"),
-            description="test job description",
-            history=JobStatusHistory(
-                status=JobStatus.RUNNING,
+    def test_job_with_entrypoint(
+        self,
+        job_status_formatter: JobStatusFormatter,
+        formatted_resources: str,
+        running_job: JobDescription,
+    ) -> None:
+        description = replace(
+            running_job,
+            history=replace(
+                running_job.history,
                 reason="ContainerRunning",
                 description="",
-                created_at=isoparse("2018-09-25T12:28:21.298672+00:00"),
                 started_at=isoparse("2018-09-25T12:28:24.759433+00:00"),
                 finished_at=None,
             ),
-            http_url=URL("http://local.host.test/"),
-            container=Container(
-                entrypoint="/usr/bin/make",
-                command="test",
-                image=RemoteImage.new_external_image(name="test-image"),
-                resources=Resources(16, 0.1, 0, None, False, None, None),
+            container=replace(
+                running_job.container, command="test", entrypoint="/usr/bin/make"
             ),
-            ssh_server=URL("ssh-auth"),
-            is_preemptible=False,
             internal_hostname="host.local",
         )
 
-        uri_fmtr = uri_formatter(username="test-user", cluster_name="test-cluster")
-        status = click.unstyle(JobStatusFormatter(uri_formatter=uri_fmtr)(description))
-        resource_formatter = ResourcesFormatter()
-        resource = click.unstyle(resource_formatter(description.container.resources))
-        assert (
-            status == "Job: test-job\n"
-            "Owner: test-user\n"
-            "Cluster: default\n"
-            "Description: test job description\n"
-            "Status: running\n"
-            "Image: test-image\n"
-            "Entrypoint: /usr/bin/make\n"
-            "Command: test\n"
-            f"{resource}\n"
-            "TTY: False\n"
-            "Internal Hostname: host.local\n"
-            "Http URL: http://local.host.test/\n"
-            "Created: 2018-09-25T12:28:21.298672+00:00\n"
-            "Started: 2018-09-25T12:28:24.759433+00:00"
+        status = _unstyle(job_status_formatter(description))
+        assert status == "\n".join(
+            [
+                "Job: test-job",
+                "Owner: test-user",
+                "Cluster: default",
+                "Description: test job description",
+                "Status: running",
+                "Image: test-image",
+                "Entrypoint: /usr/bin/make",
+                "Command: test",
+                formatted_resources,
+                "TTY: False",
+                "Internal Hostname: host.local",
+                "Http URL: http://local.host.test/",
+                "Created: 2018-09-25T12:28:21.298672+00:00",
+                "Started: 2018-09-25T12:28:24.759433+00:00",
+            ]
         )
 
-    def test_job_with_environment(self) -> None:
-        description = JobDescription(
-            status=JobStatus.FAILED,
-            owner="test-user",
-            cluster_name="default",
-            id="test-job",
-            uri=URL("job://default/test-user/test-job"),
+    def test_job_with_environment(
+        self,
+        job_status_formatter: JobStatusFormatter,
+        formatted_resources: str,
+        exited_job_descr: JobDescription,
+    ) -> None:
+        description = replace(
+            exited_job_descr,
             name="test-job-name",
-            description="test job description",
-            http_url=URL("http://local.host.test/"),
-            history=JobStatusHistory(
-                status=JobStatus.PENDING,
-                reason="ErrorReason",
-                description="ErrorDesc",
-                created_at=isoparse("2018-09-25T12:28:21.298672+00:00"),
-                started_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-                finished_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-                exit_code=123,
-            ),
-            container=Container(
-                command="test-command",
+            container=replace(
+                exited_job_descr.container,
                 image=RemoteImage.new_neuro_image(
                     name="test-image",
                     tag="sometag",
@@ -803,63 +584,49 @@ class TestJobOutputFormatter:
                     owner="test-user",
                     cluster_name="test-cluster",
                 ),
-                resources=Resources(16, 0.1, 0, None, False, None, None),
-                http=HTTPPort(port=80, requires_auth=True),
                 env={"ENV_NAME_1": "__value1__", "ENV_NAME_2": "**value2**"},
             ),
-            ssh_server=URL("ssh-auth"),
-            is_preemptible=False,
         )
 
-        uri_fmtr = uri_formatter(username="test-user", cluster_name="test-cluster")
-        status = click.unstyle(JobStatusFormatter(uri_formatter=uri_fmtr)(description))
-        resource_formatter = ResourcesFormatter()
-        resource = click.unstyle(resource_formatter(description.container.resources))
-        assert (
-            status == "Job: test-job\n"
-            "Name: test-job-name\n"
-            "Owner: test-user\n"
-            "Cluster: default\n"
-            "Description: test job description\n"
-            "Status: failed (ErrorReason)\n"
-            "Image: image:test-image:sometag\n"
-            "Command: test-command\n"
-            f"{resource}\n"
-            "TTY: False\n"
-            "Http URL: http://local.host.test/\n"
-            "Http authentication: True\n"
-            "Environment:\n"
-            "  ENV_NAME_1=__value1__\n"
-            "  ENV_NAME_2=**value2**\n"
-            "Created: 2018-09-25T12:28:21.298672+00:00\n"
-            "Started: 2018-09-25T12:28:59.759433+00:00\n"
-            "Finished: 2018-09-25T12:28:59.759433+00:00\n"
-            "Exit code: 123\n"
-            "===Description===\n"
-            "ErrorDesc\n================="
+        status = _unstyle(job_status_formatter(description))
+        assert status == "\n".join(
+            [
+                "Job: test-job",
+                "Name: test-job-name",
+                "Owner: test-user",
+                "Cluster: default",
+                "Description: test job description",
+                "Status: failed (ErrorReason)",
+                "Image: image:test-image:sometag",
+                "Command: test-command",
+                formatted_resources,
+                "TTY: False",
+                "Http URL: http://local.host.test/",
+                "Http authentication: True",
+                "Environment:",
+                "  ENV_NAME_1=__value1__",
+                "  ENV_NAME_2=**value2**",
+                "Created: 2018-09-25T12:28:21.298672+00:00",
+                "Started: 2018-09-25T12:28:59.759433+00:00",
+                "Finished: 2018-09-25T12:28:59.759433+00:00",
+                "Exit code: 123",
+                "===Description===",
+                "ErrorDesc",
+                "=================",
+            ]
         )
 
-    def test_job_with_volumes_short(self) -> None:
-        description = JobDescription(
-            status=JobStatus.FAILED,
-            owner="test-user",
-            cluster_name="default",
-            id="test-job",
-            uri=URL("job://default/test-user/test-job"),
+    def test_job_with_volumes_short(
+        self,
+        job_status_formatter: JobStatusFormatter,
+        formatted_resources: str,
+        exited_job_descr: JobDescription,
+    ) -> None:
+        description = replace(
+            exited_job_descr,
             name="test-job-name",
-            description="test job description",
-            http_url=URL("http://local.host.test/"),
-            history=JobStatusHistory(
-                status=JobStatus.PENDING,
-                reason="ErrorReason",
-                description="ErrorDesc",
-                created_at=isoparse("2018-09-25T12:28:21.298672+00:00"),
-                started_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-                finished_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-                exit_code=123,
-            ),
-            container=Container(
-                command="test-command",
+            container=replace(
+                exited_job_descr.container,
                 image=RemoteImage.new_neuro_image(
                     name="test-image",
                     tag="sometag",
@@ -867,8 +634,6 @@ class TestJobOutputFormatter:
                     owner="test-user",
                     cluster_name="test-cluster",
                 ),
-                resources=Resources(16, 0.1, 0, None, False, None, None),
-                http=HTTPPort(port=80, requires_auth=True),
                 volumes=[
                     Volume(
                         storage_uri=URL("storage://test-cluster/otheruser/_ro_"),
@@ -887,60 +652,45 @@ class TestJobOutputFormatter:
                     ),
                 ],
             ),
-            ssh_server=URL("ssh-auth"),
-            is_preemptible=False,
         )
 
-        uri_fmtr = uri_formatter(username="test-user", cluster_name="test-cluster")
-        status = click.unstyle(JobStatusFormatter(uri_formatter=uri_fmtr)(description))
-        resource_formatter = ResourcesFormatter()
-        resource = click.unstyle(resource_formatter(description.container.resources))
-        assert (
-            status == "Job: test-job\n"
-            "Name: test-job-name\n"
-            "Owner: test-user\n"
-            "Cluster: default\n"
-            "Description: test job description\n"
-            "Status: failed (ErrorReason)\n"
-            "Image: image:test-image:sometag\n"
-            "Command: test-command\n"
-            f"{resource}\n"
-            "TTY: False\n"
-            "Volumes:\n"
-            "  /mnt/_ro_  storage:/otheruser/_ro_              READONLY\n"
-            "  /mnt/rw    storage:rw                                   \n"
-            "  /mnt/ro    storage://othercluster/otheruser/ro  READONLY\n"
-            "Http URL: http://local.host.test/\n"
-            "Http authentication: True\n"
-            "Created: 2018-09-25T12:28:21.298672+00:00\n"
-            "Started: 2018-09-25T12:28:59.759433+00:00\n"
-            "Finished: 2018-09-25T12:28:59.759433+00:00\n"
-            "Exit code: 123\n"
-            "===Description===\n"
-            "ErrorDesc\n================="
+        status = _unstyle(job_status_formatter(description))
+        assert status == "\n".join(
+            [
+                "Job: test-job",
+                "Name: test-job-name",
+                "Owner: test-user",
+                "Cluster: default",
+                "Description: test job description",
+                "Status: failed (ErrorReason)",
+                "Image: image:test-image:sometag",
+                "Command: test-command",
+                formatted_resources,
+                "TTY: False",
+                "Volumes:",
+                "  /mnt/_ro_  storage:/otheruser/_ro_              READONLY",
+                "  /mnt/rw    storage:rw                                   ",
+                "  /mnt/ro    storage://othercluster/otheruser/ro  READONLY",
+                "Http URL: http://local.host.test/",
+                "Http authentication: True",
+                "Created: 2018-09-25T12:28:21.298672+00:00",
+                "Started: 2018-09-25T12:28:59.759433+00:00",
+                "Finished: 2018-09-25T12:28:59.759433+00:00",
+                "Exit code: 123",
+                "===Description===",
+                "ErrorDesc",
+                "=================",
+            ]
         )
 
-    def test_job_with_volumes_long(self) -> None:
-        description = JobDescription(
-            status=JobStatus.FAILED,
-            owner="test-user",
-            cluster_name="default",
-            id="test-job",
-            uri=URL("job://default/test-user/test-job"),
+    def test_job_with_volumes_long(
+        self, formatted_resources: str, exited_job_descr: JobDescription
+    ) -> None:
+        description = replace(
+            exited_job_descr,
             name="test-job-name",
-            description="test job description",
-            http_url=URL("http://local.host.test/"),
-            history=JobStatusHistory(
-                status=JobStatus.PENDING,
-                reason="ErrorReason",
-                description="ErrorDesc",
-                created_at=isoparse("2018-09-25T12:28:21.298672+00:00"),
-                started_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-                finished_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-                exit_code=123,
-            ),
-            container=Container(
-                command="test-command",
+            container=replace(
+                exited_job_descr.container,
                 image=RemoteImage.new_neuro_image(
                     name="test-image",
                     tag="sometag",
@@ -948,8 +698,6 @@ class TestJobOutputFormatter:
                     owner="test-user",
                     cluster_name="test-cluster",
                 ),
-                resources=Resources(16, 0.1, 0, None, False, None, None),
-                http=HTTPPort(port=80, requires_auth=True),
                 volumes=[
                     Volume(
                         storage_uri=URL("storage://test-cluster/otheruser/ro"),
@@ -963,35 +711,34 @@ class TestJobOutputFormatter:
                     ),
                 ],
             ),
-            ssh_server=URL("ssh-auth"),
-            is_preemptible=False,
         )
 
-        status = click.unstyle(JobStatusFormatter(uri_formatter=str)(description))
-        resource_formatter = ResourcesFormatter()
-        resource = click.unstyle(resource_formatter(description.container.resources))
-        assert (
-            status == "Job: test-job\n"
-            "Name: test-job-name\n"
-            "Owner: test-user\n"
-            "Cluster: default\n"
-            "Description: test job description\n"
-            "Status: failed (ErrorReason)\n"
-            "Image: image://test-cluster/test-user/test-image:sometag\n"
-            "Command: test-command\n"
-            f"{resource}\n"
-            "TTY: False\n"
-            "Volumes:\n"
-            "  /mnt/ro  storage://test-cluster/otheruser/ro  READONLY\n"
-            "  /mnt/rw  storage://test-cluster/test-user/rw          \n"
-            "Http URL: http://local.host.test/\n"
-            "Http authentication: True\n"
-            "Created: 2018-09-25T12:28:21.298672+00:00\n"
-            "Started: 2018-09-25T12:28:59.759433+00:00\n"
-            "Finished: 2018-09-25T12:28:59.759433+00:00\n"
-            "Exit code: 123\n"
-            "===Description===\n"
-            "ErrorDesc\n================="
+        status = _unstyle(JobStatusFormatter(uri_formatter=str)(description))
+        assert status == "\n".join(
+            [
+                "Job: test-job",
+                "Name: test-job-name",
+                "Owner: test-user",
+                "Cluster: default",
+                "Description: test job description",
+                "Status: failed (ErrorReason)",
+                "Image: image://test-cluster/test-user/test-image:sometag",
+                "Command: test-command",
+                formatted_resources,
+                "TTY: False",
+                "Volumes:",
+                "  /mnt/ro  storage://test-cluster/otheruser/ro  READONLY",
+                "  /mnt/rw  storage://test-cluster/test-user/rw          ",
+                "Http URL: http://local.host.test/",
+                "Http authentication: True",
+                "Created: 2018-09-25T12:28:21.298672+00:00",
+                "Started: 2018-09-25T12:28:59.759433+00:00",
+                "Finished: 2018-09-25T12:28:59.759433+00:00",
+                "Exit code: 123",
+                "===Description===",
+                "ErrorDesc",
+                "=================",
+            ]
         )
 
 
@@ -999,18 +746,14 @@ class TestJobTelemetryFormatter:
     def _format(
         self, timestamp: str, cpu: str, mem: str, gpu: str, gpu_mem: str
     ) -> str:
-        return "\t".join(
-            [
-                f"{timestamp:<24}",
-                f"{cpu:<15}",
-                f"{mem:<15}",
-                f"{gpu:<15}",
-                f"{gpu_mem:<15}",
-            ]
+        return _TELEMETRY_ROW_FMT.format(
+            timestamp=timestamp, cpu=cpu, mem=mem, gpu=gpu, gpu_mem=gpu_mem
         )
 
-    def test_format_header_line(self) -> None:
-        line = JobTelemetryFormatter().header()
+    def test_format_header_line(
+        self, job_telemetry_formatter: JobTelemetryFormatter
+    ) -> None:
+        line = job_telemetry_formatter.header()
         assert line == self._format(
             timestamp="TIMESTAMP",
             cpu="CPU",
@@ -1019,22 +762,24 @@ class TestJobTelemetryFormatter:
             gpu_mem="GPU_MEMORY (MB)",
         )
 
-    def test_format_telemetry_line_no_gpu(self) -> None:
-        formatter = JobTelemetryFormatter()
+    def test_format_telemetry_line_no_gpu(
+        self, job_telemetry_formatter: JobTelemetryFormatter
+    ) -> None:
         # NOTE: the timestamp_str encodes the local timezone
         timestamp = 1_517_248_466.238_723_6
-        timestamp_str = formatter._format_timestamp(timestamp)
+        timestamp_str = job_telemetry_formatter._format_timestamp(timestamp)
         telemetry = JobTelemetry(cpu=0.12345, memory=256.123, timestamp=timestamp)
-        line = JobTelemetryFormatter()(telemetry)
+        line = job_telemetry_formatter(telemetry)
         assert line == self._format(
             timestamp=timestamp_str, cpu="0.123", mem="256.123", gpu="0", gpu_mem="0"
         )
 
-    def test_format_telemetry_line_with_gpu(self) -> None:
-        formatter = JobTelemetryFormatter()
+    def test_format_telemetry_line_with_gpu(
+        self, job_telemetry_formatter: JobTelemetryFormatter
+    ) -> None:
         # NOTE: the timestamp_str encodes the local timezone
         timestamp = 1_517_248_466
-        timestamp_str = formatter._format_timestamp(timestamp)
+        timestamp_str = job_telemetry_formatter._format_timestamp(timestamp)
         telemetry = JobTelemetry(
             cpu=0.12345,
             memory=256.1234,
@@ -1042,13 +787,13 @@ class TestJobTelemetryFormatter:
             gpu_duty_cycle=99,
             gpu_memory=64.5,
         )
-        line = formatter(telemetry)
+        line = job_telemetry_formatter(telemetry)
         assert line == self._format(
             timestamp=timestamp_str,
             cpu="0.123",
             mem="256.123",
             gpu="99",
-            gpu_mem=f"64.500",
+            gpu_mem="64.500",
         )
 
 
@@ -1091,57 +836,28 @@ class TestJobStatusFormatter:
 class TestSimpleJobsFormatter:
     def test_empty(self) -> None:
         formatter = SimpleJobsFormatter()
-        result = [item for item in formatter([])]
+        result = list(formatter([]))
         assert result == []
 
-    def test_list(self) -> None:
+    def test_list(
+        self, job_descr_no_name: JobDescription, job_descr: JobDescription
+    ) -> None:
         jobs = [
-            JobDescription(
-                status=JobStatus.PENDING,
+            replace(
+                job_descr_no_name,
                 id="job-42687e7c-6c76-4857-a6a7-1166f8295391",
-                owner="owner",
-                cluster_name="default",
                 uri=URL("job://default/owner/job-42687e7c-6c76-4857-a6a7-1166f8295391"),
-                history=JobStatusHistory(
-                    status=JobStatus.PENDING,
-                    reason="ErrorReason",
-                    description="ErrorDesc",
-                    created_at=isoparse("2018-09-25T12:28:21.298672+00:00"),
-                    started_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-                    finished_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-                ),
-                container=Container(
-                    image=RemoteImage.new_external_image(name="ubuntu", tag="latest"),
-                    resources=Resources(16, 0.1, 0, None, False, None, None),
-                ),
-                ssh_server=URL("ssh-auth"),
-                is_preemptible=True,
             ),
-            JobDescription(
-                status=JobStatus.PENDING,
+            replace(
+                job_descr,
                 id="job-cf33bd55-9e3b-4df7-a894-9c148a908a66",
                 name="this-job-has-a-name",
-                owner="owner",
-                cluster_name="default",
                 uri=URL("job://default/owner/job-cf33bd55-9e3b-4df7-a894-9c148a908a66"),
-                history=JobStatusHistory(
-                    status=JobStatus.FAILED,
-                    reason="ErrorReason",
-                    description="ErrorDesc",
-                    created_at=isoparse("2018-09-25T12:28:21.298672+00:00"),
-                    started_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-                    finished_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-                ),
-                container=Container(
-                    image=RemoteImage.new_external_image(name="ubuntu", tag="latest"),
-                    resources=Resources(16, 0.1, 0, None, False, None, None),
-                ),
-                ssh_server=URL("ssh-auth"),
-                is_preemptible=True,
+                history=replace(job_descr.history, status=JobStatus.FAILED),
             ),
         ]
         formatter = SimpleJobsFormatter()
-        result = [item for item in formatter(jobs)]
+        result = list(formatter(jobs))
         assert result == [
             "job-42687e7c-6c76-4857-a6a7-1166f8295391",
             "job-cf33bd55-9e3b-4df7-a894-9c148a908a66",
@@ -1149,52 +865,62 @@ class TestSimpleJobsFormatter:
 
 
 class TestTabularJobRow:
-    image_parser = _ImageNameParser(
-        "bob", "test-cluster", URL("https://registry-test.neu.ro")
-    )
-
-    def _job_descr_with_status(
-        self, status: JobStatus, image: str = "nginx:latest", name: Optional[str] = None
-    ) -> JobDescription:
-        remote_image = self.image_parser.parse_remote(image)
-        return JobDescription(
-            status=status,
+    @pytest.fixture
+    def job_factory(
+        self, image_parser: _ImageNameParser, container_factory: _MakeContainer
+    ) -> Callable[..., JobDescription]:
+        base = JobDescription(
+            status=JobStatus.PENDING,
             id="job-1f5ab792-e534-4bb4-be56-8af1ce722692",
-            name=name,
             owner="owner",
             cluster_name="default",
             uri=URL("job://default/owner/job-1f5ab792-e534-4bb4-be56-8af1ce722692"),
             description="some",
             history=JobStatusHistory(
-                status=status,
+                status=JobStatus.PENDING,
                 reason="ErrorReason",
                 description="ErrorDesc",
                 created_at=isoparse("2017-01-02T12:28:21.298672+00:00"),
                 started_at=isoparse("2017-02-03T12:28:59.759433+00:00"),
                 finished_at=isoparse("2017-03-04T12:28:59.759433+00:00"),
             ),
-            container=Container(
-                image=remote_image,
-                resources=Resources(16, 0.1, 0, None, False, None, None),
-                command="ls",
+            container=container_factory(
+                image=image_parser.parse_remote("nginx:latest"), command="ls"
             ),
-            ssh_server=URL("ssh-auth"),
+            ssh_server=_SSH_SERVER,
             is_preemptible=True,
         )
 
-    def test_with_job_name(self) -> None:
+        def _job_factory(
+            *,
+            status: JobStatus,
+            image: Optional[str] = None,
+            name: Optional[str] = None,
+        ) -> JobDescription:
+            container = base.container
+            if image is not None:
+                container = replace(container, image=image_parser.parse_remote(image))
+            return replace(
+                base,
+                status=status,
+                name=name,
+                history=replace(base.history, status=status),
+                container=container,
+            )
+
+        return _job_factory
+
+    def test_with_job_name(self, job_factory: Callable[..., JobDescription]) -> None:
         row = TabularJobRow.from_job(
-            self._job_descr_with_status(JobStatus.RUNNING, name="job-name"),
+            job_factory(status=JobStatus.RUNNING, name="job-name"),
             "owner",
             image_formatter=str,
         )
         assert row.name == "job-name"
 
-    def test_without_job_name(self) -> None:
+    def test_without_job_name(self, job_factory: Callable[..., JobDescription]) -> None:
         row = TabularJobRow.from_job(
-            self._job_descr_with_status(JobStatus.RUNNING, name=None),
-            "owner",
-            image_formatter=str,
+            job_factory(status=JobStatus.RUNNING), "owner", image_formatter=str,
         )
         assert row.name == ""
 
@@ -1206,20 +932,26 @@ class TestTabularJobRow:
             (JobStatus.FAILED, "Mar 04 2017"),
             (JobStatus.SUCCEEDED, "Mar 04 2017"),
         ],
+        ids=["pending", "running", "failed", "succeeded"],
     )
-    def test_status_date_relation(self, status: JobStatus, date: str) -> None:
+    def test_status_date_relation(
+        self, job_factory: Callable[..., JobDescription], status: JobStatus, date: str,
+    ) -> None:
         row = TabularJobRow.from_job(
-            self._job_descr_with_status(status), "owner", image_formatter=str
+            job_factory(status=status), "owner", image_formatter=str
         )
         assert row.status == f"{status}"
         assert row.when == date
 
-    def test_image_from_registry_parsing_short(self) -> None:
+    def test_image_from_registry_parsing_short(
+        self, job_factory: Callable[..., JobDescription]
+    ) -> None:
         uri_fmtr = uri_formatter(username="bob", cluster_name="test-cluster")
         image_fmtr = image_formatter(uri_formatter=uri_fmtr)
         row = TabularJobRow.from_job(
-            self._job_descr_with_status(
-                JobStatus.PENDING, "registry-test.neu.ro/bob/swiss-box:red",
+            job_factory(
+                status=JobStatus.PENDING,
+                image="registry-test.neu.ro/bob/swiss-box:red",
             ),
             "bob",
             image_formatter=image_fmtr,
@@ -1227,10 +959,13 @@ class TestTabularJobRow:
         assert row.image == "image:swiss-box:red"
         assert row.name == ""
 
-    def test_image_from_registry_parsing_long(self) -> None:
+    def test_image_from_registry_parsing_long(
+        self, job_factory: Callable[..., JobDescription]
+    ) -> None:
         row = TabularJobRow.from_job(
-            self._job_descr_with_status(
-                JobStatus.PENDING, "registry-test.neu.ro/bob/swiss-box:red",
+            job_factory(
+                status=JobStatus.PENDING,
+                image="registry-test.neu.ro/bob/swiss-box:red",
             ),
             "owner",
             image_formatter=str,
@@ -1251,185 +986,112 @@ class TestTabularJobsFormatter:
         "DESCRIPTION",
         "COMMAND",
     ]
-    image_parser = _ImageNameParser(
-        "bob", "test-cluster", URL("https://registry-test.neu.ro")
-    )
 
     def test_empty(self) -> None:
         formatter = TabularJobsFormatter(
             0, "owner", parse_columns(None), image_formatter=str
         )
-        result = [item for item in formatter([])]
+        result = list(formatter([]))
         assert result == ["  ".join(self.columns)]
 
     def test_width_cutting(self) -> None:
         formatter = TabularJobsFormatter(
             10, "owner", parse_columns(None), image_formatter=str
         )
-        result = [item for item in formatter([])]
+        result = list(formatter([]))
         assert result == ["  ".join(self.columns)[:10]]
 
-    @pytest.mark.parametrize(
-        "owner_name,owner_printed", [("owner", "<you>"), ("alice", "alice")]
-    )
-    def test_short_cells(self, owner_name: str, owner_printed: str) -> None:
-        job = JobDescription(
+    @pytest.fixture
+    def frozen_now(self, monkeypatch: Any) -> datetime:
+        frozen = datetime(2020, 9, 13, 12, 26, 40, tzinfo=timezone.utc)
+        monkeypatch.setattr("neuromation.cli.formatters.jobs._now", lambda: frozen)
+        return frozen
+
+    @pytest.fixture
+    def short_job(
+        self, base_history: JobStatusHistory, container_factory: _MakeContainer
+    ) -> JobDescription:
+        return JobDescription(
             status=JobStatus.FAILED,
             id="j",
-            owner=owner_name,
+            owner="owner",
             cluster_name="dc",
-            uri=URL(f"job://dc/{owner_name}/j"),
+            uri=URL("job://dc/owner/j"),
             name="name",
             description="d",
-            history=JobStatusHistory(
-                status=JobStatus.FAILED,
-                reason="ErrorReason",
-                description="ErrorDesc",
-                created_at=isoparse("2018-09-25T12:28:21.298672+00:00"),
-                started_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-                finished_at=datetime.now(timezone.utc) - timedelta(seconds=1),
+            history=replace(base_history, status=JobStatus.FAILED),
+            container=container_factory(
+                image=RemoteImage.new_external_image(name="i", tag="l"), command="c"
             ),
-            container=Container(
-                image=RemoteImage.new_external_image(name="i", tag="l"),
-                resources=Resources(16, 0.1, 0, None, False, None, None),
-                command="c",
-            ),
-            ssh_server=URL("ssh-auth"),
+            ssh_server=_SSH_SERVER,
             is_preemptible=True,
         )
+
+    @pytest.mark.parametrize(
+        "owner_name,owner_printed", [("owner", "<you>"), ("alice", "alice")]
+    )
+    def test_short_cells(
+        self,
+        owner_name: str,
+        owner_printed: str,
+        frozen_now: datetime,
+        short_job: JobDescription,
+    ) -> None:
+        job = replace(
+            short_job,
+            owner=owner_name,
+            uri=URL(f"job://dc/{owner_name}/j"),
+            history=replace(
+                short_job.history, finished_at=frozen_now - timedelta(seconds=1)
+            ),
+        )
         formatter = TabularJobsFormatter(
             0, "owner", parse_columns(None), image_formatter=str
         )
-        result = [item.rstrip() for item in formatter([job])]
-        assert result in [
-            [
-                "ID  NAME  STATUS  WHEN  IMAGE  OWNER  CLUSTER  DESCRIPTION  COMMAND",
-                f"j   name  failed  now   i:l    {owner_printed}  dc       d            c",  # noqa: E501
-            ],
-            [
-                "ID  NAME  STATUS  WHEN          IMAGE  OWNER  CLUSTER  DESCRIPTION  COMMAND",  # noqa: E501
-                f"j   name  failed  a second ago  i:l    {owner_printed}  dc       d            c",  # noqa: E501
-            ],
-            [
-                "ID  NAME  STATUS  WHEN           IMAGE  OWNER  CLUSTER  DESCRIPTION  COMMAND",  # noqa: E501
-                f"j   name  failed  2 seconds ago  i:l    {owner_printed}  dc       d            c",  # noqa: E501
-            ],
+        result = list(map(str.rstrip, formatter([job])))
+        assert result == [
+            "ID  NAME  STATUS  WHEN          IMAGE  OWNER  CLUSTER  DESCRIPTION  COMMAND",  # noqa: E501
+            f"j   name  failed  a second ago  i:l    {owner_printed}  dc       d            c",  # noqa: E501
         ]
 
     @pytest.mark.parametrize(
         "owner_name,owner_printed", [("owner", "<you>"), ("alice", "alice")]
     )
-    def test_wide_cells(self, owner_name: str, owner_printed: str) -> None:
+    def test_wide_cells(
+        self, owner_name: str, owner_printed: str, wide_jobs: List[JobDescription]
+    ) -> None:
         jobs = [
-            JobDescription(
-                status=JobStatus.FAILED,
-                id="job-7ee153a7-249c-4be9-965a-ba3eafb67c82",
-                name="name1",
-                owner=owner_name,
-                cluster_name="default",
-                uri=URL(
-                    f"job://default/{owner_name}/"
-                    f"job-7ee153a7-249c-4be9-965a-ba3eafb67c82"
-                ),
-                description="some description long long long long",
-                history=JobStatusHistory(
-                    status=JobStatus.FAILED,
-                    reason="ErrorReason",
-                    description="ErrorDesc",
-                    created_at=isoparse("2018-09-25T12:28:21.298672+00:00"),
-                    started_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-                    finished_at=isoparse("2017-09-25T12:28:59.759433+00:00"),
-                ),
-                container=Container(
-                    image=RemoteImage.new_external_image(
-                        name="some-image-name", tag="with-long-tag"
-                    ),
-                    resources=Resources(16, 0.1, 0, None, False, None, None),
-                    command="ls -la /some/path",
-                ),
-                ssh_server=URL("ssh-auth"),
-                is_preemptible=True,
-            ),
-            JobDescription(
-                status=JobStatus.PENDING,
-                id="job-7ee153a7-249c-4be9-965a-ba3eafb67c84",
-                name="name2",
-                owner=owner_name,
-                cluster_name="default",
-                uri=URL(
-                    f"job://default/{owner_name}/"
-                    f"job-7ee153a7-249c-4be9-965a-ba3eafb67c84"
-                ),
-                description="some description",
-                history=JobStatusHistory(
-                    status=JobStatus.PENDING,
-                    reason="",
-                    description="",
-                    created_at=isoparse("2017-09-25T12:28:21.298672+00:00"),
-                    started_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
-                    finished_at=isoparse("2017-09-25T12:28:59.759433+00:00"),
-                ),
-                container=Container(
-                    image=RemoteImage.new_neuro_image(
-                        name="some-image-name",
-                        tag="with-long-tag",
-                        registry="https://registry.neu.ro",
-                        owner="bob",
-                        cluster_name="test-cluster",
-                    ),
-                    resources=Resources(16, 0.1, 0, None, False, None, None),
-                    command="ls -la /some/path",
-                ),
-                ssh_server=URL("ssh-auth"),
-                is_preemptible=True,
-            ),
+            replace(
+                job, owner=owner_name, uri=URL(f"job://default/{owner_name}/{job.id}"),
+            )
+            for job in wide_jobs
         ]
         formatter = TabularJobsFormatter(
             0, "owner", parse_columns(None), image_formatter=str
         )
-        result = [item.rstrip() for item in formatter(jobs)]
+        result = list(map(str.rstrip, formatter(jobs)))
         assert result == [
-            f"ID                                        NAME   STATUS   WHEN         IMAGE                                     OWNER  CLUSTER  DESCRIPTION                           COMMAND",  # noqa: E501
-            f"job-7ee153a7-249c-4be9-965a-ba3eafb67c82  name1  failed   Sep 25 2017  some-image-name:with-long-tag             {owner_printed}  default  some description long long long long  ls -la /some/path",  # noqa: E501
-            f"job-7ee153a7-249c-4be9-965a-ba3eafb67c84  name2  pending  Sep 25 2017  image://test-cluster/bob/some-image-      {owner_printed}  default  some description                      ls -la /some/path",  # noqa: E501
-            f"                                                                       name:with-long-tag",  # noqa: E501
+            line.format(owner=owner_printed) for line in _WIDE_CELLS_EXPECTED
         ]
 
-    def test_custol_columns(self) -> None:
-        job = JobDescription(
-            status=JobStatus.FAILED,
-            id="j",
-            owner="owner",
-            cluster_name="dc",
-            uri=URL("job://dc/owner/j"),
-            name="name",
-            description="d",
-            history=JobStatusHistory(
-                status=JobStatus.FAILED,
-                reason="ErrorReason",
-                description="ErrorDesc",
-                created_at=isoparse("2018-09-25T12:28:21.298672+00:00"),
-                started_at=isoparse("2018-09-25T12:28:59.759433+00:00"),
+    def test_custol_columns(self, short_job: JobDescription) -> None:
+        job = replace(
+            short_job,
+            history=replace(
+                short_job.history,
                 finished_at=datetime.now(timezone.utc) - timedelta(seconds=1),
             ),
-            container=Container(
-                image=RemoteImage.new_external_image(name="i", tag="l"),
-                resources=Resources(16, 0.1, 0, None, False, None, None),
-                command="c",
-            ),
-            ssh_server=URL("ssh-auth"),
-            is_preemptible=True,
         )
 
         columns = parse_columns("{status;align=right;min=20;Status Code}")
         formatter = TabularJobsFormatter(0, "owner", columns, image_formatter=str)
-        result = [item.rstrip() for item in formatter([job])]
+        result = list(map(str.rstrip, formatter([job])))
 
         assert result == ["         Status Code", "              failed"]
 
 
 class TestResourcesFormatter:
-    def test_tiny_container(self) -> None:
+    def test_tiny_container(self, resources_formatter: ResourcesFormatter) -> None:
         resources = Resources(
             cpu=0.1,
             gpu=0,
@@ -1439,12 +1101,11 @@ class TestResourcesFormatter:
             tpu_type=None,
             tpu_software_version=None,
         )
-        resource_formatter = ResourcesFormatter()
-        assert click.unstyle(resource_formatter(resources)) == (
-            "Resources:\n" "  Memory: 16.0M\n" "  CPU: 0.1"
+        assert _unstyle(resources_formatter(resources)) == "\n".join(
+            ["Resources:", "  Memory: 16.0M", "  CPU: 0.1"]
         )
 
-    def test_gpu_container(self) -> None:
+    def test_gpu_container(self, resources_formatter: ResourcesFormatter) -> None:
         resources = Resources(
             cpu=2,
             gpu=1,
@@ -1454,15 +1115,16 @@ class TestResourcesFormatter:
             tpu_type=None,
             tpu_software_version=None,
         )
-        resource_formatter = ResourcesFormatter()
-        assert click.unstyle(resource_formatter(resources)) == (
-            "Resources:\n"
-            "  Memory: 1.0G\n"
-            "  CPU: 2.0\n"
-            "  GPU: 1.0 x nvidia-tesla-p4"
+        assert _unstyle(resources_formatter(resources)) == "\n".join(
+            [
+                "Resources:",
+                "  Memory: 1.0G",
+                "  CPU: 2.0",
+                "  GPU: 1.0 x nvidia-tesla-p4",
+            ]
         )
 
-    def test_shm_container(self) -> None:
+    def test_shm_container(self, resources_formatter: ResourcesFormatter) -> None:
         resources = Resources(
             cpu=0.1,
             gpu=0,
@@ -1472,15 +1134,16 @@ class TestResourcesFormatter:
             tpu_type=None,
             tpu_software_version=None,
         )
-        resource_formatter = ResourcesFormatter()
-        assert click.unstyle(resource_formatter(resources)) == (
-            "Resources:\n"
-            "  Memory: 16.0M\n"
-            "  CPU: 0.1\n"
-            "  Additional: Extended SHM space"
+        assert _unstyle(resources_formatter(resources)) == "\n".join(
+            [
+                "Resources:",
+                "  Memory: 16.0M",
+                "  CPU: 0.1",
+                "  Additional: Extended SHM space",
+            ]
         )
 
-    def test_tpu_container(self) -> None:
+    def test_tpu_container(self, resources_formatter: ResourcesFormatter) -> None:
         resources = Resources(
             cpu=0.1,
             gpu=0,
@@ -1490,11 +1153,12 @@ class TestResourcesFormatter:
             tpu_type="v2-8",
             tpu_software_version="1.14",
         )
-        resource_formatter = ResourcesFormatter()
-        assert click.unstyle(resource_formatter(resources=resources)) == (
-            "Resources:\n"
-            "  Memory: 16.0M\n"
-            "  CPU: 0.1\n"
-            "  TPU: v2-8/1.14\n"
-            "  Additional: Extended SHM space"
+        assert _unstyle(resources_formatter(resources=resources)) == "\n".join(
+            [
+                "Resources:",
+                "  Memory: 16.0M",
+                "  CPU: 0.1",
+                "  TPU: v2-8/1.14",
+                "  Additional: Extended SHM space",
+            ]
         )
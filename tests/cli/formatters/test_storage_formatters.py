@@ -1,5 +1,5 @@
 import time
-from typing import Any, List
+from typing import Any, Callable, Dict, List, Tuple, Type
 
 import click
 import pytest
@@ -7,6 +7,7 @@ import pytest
 from neuromation.api import Action, FileStatus, FileStatusType
 from neuromation.cli.formatters.storage import (
     BaseFilesFormatter,
+    BasePainter,
     BSDAttributes,
     BSDPainter,
     FilesSorter,
@@ -21,15 +22,75 @@ from neuromation.cli.formatters.storage import (
 )
 
 
+def _timestamp(value: str) -> int:
+    return int(time.mktime(time.strptime(value, "%Y-%m-%d %H:%M:%S")))
+
+
+_JAN_1_2018_TS = _timestamp("2018-01-01 03:00:00")
+
+# Expected BSDPainter output, styled once at import time
+_BLUE_TMP = click.style("tmp", fg="blue")
+_BOLD_BLUE_ON_BLACK_TMP = click.style("tmp", fg="blue", bg="black", bold=True)
+_UNDERLINED_FILE = click.style("test.txt", underline=True)
+_UNDERLINED_BLUE_TMP = click.style("tmp", fg="blue", underline=True)
+_UNDERLINED_BOLD_BLUE_ON_BLACK_TMP = click.style(
+    "tmp", fg="blue", bg="black", bold=True, underline=True
+)
+
+
+_ESCAPE_CASES: Dict[str, List[Tuple[str, str]]] = {
+    "simple": [
+        ("\\a", "\a"),
+        ("\\b", "\b"),
+        ("\\e", chr(27)),
+        ("\\f", "\f"),
+        ("\\n", "\n"),
+        ("\\r", "\r"),
+        ("\\t", "\t"),
+        ("\\v", "\v"),
+        ("\\?", chr(127)),
+        ("\\_", " "),
+        ("a\\n", "a\n"),
+        ("a\\tb", "a\tb"),
+        ("a\\t\\rb", "a\t\rb"),
+        ("a\\=b", "a=b"),
+    ],
+    "octal": [
+        ("\\7", chr(7)),
+        ("\\8", "8"),
+        ("\\10", chr(8)),
+        ("a\\2", "a" + chr(2)),
+        ("a\\2b", "a" + chr(2) + "b"),
+    ],
+    "hex": [
+        ("\\x7", chr(0x7)),
+        ("\\x8", chr(0x8)),
+        ("\\x10", chr(0x10)),
+        ("\\XaA", chr(0xAA)),
+        ("a\\x222", "a" + chr(0x22) + "2"),
+        ("a\\x2z", "a" + chr(0x2) + "z"),
+    ],
+    "caret": [
+        ("^a", chr(1)),
+        ("^?", chr(127)),
+        ("^z", chr(26)),
+        ("a^Z", "a" + chr(26)),
+        ("a^Zb", "a" + chr(26) + "b"),
+    ],
+}
+
+_ESCAPES = [
+    pytest.param(escaped, result, id=f"{category}-{index}")
+    for category, escapes in _ESCAPE_CASES.items()
+    for index, (escaped, result) in enumerate(escapes)
+]
+
+
 class TestNonePainter:
     def test_simple(self) -> None:
         painter = NonePainter()
         file = FileStatus(
-            "File1",
-            2048,
-            FileStatusType.FILE,
-            int(time.mktime(time.strptime("2018-01-01 03:00:00", "%Y-%m-%d %H:%M:%S"))),
-            Action.READ,
+            "File1", 2048, FileStatusType.FILE, _JAN_1_2018_TS, Action.READ,
         )
         assert painter.paint(file.name, file.type) == file.name
 
@@ -38,161 +99,63 @@ class TestQuotedPainter:
     def test_simple(self) -> None:
         painter = QuotedPainter()
         file = FileStatus(
-            "File1",
-            2048,
-            FileStatusType.FILE,
-            int(time.mktime(time.strptime("2018-01-01 03:00:00", "%Y-%m-%d %H:%M:%S"))),
-            Action.READ,
+            "File1", 2048, FileStatusType.FILE, _JAN_1_2018_TS, Action.READ,
         )
         assert painter.paint(file.name, file.type) == "'File1'"
 
     def test_has_quote(self) -> None:
         painter = QuotedPainter()
         file = FileStatus(
-            "File1'2",
-            2048,
-            FileStatusType.FILE,
-            int(time.mktime(time.strptime("2018-01-01 03:00:00", "%Y-%m-%d %H:%M:%S"))),
-            Action.READ,
+            "File1'2", 2048, FileStatusType.FILE, _JAN_1_2018_TS, Action.READ,
         )
         assert painter.paint(file.name, file.type) == '''"File1'2"'''
 
 
 class TestGnuPainter:
-    def test_color_parsing_simple(self) -> None:
-        painter = GnuPainter("rs=1;0;1")
-        assert painter.color_indicator[GnuIndicators.RESET] == "1;0;1"
-
-        painter = GnuPainter(":rs=1;0;1")
-        assert painter.color_indicator[GnuIndicators.RESET] == "1;0;1"
-
-        painter = GnuPainter("rs=1;0;1:")
-        assert painter.color_indicator[GnuIndicators.RESET] == "1;0;1"
-
-        painter = GnuPainter("rs=1;0;1:fi=32;42")
-        assert painter.color_indicator[GnuIndicators.RESET] == "1;0;1"
-        assert painter.color_indicator[GnuIndicators.FILE] == "32;42"
-
-        painter = GnuPainter("rs=1;0;1:fi")
-        assert painter.color_indicator[GnuIndicators.RESET] == "1;0;1"
-        assert painter.color_indicator[GnuIndicators.FILE] == ""
-
-        painter = GnuPainter("rs=1;0;1:fi=")
-        assert painter.color_indicator[GnuIndicators.RESET] == "1;0;1"
-        assert painter.color_indicator[GnuIndicators.FILE] == ""
-
     @pytest.mark.parametrize(
-        "escaped,result",
+        "ls_colors,expected",
         [
-            ("\\a", "\a"),
-            ("\\b", "\b"),
-            ("\\e", chr(27)),
-            ("\\f", "\f"),
-            ("\\n", "\n"),
-            ("\\r", "\r"),
-            ("\\t", "\t"),
-            ("\\v", "\v"),
-            ("\\?", chr(127)),
-            ("\\_", " "),
-            ("a\\n", "a\n"),
-            ("a\\tb", "a\tb"),
-            ("a\\t\\rb", "a\t\rb"),
-            ("a\\=b", "a=b"),
+            ("rs=1;0;1", {GnuIndicators.RESET: "1;0;1"}),
+            (":rs=1;0;1", {GnuIndicators.RESET: "1;0;1"}),
+            ("rs=1;0;1:", {GnuIndicators.RESET: "1;0;1"}),
+            (
+                "rs=1;0;1:fi=32;42",
+                {GnuIndicators.RESET: "1;0;1", GnuIndicators.FILE: "32;42"},
+            ),
+            ("rs=1;0;1:fi", {GnuIndicators.RESET: "1;0;1", GnuIndicators.FILE: ""}),
+            ("rs=1;0;1:fi=", {GnuIndicators.RESET: "1;0;1", GnuIndicators.FILE: ""}),
         ],
     )
-    def test_color_parsing_escaped_simple(self, escaped: str, result: str) -> None:
-        painter = GnuPainter("rs=" + escaped)
+    def test_color_parsing_simple(
+        self, ls_colors: str, expected: Dict[GnuIndicators, str]
+    ) -> None:
+        painter = GnuPainter(ls_colors)
+        for indicator, value in expected.items():
+            assert painter.color_indicator[indicator] == value
+
+    @pytest.mark.parametrize("escaped,result", _ESCAPES)
+    def test_color_parsing_escaped(self, escaped: str, result: str) -> None:
+        # One painter covers the escape as an indicator value, an extension
+        # key and an extension value; the "*." prefix keeps the keys distinct
+        painter = GnuPainter(f"rs={escaped}:{escaped}=1;2:*.{escaped}={escaped}")
         assert painter.color_indicator[GnuIndicators.RESET] == result
-
-        painter = GnuPainter(escaped + "=1;2")
         assert painter.color_ext_type[result] == "1;2"
-
-        painter = GnuPainter(escaped + "=" + escaped)
-        assert painter.color_ext_type[result] == result
-
-    @pytest.mark.parametrize(
-        "escaped,result",
-        [
-            ("\\7", chr(7)),
-            ("\\8", "8"),
-            ("\\10", chr(8)),
-            ("a\\2", "a" + chr(2)),
-            ("a\\2b", "a" + chr(2) + "b"),
-        ],
-    )
-    def test_color_parsing_escaped_octal(self, escaped: str, result: str) -> None:
-        painter = GnuPainter("rs=" + escaped)
-        assert painter.color_indicator[GnuIndicators.RESET] == result
-
-        painter = GnuPainter(escaped + "=1;2")
-        assert painter.color_ext_type[result] == "1;2"
-
-        painter = GnuPainter(escaped + "=" + escaped)
-        assert painter.color_ext_type[result] == result
-
-    @pytest.mark.parametrize(
-        "escaped,result",
-        [
-            ("\\x7", chr(0x7)),
-            ("\\x8", chr(0x8)),
-            ("\\x10", chr(0x10)),
-            ("\\XaA", chr(0xAA)),
-            ("a\\x222", "a" + chr(0x22) + "2"),
-            ("a\\x2z", "a" + chr(0x2) + "z"),
-        ],
-    )
-    def test_color_parsing_escaped_hex(self, escaped: str, result: str) -> None:
-        painter = GnuPainter("rs=" + escaped)
-        assert painter.color_indicator[GnuIndicators.RESET] == result
-
-        painter = GnuPainter(escaped + "=1;2")
-        assert painter.color_ext_type[result] == "1;2"
-
-        painter = GnuPainter(escaped + "=" + escaped)
-        assert painter.color_ext_type[result] == result
-
-    @pytest.mark.parametrize(
-        "escaped,result",
-        [
-            ("^a", chr(1)),
-            ("^?", chr(127)),
-            ("^z", chr(26)),
-            ("a^Z", "a" + chr(26)),
-            ("a^Zb", "a" + chr(26) + "b"),
-        ],
-    )
-    def test_color_parsing_carret(self, escaped: str, result: str) -> None:
-        painter = GnuPainter("rs=" + escaped)
-        assert painter.color_indicator[GnuIndicators.RESET] == result
-
-        painter = GnuPainter(escaped + "=1;2")
-        assert painter.color_ext_type[result] == "1;2"
-
-        painter = GnuPainter(escaped + "=" + escaped)
-        assert painter.color_ext_type[result] == result
+        assert painter.color_ext_type["*." + result] == result
 
     @pytest.mark.parametrize("escaped", [("^1"), ("^"), ("^" + chr(130))])
     def test_color_parsing_carret_incorrect(self, escaped: str) -> None:
-        with pytest.raises(EnvironmentError):
+        with pytest.raises(ValueError):
             GnuPainter("rs=" + escaped)
 
-        with pytest.raises(EnvironmentError):
+        with pytest.raises(ValueError):
             GnuPainter(escaped + "=1;2")
 
     def test_coloring(self) -> None:
         file = FileStatus(
-            "test.txt",
-            1024,
-            FileStatusType.FILE,
-            int(time.mktime(time.strptime("2018-01-01 03:00:00", "%Y-%m-%d %H:%M:%S"))),
-            Action.READ,
+            "test.txt", 1024, FileStatusType.FILE, _JAN_1_2018_TS, Action.READ,
         )
         folder = FileStatus(
-            "tmp",
-            0,
-            FileStatusType.DIRECTORY,
-            int(time.mktime(time.strptime("2018-01-01 03:00:00", "%Y-%m-%d %H:%M:%S"))),
-            Action.WRITE,
+            "tmp", 0, FileStatusType.DIRECTORY, _JAN_1_2018_TS, Action.WRITE,
         )
         painter = GnuPainter("di=32;41:fi=0;44:no=0;46")
         assert painter.paint(file.name, file.type) == "\x1b[0;44mtest.txt\x1b[0m"
@@ -214,20 +177,34 @@ class TestGnuPainter:
         assert painter.paint(file.name, file.type) == "\x1b[0;46mtest.txt\x1b[0m"
         assert painter.paint(folder.name, folder.type) == "\x1b[01;34mtmp\x1b[0m"
 
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            ("a.gz", "\x1b[1ma.gz\x1b[0m"),
+            ("a.bz2", "\x1b[6ma.bz2\x1b[0m"),
+            ("README", "\x1b[2mREADME\x1b[0m"),
+            ("a.tar.gz", "\x1b[1ma.tar.gz\x1b[0m"),
+            ("a.tar.bz2", "\x1b[6ma.tar.bz2\x1b[0m"),
+            ("a.tat", "\x1b[4ma.tat\x1b[0m"),
+            ("a.txt", "\x1b[4ma.txt\x1b[0m"),
+            ("a.xz", "\x1b[7ma.xz\x1b[0m"),
+            ("README.md", "README.md"),
+        ],
+    )
+    def test_coloring_mixed_patterns(self, name: str, expected: str) -> None:
+        # Suffix groups and fnmatch patterns interleave, the first matching
+        # pattern wins regardless of its kind
+        painter = GnuPainter(
+            "*.gz=1:*.bz2=6:README=2:*.tar.gz=3:*.t?t=4:*.txt=5:*.xz=7:*.tar.*=8"
+        )
+        assert painter.paint(name, FileStatusType.FILE) == expected
+
     def test_coloring_underline(self) -> None:
         file = FileStatus(
-            "test.txt",
-            1024,
-            FileStatusType.FILE,
-            int(time.mktime(time.strptime("2018-01-01 03:00:00", "%Y-%m-%d %H:%M:%S"))),
-            Action.READ,
+            "test.txt", 1024, FileStatusType.FILE, _JAN_1_2018_TS, Action.READ,
         )
         folder = FileStatus(
-            "tmp",
-            0,
-            FileStatusType.DIRECTORY,
-            int(time.mktime(time.strptime("2018-01-01 03:00:00", "%Y-%m-%d %H:%M:%S"))),
-            Action.WRITE,
+            "tmp", 0, FileStatusType.DIRECTORY, _JAN_1_2018_TS, Action.WRITE,
         )
         painter = GnuPainter("di=32;41:fi=0;44:no=0;46", underline=True)
         assert painter.paint(file.name, file.type) == "\x1b[0;44m\x1b[4mtest.txt\x1b[0m"
@@ -254,141 +231,140 @@ class TestBSDPainter:
     def test_color_parsing(self) -> None:
         painter = BSDPainter("exfxcxdxbxegedabagacad")
         assert painter._colors[BSDAttributes.DIRECTORY] == "ex"
+        assert painter._colors[BSDAttributes.LINK] == "fx"
+        assert len(painter._colors) == len(BSDAttributes)
+
+    def test_color_parsing_too_short(self) -> None:
+        with pytest.raises(ValueError):
+            BSDPainter("exfxcxdxbxegedabagaca")
 
     def test_coloring(self) -> None:
         file = FileStatus(
-            "test.txt",
-            1024,
-            FileStatusType.FILE,
-            int(time.mktime(time.strptime("2018-01-01 03:00:00", "%Y-%m-%d %H:%M:%S"))),
-            Action.READ,
+            "test.txt", 1024, FileStatusType.FILE, _JAN_1_2018_TS, Action.READ,
         )
         folder = FileStatus(
-            "tmp",
-            0,
-            FileStatusType.DIRECTORY,
-            int(time.mktime(time.strptime("2018-01-01 03:00:00", "%Y-%m-%d %H:%M:%S"))),
-            Action.WRITE,
+            "tmp", 0, FileStatusType.DIRECTORY, _JAN_1_2018_TS, Action.WRITE,
         )
         painter = BSDPainter("exfxcxdxbxegedabagacad")
         assert painter.paint(file.name, file.type) == "test.txt"
-        assert painter.paint(folder.name, folder.type) == click.style("tmp", fg="blue")
+        assert painter.paint(folder.name, folder.type) == _BLUE_TMP
 
         painter = BSDPainter("Eafxcxdxbxegedabagacad")
         assert painter.paint(file.name, file.type) == "test.txt"
-        assert painter.paint(folder.name, folder.type) == click.style(
-            "tmp", fg="blue", bg="black", bold=True
-        )
+        assert painter.paint(folder.name, folder.type) == _BOLD_BLUE_ON_BLACK_TMP
 
     def test_coloring_underline(self) -> None:
         file = FileStatus(
-            "test.txt",
-            1024,
-            FileStatusType.FILE,
-            int(time.mktime(time.strptime("2018-01-01 03:00:00", "%Y-%m-%d %H:%M:%S"))),
-            Action.READ,
+            "test.txt", 1024, FileStatusType.FILE, _JAN_1_2018_TS, Action.READ,
         )
         folder = FileStatus(
-            "tmp",
-            0,
-            FileStatusType.DIRECTORY,
-            int(time.mktime(time.strptime("2018-01-01 03:00:00", "%Y-%m-%d %H:%M:%S"))),
-            Action.WRITE,
+            "tmp", 0, FileStatusType.DIRECTORY, _JAN_1_2018_TS, Action.WRITE,
         )
         painter = BSDPainter("exfxcxdxbxegedabagacad", underline=True)
-        assert painter.paint(file.name, file.type) == click.style(
-            "test.txt", underline=True
-        )
-        assert painter.paint(folder.name, folder.type) == click.style(
-            "tmp", fg="blue", underline=True
-        )
+        assert painter.paint(file.name, file.type) == _UNDERLINED_FILE
+        assert painter.paint(folder.name, folder.type) == _UNDERLINED_BLUE_TMP
 
         painter = BSDPainter("Eafxcxdxbxegedabagacad", underline=True)
-        assert painter.paint(file.name, file.type) == click.style(
-            "test.txt", underline=True
-        )
-        assert painter.paint(folder.name, folder.type) == click.style(
-            "tmp", fg="blue", bg="black", bold=True, underline=True
+        assert painter.paint(file.name, file.type) == _UNDERLINED_FILE
+        assert (
+            painter.paint(folder.name, folder.type)
+            == _UNDERLINED_BOLD_BLUE_ON_BLACK_TMP
         )
 
 
 class TestPainterFactory:
-    def test_detection(self, monkeypatch: Any) -> None:
+    @pytest.mark.parametrize(
+        "color,ls_colors,lscolors,painter_type",
+        [
+            (True, "", "", NonePainter),
+            (False, "di=32;41:fi=0;44:no=0;46", "exfxcxdxbxegedabagacad", NonePainter),
+            (True, "di=32;41:fi=0;44:no=0;46", "exfxcxdxbxegedabagacad", GnuPainter),
+            (True, "di=32;41:fi=0;44:no=0;46", "", GnuPainter),
+            (True, "", "exfxcxdxbxegedabagacad", BSDPainter),
+        ],
+    )
+    def test_detection(
+        self,
+        color: bool,
+        ls_colors: str,
+        lscolors: str,
+        painter_type: Type[BasePainter],
+    ) -> None:
+        painter = get_painter(color, ls_colors=ls_colors, lscolors=lscolors)
+        assert type(painter) is painter_type
+
+    def test_detection_from_env(self, monkeypatch: Any) -> None:
         monkeypatch.setenv("LS_COLORS", "")
-        monkeypatch.setenv("LSCOLORS", "")
-        painter = get_painter(True)
-        assert isinstance(painter, NonePainter)
-
         monkeypatch.setenv("LSCOLORS", "exfxcxdxbxegedabagacad")
-        monkeypatch.setenv("LS_COLORS", "di=32;41:fi=0;44:no=0;46")
-        painter_without_color = get_painter(False)
-        painter_with_color = get_painter(True)
-        assert isinstance(painter_without_color, NonePainter)
-        assert not isinstance(painter_with_color, NonePainter)
+        assert isinstance(get_painter(True), BSDPainter)
 
-        monkeypatch.setenv("LSCOLORS", "")
         monkeypatch.setenv("LS_COLORS", "di=32;41:fi=0;44:no=0;46")
-        painter = get_painter(True)
-        assert isinstance(painter, GnuPainter)
-
-        monkeypatch.setenv("LSCOLORS", "exfxcxdxbxegedabagacad")
-        monkeypatch.setenv("LS_COLORS", "")
-        painter = get_painter(True)
-        assert isinstance(painter, BSDPainter)
+        assert isinstance(get_painter(True), GnuPainter)
 
+    def test_painter_is_reused(self) -> None:
+        painter = get_painter(True, ls_colors="di=32;41", lscolors="")
+        assert get_painter(True, ls_colors="di=32;41", lscolors="") is painter
+        assert get_painter(True, quote=True, ls_colors="di=32;41") is not painter
 
-class TestFilesFormatter:
 
-    files = [
-        FileStatus(
-            "File1",
-            2048,
-            FileStatusType.FILE,
-            int(time.mktime(time.strptime("2018-01-01 03:00:00", "%Y-%m-%d %H:%M:%S"))),
-            Action.READ,
-        ),
+@pytest.fixture(scope="module")
+def files() -> Tuple[FileStatus, ...]:
+    return (
+        FileStatus("File1", 2048, FileStatusType.FILE, _JAN_1_2018_TS, Action.READ,),
         FileStatus(
             "File2",
             1024,
             FileStatusType.FILE,
-            int(time.mktime(time.strptime("2018-10-10 13:10:10", "%Y-%m-%d %H:%M:%S"))),
+            _timestamp("2018-10-10 13:10:10"),
             Action.READ,
         ),
         FileStatus(
             "File3 with space",
             1_024_001,
             FileStatusType.FILE,
-            int(time.mktime(time.strptime("2019-02-02 05:02:02", "%Y-%m-%d %H:%M:%S"))),
+            _timestamp("2019-02-02 05:02:02"),
             Action.READ,
         ),
-    ]
-    folders = [
+    )
+
+
+@pytest.fixture(scope="module")
+def folders() -> Tuple[FileStatus, ...]:
+    return (
         FileStatus(
             "Folder1",
             0,
             FileStatusType.DIRECTORY,
-            int(time.mktime(time.strptime("2017-03-03 06:03:03", "%Y-%m-%d %H:%M:%S"))),
+            _timestamp("2017-03-03 06:03:03"),
             Action.MANAGE,
         ),
         FileStatus(
             "1Folder with space",
             0,
             FileStatusType.DIRECTORY,
-            int(time.mktime(time.strptime("2017-03-03 06:03:02", "%Y-%m-%d %H:%M:%S"))),
+            _timestamp("2017-03-03 06:03:02"),
             Action.MANAGE,
         ),
-    ]
-    files_and_folders = files + folders
+    )
+
+
+@pytest.fixture(scope="module")
+def files_and_folders(
+    files: Tuple[FileStatus, ...], folders: Tuple[FileStatus, ...]
+) -> Tuple[FileStatus, ...]:
+    return files + folders
 
-    def test_simple_formatter(self) -> None:
+
+class TestFilesFormatter:
+    def test_simple_formatter(self, files_and_folders: Tuple[FileStatus, ...]) -> None:
         formatter = SimpleFilesFormatter(color=False)
-        assert list(formatter(self.files_and_folders)) == [
-            f"{file.name}" for file in self.files_and_folders
+        assert list(formatter(files_and_folders)) == [
+            f"{file.name}" for file in files_and_folders
         ]
 
-    def test_long_formatter(self) -> None:
+    def test_long_formatter(self, files_and_folders: Tuple[FileStatus, ...]) -> None:
         formatter = LongFilesFormatter(human_readable=False, color=False)
-        assert list(formatter(self.files_and_folders)) == [
+        assert list(formatter(files_and_folders)) == [
             "-r    2048 2018-01-01 03:00:00 File1",
             "-r    1024 2018-10-10 13:10:10 File2",
             "-r 1024001 2019-02-02 05:02:02 File3 with space",
@@ -397,7 +373,7 @@ class TestFilesFormatter:
         ]
 
         formatter = LongFilesFormatter(human_readable=True, color=False)
-        assert list(formatter(self.files_and_folders)) == [
+        assert list(formatter(files_and_folders)) == [
             "-r    2.0K 2018-01-01 03:00:00 File1",
             "-r    1.0K 2018-10-10 13:10:10 File2",
             "-r 1000.0K 2019-02-02 05:02:02 File3 with space",
@@ -405,23 +381,23 @@ class TestFilesFormatter:
             "dm       0 2017-03-03 06:03:02 1Folder with space",
         ]
 
-    def test_column_formatter(self) -> None:
+    def test_column_formatter(self, files_and_folders: Tuple[FileStatus, ...]) -> None:
         formatter = VerticalColumnsFilesFormatter(width=40, color=False)
-        assert list(formatter(self.files_and_folders)) == [
+        assert list(formatter(files_and_folders)) == [
             "File1             Folder1",
             "File2             1Folder with space",
             "File3 with space",
         ]
 
         formatter = VerticalColumnsFilesFormatter(width=36, color=False)
-        assert list(formatter(self.files_and_folders)) == [
+        assert list(formatter(files_and_folders)) == [
             "File1             Folder1",
             "File2             1Folder with space",
             "File3 with space",
         ]
 
         formatter = VerticalColumnsFilesFormatter(width=1, color=False)
-        assert list(formatter(self.files_and_folders)) == [
+        assert list(formatter(files_and_folders)) == [
             "File1",
             "File2",
             "File3 with space",
@@ -430,38 +406,51 @@ class TestFilesFormatter:
         ]
 
     @pytest.mark.parametrize(
-        "formatter",
+        "make_formatter",
         [
-            (SimpleFilesFormatter(color=False)),
-            (VerticalColumnsFilesFormatter(width=100, color=False)),
-            (LongFilesFormatter(human_readable=False, color=False)),
+            pytest.param(lambda: SimpleFilesFormatter(color=False), id="simple"),
+            pytest.param(
+                lambda: VerticalColumnsFilesFormatter(width=100, color=False),
+                id="vertical",
+            ),
+            pytest.param(
+                lambda: LongFilesFormatter(human_readable=False, color=False),
+                id="long",
+            ),
         ],
     )
-    def test_formatter_with_empty_files(self, formatter: BaseFilesFormatter) -> None:
+    def test_formatter_with_empty_files(
+        self, make_formatter: Callable[[], BaseFilesFormatter],
+    ) -> None:
         files: List[FileStatus] = []
-        assert [] == list(formatter(files))
-
-    def test_sorter(self) -> None:
+        assert [] == list(make_formatter()(files))
+
+    def test_sorter(
+        self,
+        files: Tuple[FileStatus, ...],
+        folders: Tuple[FileStatus, ...],
+        files_and_folders: Tuple[FileStatus, ...],
+    ) -> None:
         sorter = FilesSorter.NAME
-        files = sorted(self.files_and_folders, key=sorter.key())
-        assert files == [
-            self.folders[1],
-            self.files[0],
-            self.files[1],
-            self.files[2],
-            self.folders[0],
+        result = sorted(files_and_folders, key=sorter.key())
+        assert result == [
+            folders[1],
+            files[0],
+            files[1],
+            files[2],
+            folders[0],
         ]
 
         sorter = FilesSorter.SIZE
-        files = sorted(self.files_and_folders, key=sorter.key())
-        assert files[2:5] == [self.files[1], self.files[0], self.files[2]]
+        result = sorted(files_and_folders, key=sorter.key())
+        assert result[2:5] == [files[1], files[0], files[2]]
 
         sorter = FilesSorter.TIME
-        files = sorted(self.files_and_folders, key=sorter.key())
-        assert files == [
-            self.folders[1],
-            self.folders[0],
-            self.files[0],
-            self.files[1],
-            self.files[2],
+        result = sorted(files_and_folders, key=sorter.key())
+        assert result == [
+            folders[1],
+            folders[0],
+            files[0],
+            files[1],
+            files[2],
         ]
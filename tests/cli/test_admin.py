@@ -1,7 +1,9 @@
-from typing import Callable, List
+from pathlib import Path
+from typing import Any, Callable, Dict, List
 from unittest import mock
 
 from neuromation.api.admin import _Admin, _ClusterUser, _ClusterUserRoleType
+from neuromation.cli.admin import _read_aws_profile
 
 from .conftest import SysCapWithCode
 
@@ -48,3 +50,57 @@ def test_remove_cluster_user_print_result(run_cli: _RunCli) -> None:
         capture = run_cli(["-q", "admin", "remove-cluster-user", "default", "ivan"])
         assert not capture.err
         assert not capture.out
+
+
+def test_add_cluster_parses_yaml_config(run_cli: _RunCli, tmp_path: Path) -> None:
+    config = tmp_path / "cluster.yml"
+    config.write_text("type: aws\nzones:\n- us-east-1a\n- us-east-1b\n")
+    with mock.patch.object(_Admin, "add_cluster") as mocked:
+
+        async def add_cluster(cluster_name: str, config: Dict[str, Any]) -> None:
+            assert cluster_name == "default"
+            assert config == {"type": "aws", "zones": ["us-east-1a", "us-east-1b"]}
+
+        mocked.side_effect = add_cluster
+        capture = run_cli(["-q", "admin", "add-cluster", "default", str(config)])
+        assert not capture.err
+        assert not capture.out
+        assert mocked.call_count == 1
+
+
+def test_read_aws_profile(tmp_path: Path) -> None:
+    path = tmp_path / "credentials"
+    path.write_text(
+        "# comment\n"
+        "[default]\n"
+        "aws_access_key_id = key\n"
+        "; comment\n"
+        "aws_secret_access_key = secret\n"
+        "\n"
+        "[other]\n"
+        "aws_access_key_id=other-key\n"
+    )
+    mtime = path.stat().st_mtime
+    assert _read_aws_profile(str(path), mtime, "default") == ("key", "secret")
+    assert _read_aws_profile(str(path), mtime, "other") == ("other-key", None)
+    assert _read_aws_profile(str(path), mtime, "missing") == (None, None)
+
+
+def test_read_aws_profile_inherits_defaults(tmp_path: Path) -> None:
+    path = tmp_path / "credentials"
+    path.write_text(
+        "[DEFAULT]\n"
+        "aws_access_key_id = default-key\n"
+        "aws_secret_access_key: default-secret\n"
+        "[other]\n"
+        "aws_secret_access_key = other-secret\n"
+    )
+    mtime = path.stat().st_mtime
+    assert _read_aws_profile(str(path), mtime, "other") == (
+        "default-key",
+        "other-secret",
+    )
+    assert _read_aws_profile(str(path), mtime, "DEFAULT") == (
+        "default-key",
+        "default-secret",
+    )
@@ -44,6 +44,42 @@ def test_print() -> None:
     )
 
 
+def test_print_after_add_command() -> None:
+    @group(cls=MainGroup)
+    def main() -> None:
+        pass
+
+    @command()
+    async def plain_cmd(root: Root) -> None:
+        pass
+
+    @command()
+    async def other_cmd(root: Root) -> None:
+        pass
+
+    main.add_command(plain_cmd)
+    main.skip_init = True
+
+    runner = CliRunner()
+    result = runner.invoke(main, [])
+    assert result.exit_code == 0
+    assert "plain-cmd" in result.output
+    assert "other-cmd" not in result.output
+
+    main.add_command(other_cmd)
+    result = runner.invoke(main, [])
+    assert result.exit_code == 0
+    assert "plain-cmd" in result.output
+    assert "other-cmd" in result.output
+
+    # edits bypassing add_command() are picked up by the next render as well
+    del main.commands["plain-cmd"]
+    result = runner.invoke(main, [])
+    assert result.exit_code == 0
+    assert "plain-cmd" not in result.output
+    assert "other-cmd" in result.output
+
+
 def test_print_use_group_helpers() -> None:
     @group(cls=MainGroup)
     def main() -> None:
@@ -7,12 +7,11 @@ from pathlib import Path
 from typing import Any, Callable, List
 
 import pytest
-from yarl import URL
 
-from neuromation.api import CONFIG_ENV_NAME, Config
+from neuromation.api import CONFIG_ENV_NAME
+from neuromation.api.config import _load
 from neuromation.cli.const import EX_OK
 from neuromation.cli.docker_credential_helper import main as dch
-from neuromation.cli.root import Root
 
 
 SysCapWithCode = namedtuple("SysCapWithCode", ["out", "err", "code"])
@@ -23,8 +22,12 @@ _RunCli = Callable[[List[str]], SysCapWithCode]
 
 
 @pytest.fixture()
-def config(root: Root) -> Config:
-    return root.client.config
+def registry_host(nmrc_path: Path) -> str:
+    # Read the saved config directly, a full client is not needed here
+    config = _load(nmrc_path)
+    host = config.clusters[config.cluster_name].registry_url.host
+    assert host is not None
+    return host
 
 
 _RunDch = Callable[[List[str]], SysCapWithCode]
@@ -66,7 +69,7 @@ class TestCli:
         assert captured.err
 
     def test_path_from_env(
-        self, run_cli: _RunCli, tmp_path: Path, monkeypatch: Any, config: Config
+        self, run_cli: _RunCli, tmp_path: Path, monkeypatch: Any, registry_host: str
     ) -> None:
         json_path = tmp_path / "config.json"
         with json_path.open("w") as file:
@@ -77,10 +80,11 @@ class TestCli:
         assert json_path.is_file()
         with json_path.open("rb") as fp:
             payload = json.load(fp)
-        registry = URL(config.clusters[config.cluster_name].registry_url).host
-        assert payload["credHelpers"] == {registry: "neuro"}
+        assert payload["credHelpers"] == {registry_host: "neuro"}
 
-    def test_new_file(self, run_cli: _RunCli, tmp_path: Path, config: Config) -> None:
+    def test_new_file(
+        self, run_cli: _RunCli, tmp_path: Path, registry_host: str
+    ) -> None:
         path = tmp_path / ".docker"
         json_path = path / "config.json"
         capture = run_cli(["config", "docker", "--docker-config", str(path)])
@@ -88,11 +92,10 @@ class TestCli:
         assert json_path.is_file()
         with json_path.open("rb") as fp:
             payload = json.load(fp)
-        registry = URL(config.clusters[config.cluster_name].registry_url).host
-        assert payload["credHelpers"] == {registry: "neuro"}
+        assert payload["credHelpers"] == {registry_host: "neuro"}
 
     def test_merge_file_without_helpers(
-        self, run_cli: _RunCli, tmp_path: Path, config: Config
+        self, run_cli: _RunCli, tmp_path: Path, registry_host: str
     ) -> None:
         path = tmp_path / ".docker"
         path.mkdir()
@@ -104,12 +107,11 @@ class TestCli:
         assert json_path.is_file()
         with json_path.open("rb") as fp2:
             payload = json.load(fp2)
-        registry = URL(config.clusters[config.cluster_name].registry_url).host
-        assert payload["credHelpers"] == {registry: "neuro"}
+        assert payload["credHelpers"] == {registry_host: "neuro"}
         assert payload["test"] == "value\u20ac"
 
     def test_merge_file_with_existing_helpers(
-        self, run_cli: _RunCli, tmp_path: Path, config: Config
+        self, run_cli: _RunCli, tmp_path: Path, registry_host: str
     ) -> None:
         path = tmp_path / ".docker"
         path.mkdir()
@@ -123,19 +125,48 @@ class TestCli:
         assert json_path.is_file()
         with json_path.open("rb") as fp2:
             payload = json.load(fp2)
-        registry = URL(config.clusters[config.cluster_name].registry_url).host
-        assert payload["credHelpers"] == {registry: "neuro", "some.com": "handler"}
+        assert payload["credHelpers"] == {registry_host: "neuro", "some.com": "handler"}
         assert payload["test"] == "value\u20ac"
 
+    @pytest.mark.parametrize("dumps_module", ["json", "orjson"])
+    def test_writer_backends(
+        self,
+        run_cli: _RunCli,
+        tmp_path: Path,
+        monkeypatch: Any,
+        registry_host: str,
+        dumps_module: str,
+    ) -> None:
+        if dumps_module == "orjson":
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr("neuromation.cli.config.orjson", None)
+        path = tmp_path / ".docker"
+        path.mkdir()
+        json_path = path / "config.json"
+        with json_path.open("w", encoding="utf-8") as fp:
+            json.dump({"test": "value€", "auths": {}}, fp)
+        capture = run_cli(["config", "docker", "--docker-config", str(path)])
+        assert not capture.err
+        expected = {
+            "test": "value€",
+            "auths": {},
+            "credHelpers": {registry_host: "neuro"},
+        }
+        # Both writers produce the same bytes
+        assert json_path.read_bytes() == json.dumps(
+            expected, indent=2, ensure_ascii=False
+        ).encode("utf-8")
+
     def test_success_output_message(
-        self, run_cli: _RunCli, tmp_path: Path, config: Config
+        self, run_cli: _RunCli, tmp_path: Path, registry_host: str
     ) -> None:
         path = tmp_path / ".docker"
         json_path = path / "config.json"
         capture = run_cli(["config", "docker", "--docker-config", str(path)])
         assert not capture.err
         assert str(json_path) in capture.out
-        assert config.clusters[config.cluster_name].registry_url.host in capture.out
+        assert registry_host in capture.out
 
 
 class TestHelper:
@@ -156,11 +187,9 @@ class TestHelper:
         assert capture.code != EX_OK
 
     def test_get_operation(
-        self, run_dch: _RunDch, monkeypatch: Any, config: Config, token: str
+        self, run_dch: _RunDch, monkeypatch: Any, registry_host: str, token: str
     ) -> None:
-        registry = config.clusters[config.cluster_name].registry_url.host
-        assert registry is not None
-        monkeypatch.setattr("sys.stdin", io.StringIO(registry))
+        monkeypatch.setattr("sys.stdin", io.StringIO(registry_host))
         capture = run_dch(["get"])
         assert capture.code == EX_OK
         payload = json.loads(capture.out)
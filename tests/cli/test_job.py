@@ -1,13 +1,15 @@
 import logging
 from datetime import timedelta
 from pathlib import Path
-from typing import Any, Callable, Tuple
+from typing import Any, Callable, List, Tuple
+from unittest import mock
 
 import click
 import pytest
 import toml
 
 from neuromation.api import Client, JobStatus
+from neuromation.api.jobs import Jobs
 from neuromation.cli.job import (
     DEFAULT_JOB_LIFE_SPAN,
     NEUROMATION_ROOT_ENV_VAR,
@@ -20,11 +22,14 @@ from neuromation.cli.job import (
 )
 from neuromation.cli.parse_utils import COLUMNS_MAP, get_default_columns
 
+from .conftest import SysCapWithCode
+
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 _MakeClient = Callable[..., Client]
+_RunCli = Callable[[List[str]], SysCapWithCode]
 
 
 @pytest.mark.parametrize("statuses", [("all",), ("all", "failed", "succeeded")])
@@ -295,3 +300,23 @@ def test_parse_cmd_single() -> None:
 def test_parse_cmd_multiple() -> None:
     cmd = ["bash", "-c", "ls -l && pwd"]
     assert _parse_cmd(cmd) == "bash -c 'ls -l && pwd'"
+
+
+def test_kill_reports_unresolved_job(run_cli: _RunCli) -> None:
+    job_1 = "job-0f5e7d4c-3b2a-4c1d-8e9f-0a1b2c3d4e5f"
+    job_2 = "job-1a2b3c4d-5e6f-4a7b-8c9d-0e1f2a3b4c5d"
+    bad_uri = "job://other-cluster/user/job-name"
+    killed = []
+
+    async def kill(job_id: str) -> None:
+        killed.append(job_id)
+
+    with mock.patch.object(Jobs, "kill", side_effect=kill):
+        capture = run_cli(["job", "kill", job_1, bad_uri, job_2])
+
+    assert killed == [job_1, job_2]
+    assert capture.out.splitlines() == [job_1, job_2]
+    assert capture.err == (
+        f"Cannot kill job {bad_uri}: Invalid job URI: cluster_name != 'default'"
+    )
+    assert capture.code == 1
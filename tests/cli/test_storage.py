@@ -1,13 +1,20 @@
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, AsyncIterator, Callable, List
+from unittest import mock
 
+import pytest
 import toml
+from yarl import URL
 
-from neuromation.api import Client
+from neuromation.api import Action, Client, FileStatus, FileStatusType
+from neuromation.api.storage import Storage
 from neuromation.cli.storage import calc_filters, calc_ignore_file_names
 
+from .conftest import SysCapWithCode
+
 
 _MakeClient = Callable[..., Client]
+_RunCli = Callable[[List[str]], SysCapWithCode]
 
 
 async def test_calc_filters_section_doesnt_exist(
@@ -82,3 +89,24 @@ async def test_calc_ignore_file_names_user_spec(
             )
         )
         assert await calc_ignore_file_names(client, None) == [".gitignore", ".hgignore"]
+
+
+@pytest.mark.parametrize(
+    "env_name,env_value", [("LS_COLORS", "rs=^1"), ("LSCOLORS", "exfx")]
+)
+def test_ls_malformed_color_scheme(
+    run_cli: _RunCli, monkeypatch: Any, env_name: str, env_value: str
+) -> None:
+    async def ls(uri: URL) -> AsyncIterator[FileStatus]:
+        yield FileStatus("file.txt", 1024, FileStatusType.FILE, 0, Action.READ)
+
+    monkeypatch.delenv("LS_COLORS", raising=False)
+    monkeypatch.delenv("LSCOLORS", raising=False)
+    monkeypatch.setenv(env_name, env_value)
+    with mock.patch.object(Storage, "ls", side_effect=ls):
+        capture = run_cli(["--color=yes", "storage", "ls"])
+
+    assert capture.code == 127
+    # run_cli passes --show-traceback, the message is the first line
+    assert capture.err.splitlines()[0] == "ERROR: Cannot parse coloring scheme"
+    assert capture.out == ""
@@ -2,6 +2,7 @@ from pathlib import Path
 from typing import Any, Callable, Dict, NoReturn
 from unittest import mock
 
+import click
 import pytest
 from aiohttp import web
 from yarl import URL
@@ -9,11 +10,14 @@ from yarl import URL
 from neuromation.api import Action, Client, JobStatus
 from neuromation.cli.root import Root
 from neuromation.cli.utils import (
+    Command,
     pager_maybe,
     parse_file_resource,
     parse_permission_action,
     parse_resource_for_sharing,
     resolve_job,
+    resolve_jobs,
+    split_examples,
 )
 from tests import _TestServerFactory
 
@@ -387,6 +391,45 @@ async def test_resolve_job_id__from_uri__missing_job_id_2(
             await resolve_job(uri, client=client, status={JobStatus.RUNNING})
 
 
+async def test_resolve_jobs(
+    aiohttp_server: _TestServerFactory, make_client: _MakeClient
+) -> None:
+    job_id = "job-81839be3-3ecf-4ec5-80d9-19b1588869db"
+
+    async def handler(request: web.Request) -> web.Response:
+        name = request.query["name"]
+        if name == "unknown-name":
+            return web.json_response({"jobs": []})
+        return web.json_response({"jobs": [_job_entry(f"job-id-of-{name}")]})
+
+    app = web.Application()
+    app.router.add_get("/jobs", handler)
+
+    srv = await aiohttp_server(app)
+
+    async with make_client(srv.make_url("/")) as client:
+        resolved = await resolve_jobs(
+            [
+                "job-name-1",
+                job_id,
+                "unknown-name",
+                "job://other-cluster/user/job-name",
+                "job:job-name-2",
+            ],
+            client=client,
+            status={JobStatus.RUNNING},
+        )
+        error = resolved.pop(3)
+        assert isinstance(error, ValueError)
+        assert str(error) == "Invalid job URI: cluster_name != 'default'"
+        assert resolved == [
+            "job-id-of-job-name-1",
+            job_id,
+            "unknown-name",
+            "job-id-of-job-name-2",
+        ]
+
+
 def test_parse_file_resource_no_scheme(root: Root) -> None:
     parsed = parse_file_resource("scheme-less/resource", root)
     assert parsed == URL((Path.cwd() / "scheme-less/resource").as_uri())
@@ -482,6 +525,13 @@ def test_parse_resource_for_sharing_with_tilde_relative(root: Root) -> None:
         parse_resource_for_sharing(f"storage:~/resource", root)
 
 
+def test_parse_resource_for_sharing_is_cached(root: Root) -> None:
+    uri = "storage:resource"
+    assert parse_resource_for_sharing(uri, root) is parse_resource_for_sharing(
+        uri, root
+    )
+
+
 def test_parse_permission_action_read_lowercase() -> None:
     action = "read"
     assert parse_permission_action(action) == Action.READ
@@ -585,3 +635,33 @@ def test_pager_maybe_terminal_smaller() -> None:
         mock_echo_via_pager.assert_called_once()
         lines_it = mock_echo_via_pager.call_args[0][0]
         assert "".join(lines_it) == "\n".join(large_input[1:])
+
+
+def test_split_examples() -> None:
+    help = "Help text.\n\nExamples:\nneuro ps\n\nexamples:\nneuro ls\n"
+    assert split_examples(help) == ["Help text.\n\n", "neuro ps\n\n", "neuro ls\n"]
+
+
+def test_split_examples_no_examples() -> None:
+    assert split_examples("Help text.") == ["Help text."]
+
+
+def test_command_help_is_parsed_once() -> None:
+    async def callback(root: Root) -> None:
+        pass
+
+    cmd = Command(
+        name="cmd", callback=callback, help="Help.\n\nExamples:\n\nneuro ls\n"
+    )
+    ctx = click.Context(cmd)
+    with mock.patch(
+        "neuromation.cli.utils.split_examples", wraps=split_examples
+    ) as split:
+        first = cmd.get_help(ctx)
+        second = cmd.get_help(ctx)
+    assert first == second
+    assert "neuro ls" in first
+    split.assert_called_once()
+
+    cmd.help = "Other help."
+    assert "Other help." in cmd.get_help(ctx)